@@ -32,6 +32,7 @@ tar -czf "$BACKUP_DIR/config_$DATE.tar.gz" -C "$APP_DIR" \
     .env \
     docker-compose.yml \
     requirements.txt \
+    requirements-serving.txt \
     Dockerfile \
     2>/dev/null
 
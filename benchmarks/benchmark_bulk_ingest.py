@@ -0,0 +1,99 @@
+"""
+Benchmark bulk document ingest against one-at-a-time ingest.
+
+Writes ``--files`` small text documents, then ingests them twice into fresh
+pipelines:
+
+- one ``add_document`` call per file (what looping over POST /documents does)
+- one ``add_documents`` call (what POST /documents/bulk does)
+
+The fake embedder sleeps ``--call-ms`` per call plus ``--text-ms`` per text,
+roughly the shape of a real model's cost, so batching effects are visible
+without downloading one.
+
+Usage:
+    python benchmarks/benchmark_bulk_ingest.py [--files 200] [--call-ms 20] [--text-ms 1]
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+CALL_SECONDS = 0.02
+TEXT_SECONDS = 0.001
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        time.sleep(CALL_SECONDS + TEXT_SECONDS * len(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def write_files(directory: str, count: int):
+    files = []
+    for i in range(count):
+        path = os.path.join(directory, f"doc{i}.txt")
+        with open(path, "w") as file:
+            file.write("\n\n".join(f"Document {i}, paragraph {p}. " + "lorem ipsum dolor sit amet " * 25 for p in range(6)))
+        files.append({"file_path": path, "filename": f"doc{i}.txt"})
+    return files
+
+
+def fresh_pipeline(rag_module, name: str):
+    os.chdir(tempfile.mkdtemp(prefix=f"bulk-bench-{name}-"))
+    return rag_module.RAGPipeline()
+
+
+async def main():
+    global CALL_SECONDS, TEXT_SECONDS
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--call-ms", type=float, default=20)
+    parser.add_argument("--text-ms", type=float, default=1)
+    args = parser.parse_args()
+    CALL_SECONDS = args.call_ms / 1000
+    TEXT_SECONDS = args.text_ms / 1000
+
+    from core import rag_pipeline as rag_module
+    rag_module.HuggingFaceEmbeddings = FakeEmbeddings
+    files = write_files(tempfile.mkdtemp(prefix="bulk-bench-files-"), args.files)
+
+    print("📊 Bulk Ingest Benchmark")
+    print("=" * 50)
+
+    rag = fresh_pipeline(rag_module, "single")
+    start = time.perf_counter()
+    for file in files:
+        await rag.add_document(file["file_path"], file["filename"])
+    single = time.perf_counter() - start
+    print(f"   🐢 One file per call: {args.files / single:7.1f} files/s ({rag.collection.count():,} chunks, {single:.1f}s)")
+
+    rag = fresh_pipeline(rag_module, "bulk")
+    start = time.perf_counter()
+    outcomes = await rag.add_documents(files)
+    bulk = time.perf_counter() - start
+    added = sum(1 for outcome in outcomes if outcome["status"] == "added")
+    print(f"   🚀 Bulk ingest:       {args.files / bulk:7.1f} files/s ({rag.collection.count():,} chunks, {bulk:.1f}s)")
+    print(f"   ✅ {added}/{args.files} added, {single / bulk:.1f}x faster")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""
+Benchmark per-chunk vs batched embedding on a large synthetic document.
+
+Usage:
+    python benchmarks/benchmark_embedding.py [--pages 300] [--batch-size 64]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+
+def build_synthetic_document(pages: int) -> str:
+    """Build text roughly the size of a ``pages``-page PDF (~3000 chars/page)."""
+    paragraph = (
+        "The quarterly review covered latency budgets, ingestion throughput, "
+        "retrieval quality and the rollout plan for the transcription service. "
+    )
+    return "\n\n".join(
+        f"Page {page} section {section}. " + paragraph * 4
+        for page in range(pages)
+        for section in range(6)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="embedding-bench-")
+    os.chdir(workdir)
+
+    from core.rag_pipeline import RAGPipeline
+
+    print("📊 Embedding Benchmark")
+    print("=" * 50)
+
+    rag = RAGPipeline()
+    rag.embedding_batch_size = args.batch_size
+    rag.embeddings.encode_kwargs["batch_size"] = args.batch_size
+
+    text = build_synthetic_document(args.pages)
+    chunks = [doc.page_content for doc in rag.text_splitter.create_documents([text])]
+    print(f"   📄 Pages: {args.pages}")
+    print(f"   🧩 Chunks: {len(chunks)}")
+
+    # Warm up the model so neither run pays the load cost
+    rag.embeddings.embed_documents(chunks[:8])
+
+    start = time.perf_counter()
+    for chunk in chunks:
+        rag.embeddings.embed_query(chunk)
+    per_chunk_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rag._embed_texts(chunks)
+    batched_seconds = time.perf_counter() - start
+
+    print(f"   🐢 Per-chunk embed_query: {len(chunks) / per_chunk_seconds:,.1f} chunks/sec")
+    print(f"   🚀 Batched (size {args.batch_size}): {len(chunks) / batched_seconds:,.1f} chunks/sec")
+    print(f"   📈 Speedup: {per_chunk_seconds / batched_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
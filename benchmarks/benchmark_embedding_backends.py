@@ -0,0 +1,142 @@
+"""
+Benchmark the torch (fp32) and ONNX Runtime (int8) embedding backends.
+
+Each backend runs in its own process so memory figures do not mix. For each
+one the benchmark reports model load time, resident memory after loading and
+at peak, and embeddings/sec over the chunks of a synthetic document. It then
+compares the two: cosine similarity between the int8 and fp32 embedding of
+each chunk, and how often both pick the same nearest chunk for a query.
+
+Usage:
+    python benchmarks/benchmark_embedding_backends.py [--pages 50] [--batch-size 64]
+        [--backends huggingface,onnx]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def build_chunks(pages: int):
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+    from benchmark_embedding import build_synthetic_document
+
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+    chunks = splitter.split_text(build_synthetic_document(pages))
+    # Vary the chunks so nearest-neighbour agreement means something
+    topics = ["latency", "invoices", "hiring", "backups", "shipping", "refunds", "security", "pricing"]
+    return [f"{topics[i % len(topics)]} {i}: {chunk}" for i, chunk in enumerate(chunks)]
+
+
+def run_backend(backend: str, pages: int, batch_size: int):
+    """Measure one backend in this process and print the results as JSON."""
+    from core.config import config
+
+    chunks = build_chunks(pages)
+    queries = [" ".join(chunk.split()[:12]) for chunk in chunks[::max(1, len(chunks) // 32)]]
+    baseline = rss_mb()
+
+    start = time.perf_counter()
+    if backend == "onnx":
+        from core.embeddings import OnnxEmbeddings
+        embeddings = OnnxEmbeddings.load(batch_size=batch_size)
+    else:
+        from langchain_community.embeddings import HuggingFaceEmbeddings
+        embeddings = HuggingFaceEmbeddings(
+            model_name=config.EMBEDDING_MODEL,
+            model_kwargs={'device': 'cpu'},
+            encode_kwargs={'batch_size': batch_size}
+        )
+    embeddings.embed_query("warm-up")
+    load_seconds = time.perf_counter() - start
+    loaded = rss_mb()
+
+    start = time.perf_counter()
+    vectors = embeddings.embed_documents(chunks)
+    embed_seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "load_seconds": load_seconds,
+        "rss_baseline_mb": baseline,
+        "rss_loaded_mb": loaded,
+        "rss_peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "chunks": len(chunks),
+        "per_second": len(chunks) / embed_seconds,
+        "vectors": vectors,
+        "queries": [embeddings.embed_query(query) for query in queries]
+    }))
+
+
+def normalized(vectors) -> np.ndarray:
+    array = np.array(vectors, dtype=np.float32)
+    return array / np.linalg.norm(array, axis=1, keepdims=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--backends", default="huggingface,onnx")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_backend(args.child, args.pages, args.batch_size)
+        return
+
+    print("📊 Embedding Backend Benchmark")
+    print("=" * 50)
+
+    results = {}
+    for backend in args.backends.split(","):
+        child = subprocess.run(
+            [sys.executable, __file__, "--child", backend, "--pages", str(args.pages),
+             "--batch-size", str(args.batch_size)],
+            capture_output=True, text=True
+        )
+        if child.returncode:
+            error = child.stderr.strip().splitlines()[-1] if child.stderr.strip() else "unknown error"
+            print(f"   ❌ {backend}: {error}")
+            continue
+        result = json.loads(child.stdout.strip().splitlines()[-1])
+        results[backend] = result
+        print(f"   🧠 {backend}")
+        print(f"      Load:   {result['load_seconds']:.1f}s")
+        print(f"      RSS:    {result['rss_loaded_mb'] - result['rss_baseline_mb']:.0f} MB for the model, "
+              f"{result['rss_peak_mb']:.0f} MB peak")
+        print(f"      Speed:  {result['per_second']:,.1f} embeddings/sec ({result['chunks']} chunks)")
+
+    if len(results) == 2:
+        reference, quantized = (results[name] for name in ("huggingface", "onnx"))
+        cosine = np.sum(normalized(reference["vectors"]) * normalized(quantized["vectors"]), axis=1)
+        corpus = {name: normalized(result["vectors"]) for name, result in results.items()}
+        nearest = {
+            name: np.argmax(normalized(result["queries"]) @ corpus[name].T, axis=1)
+            for name, result in results.items()
+        }
+        agreement = float(np.mean(nearest["huggingface"] == nearest["onnx"]))
+        print(f"   🎯 int8 vs fp32 cosine: mean {cosine.mean():.4f}, min {cosine.min():.4f}")
+        print(f"   🎯 Same nearest chunk for {agreement:.0%} of {len(reference['queries'])} queries")
+        print(f"   🚀 Speedup: {quantized['per_second'] / reference['per_second']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
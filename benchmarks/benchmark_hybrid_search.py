@@ -0,0 +1,178 @@
+"""
+Benchmark the BM25 keyword index and hybrid retrieval.
+
+Builds a ``BM25Index`` over ``--chunks`` synthetic chunks (``--words`` words
+each, drawn from a Zipf-distributed vocabulary like natural text) and reports:
+
+- indexing throughput, in ingest-sized batches of ``INGEST_BATCH_SIZE``
+- load time when the index is reopened from disk
+- query latency for 2-6 term questions
+- latency of an incremental add and delete of one batch
+
+then times ``RAGPipeline._retrieve`` vector-only and hybrid over the first
+``--pipeline-chunks`` chunks (hash embeddings, so only the search cost shows).
+
+Usage:
+    python benchmarks/benchmark_hybrid_search.py [--chunks 100000] [--words 150]
+        [--queries 200] [--pipeline-chunks 10000]
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:16]]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def make_vocabulary(size: int, rng) -> np.ndarray:
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    return np.array(["".join(rng.choice(letters, size=rng.integers(3, 10))) for _ in range(size)])
+
+
+def make_chunks(count: int, words: int, vocabulary: np.ndarray, rng):
+    for _ in range(count):
+        ranks = np.minimum(rng.zipf(1.2, size=words), len(vocabulary)) - 1
+        yield " ".join(vocabulary[ranks])
+
+
+def percentiles(latencies):
+    ordered = sorted(latencies)
+    return (
+        statistics.median(ordered) * 1000,
+        ordered[int(len(ordered) * 0.95) - 1] * 1000,
+        ordered[-1] * 1000
+    )
+
+
+def max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def time_retrieve(pipeline, questions):
+    latencies = []
+    for question in questions:
+        start = time.perf_counter()
+        await pipeline._retrieve(question, top_k=5)
+        latencies.append(time.perf_counter() - start)
+    return percentiles(latencies)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--words", type=int, default=150)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--pipeline-chunks", type=int, default=10_000)
+    args = parser.parse_args()
+
+    from core.bm25 import BM25Index
+    from core.config import config
+
+    rng = np.random.default_rng(0)
+    vocabulary = make_vocabulary(30_000, rng)
+    workdir = tempfile.mkdtemp(prefix="hybrid-bench-")
+    path = os.path.join(workdir, "bm25.sqlite3")
+    batch_size = config.INGEST_BATCH_SIZE
+
+    print("📊 Hybrid Search Benchmark")
+    print("=" * 50)
+    print(f"   📄 {args.chunks:,} chunks of {args.words} words, {len(vocabulary):,}-word vocabulary")
+
+    rss_before = max_rss_mb()
+    index = BM25Index(path)
+    texts = []
+    start = time.perf_counter()
+    for i, text in enumerate(make_chunks(args.chunks, args.words, vocabulary, rng)):
+        texts.append(text)
+        if len(texts) == batch_size:
+            index.add([f"chunk{i - batch_size + 1 + j}" for j in range(batch_size)], texts)
+            texts = []
+    if texts:
+        index.add([f"chunk{args.chunks - len(texts) + j}" for j in range(len(texts))], texts)
+    build_seconds = time.perf_counter() - start
+    print(f"   🏗️  Indexed in {build_seconds:.1f}s ({args.chunks / build_seconds:,.0f} chunks/s, "
+          f"generation included), {index.stats()['terms']:,} terms")
+    print(f"   💾 {os.path.getsize(path) / 1e6:.0f} MB on disk, ≈{max_rss_mb() - rss_before:.0f} MB peak RSS growth")
+    index.close()
+
+    start = time.perf_counter()
+    index = BM25Index(path)
+    print(f"   📂 Reopened in {time.perf_counter() - start:.2f}s")
+
+    # Mix frequent and rare vocabulary, as real questions do
+    questions = [
+        " ".join(vocabulary[np.minimum(rng.zipf(1.2, size=rng.integers(2, 7)), len(vocabulary)) - 1])
+        for _ in range(args.queries)
+    ]
+    latencies = []
+    for question in questions:
+        start = time.perf_counter()
+        index.search(question, 20)
+        latencies.append(time.perf_counter() - start)
+    p50, p95, worst = percentiles(latencies)
+    print(f"   🔎 BM25 top-20: {p50:.1f} ms p50, {p95:.1f} ms p95, {worst:.1f} ms max")
+
+    batch_ids = [f"extra{i}" for i in range(batch_size)]
+    batch_texts = list(make_chunks(batch_size, args.words, vocabulary, rng))
+    start = time.perf_counter()
+    index.add(batch_ids, batch_texts)
+    add_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    index.remove(batch_ids)
+    remove_ms = (time.perf_counter() - start) * 1000
+    print(f"   ✏️  Add {batch_size} chunks: {add_ms:.0f} ms, delete them: {remove_ms:.0f} ms")
+    index.close()
+
+    # End to end: ChromaDB query alone vs fused with BM25
+    from core import rag_pipeline as rag_module
+    rag_module.HuggingFaceEmbeddings = FakeEmbeddings
+    os.chdir(workdir)
+    pipeline = rag_module.RAGPipeline()
+    chunk_texts = list(make_chunks(args.pipeline_chunks, args.words, vocabulary, np.random.default_rng(1)))
+    for start in range(0, len(chunk_texts), batch_size):
+        batch = chunk_texts[start:start + batch_size]
+        ids = [f"chunk{start + i}" for i in range(len(batch))]
+        pipeline.collection.add(
+            ids=ids,
+            documents=batch,
+            embeddings=pipeline.embeddings.embed_documents(batch),
+            metadatas=[{"filename": f"doc{start + i}.txt", "chunk_index": 0} for i in range(len(batch))]
+        )
+        pipeline.bm25.add(ids, batch)
+    pipeline.query_cache_size = 0
+
+    hybrid = await time_retrieve(pipeline, questions)
+    pipeline.bm25 = None
+    vector_only = await time_retrieve(pipeline, questions)
+    print(f"   ⚖️  _retrieve over {args.pipeline_chunks:,} chunks (top_k=5):")
+    print(f"      Vector only: {vector_only[0]:.1f} ms p50, {vector_only[1]:.1f} ms p95")
+    print(f"      Hybrid:      {hybrid[0]:.1f} ms p50, {hybrid[1]:.1f} ms p95")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
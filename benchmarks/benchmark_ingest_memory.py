@@ -0,0 +1,144 @@
+"""
+Benchmark peak memory of document ingest on synthetic PDFs.
+
+Builds PDFs of increasing page count (up to ``--pages``, 1,000 by default)
+and measures the tracemalloc peak of:
+
+- the previous whole-document path: concatenate every page into one string,
+  split it in one go, embed every chunk and insert them with one call
+- the streaming ``add_document`` path: page-by-page extraction, incremental
+  splitting and batched embed/insert
+
+Fake 384-d embeddings are used, so only extraction, splitting and storage
+cost is measured.
+
+Usage:
+    python benchmarks/benchmark_ingest_memory.py [--pages 1000] [--words-per-page 400]
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+import PyPDF2
+
+DIMENSIONS = 384
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [digest[i % 16] / 255.0 for i in range(DIMENSIONS)]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def build_pdf(path: str, pages: int, words_per_page: int):
+    """Write a PDF with one text line of ``words_per_page`` words per page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    ]
+    kids = []
+    for page in range(pages):
+        text = " ".join(f"p{page}w{word}" for word in range(words_per_page))
+        stream = f"BT /F1 10 Tf 50 750 Td ({text}) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+    with open(path, "wb") as file:
+        offsets = []
+        file.write(b"%PDF-1.4\n")
+        for number, body in enumerate(objects, start=1):
+            offsets.append(file.tell())
+            file.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+        xref = file.tell()
+        file.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        file.write(b"".join(b"%010d 00000 n \n" % offset for offset in offsets))
+        file.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+
+
+def whole_document_ingest(rag, path: str):
+    """The ingest path before streaming: everything in memory at once."""
+    text = ""
+    with open(path, 'rb') as file:
+        for page in PyPDF2.PdfReader(file).pages:
+            text += page.extract_text() + "\n"
+    documents = rag.text_splitter.create_documents([text])
+    texts = [doc.page_content for doc in documents]
+    doc_id = str(uuid.uuid4())
+    rag.collection.add(
+        ids=[f"{doc_id}_chunk_{i}" for i in range(len(texts))],
+        documents=texts,
+        embeddings=rag._embed_texts(texts),
+        metadatas=[{"document_id": doc_id, "chunk_index": i} for i in range(len(texts))]
+    )
+    return len(texts)
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak / 1024 / 1024, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--words-per-page", type=int, default=400)
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp(prefix="ingest-memory-bench-"))
+    from core import rag_pipeline as rag_module
+    rag_module.HuggingFaceEmbeddings = FakeEmbeddings
+    rag = rag_module.RAGPipeline()
+
+    print("📊 Ingest Memory Benchmark")
+    print("=" * 50)
+    for pages in sorted({max(1, args.pages // 4), max(1, args.pages // 2), args.pages}):
+        path = os.path.abspath(f"synthetic-{pages}.pdf")
+        build_pdf(path, pages, args.words_per_page)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"\n📄 {pages:,} pages ({size_mb:.1f} MB)")
+
+        chunks, peak, elapsed = measure(lambda: whole_document_ingest(rag, path))
+        print(f"   🐢 Whole-document ingest: peak {peak:7.1f} MB, {chunks:,} chunks in {elapsed:.1f}s")
+
+        # Distinct bytes so dedupe does not short-circuit the second run
+        with open(path, "ab") as file:
+            file.write(b"\n% streaming\n")
+        _, peak, elapsed = measure(lambda: asyncio.run(rag.add_document(path, os.path.basename(path))))
+        print(f"   🚀 Streaming ingest:      peak {peak:7.1f} MB, "
+              f"{rag.last_ingest['chunks']:,} chunks in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark PDF text extraction throughput against process-pool worker count.
+
+Builds a synthetic PDF and extracts every page through ``iter_pdf_text``
+with ``PDF_EXTRACT_WORKERS`` set to each value in ``--workers`` (1 is the
+serial path). Pool start-up is excluded by warming the pool first.
+
+Usage:
+    python benchmarks/benchmark_pdf_extraction.py [--pages 1000] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+from benchmark_ingest_memory import build_pdf
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--words-per-page", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    from core.config import config
+    from core.executors import process_executor, shutdown_executors
+    from core.extraction import extract_pdf_pages, iter_pdf_text
+
+    path = os.path.join(tempfile.mkdtemp(prefix="pdf-extract-bench-"), "synthetic.pdf")
+    build_pdf(path, args.pages, args.words_per_page)
+
+    print("📊 PDF Extraction Benchmark")
+    print("=" * 50)
+    print(f"📄 {args.pages:,} pages, {os.path.getsize(path) / 1024 / 1024:.1f} MB, {os.cpu_count()} CPUs")
+
+    serial_rate = None
+    for workers in sorted(set(args.workers)):
+        config.PDF_EXTRACT_WORKERS = workers
+        config.PDF_PARALLEL_MIN_PAGES = 2
+        shutdown_executors()
+        if workers > 1:
+            # Warm the pool so process start-up is not counted
+            list(process_executor().map(extract_pdf_pages, [path] * workers, [0] * workers, [1] * workers))
+
+        start = time.perf_counter()
+        pages = sum(1 for _ in iter_pdf_text(path))
+        rate = pages / (time.perf_counter() - start)
+        serial_rate = serial_rate or rate
+        print(f"   {'🐢' if workers == 1 else '🚀'} {workers:2d} worker(s): {rate:8.1f} pages/s ({rate / serial_rate:.2f}x)")
+    shutdown_executors()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Replay a query log against RAGPipeline.query with and without the query
+embedding cache.
+
+Pass a log file with one question per line. With no file a synthetic
+dashboard-style log is generated: a handful of questions asked over and over
+(Zipf-distributed) with a tail of one-off questions. Answer generation is
+stubbed out so only embedding and retrieval are timed.
+
+Usage:
+    python benchmarks/benchmark_query_cache.py [queries.log] [--queries 2000] [--cache-size 1024]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+DASHBOARD_QUESTIONS = [
+    "What were the action items from the last meeting?",
+    "Summarize the latest transcription",
+    "What is the current latency budget?",
+    "Who owns the rollout plan?",
+    "What did we decide about ingestion throughput?",
+    "Are there any open risks?",
+    "When is the next release?",
+    "What was said about retrieval quality?",
+]
+
+
+def synthetic_log(queries: int, seed: int = 7):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(DASHBOARD_QUESTIONS))]
+    log = []
+    for i in range(queries):
+        if rng.random() < 0.1:
+            log.append(f"One-off question number {i} about topic {rng.randint(0, 10_000)}")
+        else:
+            log.append(rng.choices(DASHBOARD_QUESTIONS, weights)[0])
+    return log
+
+
+async def replay(rag, log):
+    latencies = []
+    for question in log:
+        start = time.perf_counter()
+        await rag.query(question, top_k=5)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summarize(label, latencies):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"   {label}: mean {statistics.mean(latencies) * 1000:6.2f} ms, "
+        f"p50 {statistics.median(latencies) * 1000:6.2f} ms, p95 {p95 * 1000:6.2f} ms"
+    )
+    return statistics.mean(latencies)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("log", nargs="?")
+    parser.add_argument("--queries", type=int, default=2000, help="Synthetic log length")
+    parser.add_argument("--cache-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    if args.log:
+        with open(args.log) as f:
+            log = [line.strip() for line in f if line.strip()]
+    else:
+        log = synthetic_log(args.queries)
+
+    os.chdir(tempfile.mkdtemp(prefix="query-cache-bench-"))
+    from core.rag_pipeline import RAGPipeline
+
+    rag = RAGPipeline()
+
+    async def no_answer(question, context):
+        return ""
+
+    rag._generate_answer = no_answer
+    await rag.add_transcriptions([
+        {"text": f"Meeting note {i}: " + question, "source": "benchmark"}
+        for i, question in enumerate(DASHBOARD_QUESTIONS * 25)
+    ])
+
+    print("📊 Query Embedding Cache Benchmark")
+    print("=" * 50)
+    print(f"   📜 Queries: {len(log):,} ({len(set(log)):,} distinct)")
+
+    # Warm up the model so neither run pays the load cost
+    rag.embeddings.embed_query("warm up")
+
+    rag.query_cache_size = 0
+    uncached = summarize("🐢 No cache ", await replay(rag, log))
+
+    rag.query_cache_size = args.cache_size
+    cached = summarize("🚀 LRU cache", await replay(rag, log))
+
+    stats = rag.query_cache_stats()
+    print(f"   🎯 Cache hits: {stats['hits']:,}, misses: {stats['misses'] - len(log):,}")
+    print(f"   📈 Mean latency reduction: {uncached / cached:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
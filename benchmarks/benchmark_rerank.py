@@ -0,0 +1,170 @@
+"""
+Benchmark prompt size and end-to-end query latency with and without reranking.
+
+Runs ``--queries`` questions through ``RAGPipeline.query`` against a corpus
+of ``--chunks`` chunk-sized passages in three configurations:
+
+- top_k=5 in vector order (the default)
+- top_k=10 in vector order (raising top_k for better answers)
+- ``RERANK_CANDIDATES`` candidates reranked down to ``RERANK_TOP_N``
+
+and once more with a ``--tight-budget-ms`` budget to show the fallback.
+
+The LLM call is simulated: ``--llm-ms`` plus ``--prefill-ms`` per 1,000
+prompt tokens, roughly how hosted completion latency grows with the prompt.
+The reranker is the ONNX cross-encoder (RERANK_MODEL) when it can be loaded,
+otherwise a stand-in costing ``--pair-ms`` per scored pair. Prompt tokens are
+estimated at four characters per token.
+
+Usage:
+    python benchmarks/benchmark_rerank.py [--chunks 2000] [--queries 30]
+        [--llm-ms 250] [--prefill-ms 60] [--pair-ms 4] [--tight-budget-ms 20]
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+WORDS = (
+    "latency budget ingest throughput retrieval quality rollout plan transcription service "
+    "invoice refund shipping warehouse hiring laptop backup database security review "
+    "pricing contract renewal incident postmortem roadmap launch customer onboarding"
+).split()
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:16]]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def make_passage(i: int) -> str:
+    rng = np.random.default_rng(i)
+    return f"Passage {i}. " + " ".join(rng.choice(WORDS, size=150))
+
+
+def load_reranker(pair_seconds: float):
+    from core.config import config
+    from core.reranker import CrossEncoderReranker
+
+    try:
+        return CrossEncoderReranker.load(), "ONNX cross-encoder"
+    except Exception:
+        pass
+
+    class SimulatedReranker(CrossEncoderReranker):
+        def __init__(self):
+            self.batch_size = config.RERANK_BATCH_SIZE
+            self.budget_ms = config.RERANK_BUDGET_MS
+            self._lock = threading.Lock()
+            self.reranked = self.fallbacks = 0
+            self.last_ms = None
+
+        def _score_batch(self, question, passages):
+            time.sleep(pair_seconds * len(passages))
+            return np.array([hashlib.md5((question + p).encode()).digest()[0] for p in passages], dtype=np.float32)
+
+    return SimulatedReranker(), f"simulated cross-encoder ({pair_seconds * 1000:.0f} ms/pair)"
+
+
+async def run(pipeline, questions, top_k: int, prompt_chars):
+    prompt_chars.clear()
+    latencies = []
+    for question in questions:
+        start = time.perf_counter()
+        await pipeline.query(question, top_k=top_k)
+        latencies.append(time.perf_counter() - start)
+    return latencies, list(prompt_chars)
+
+
+def report(label: str, latencies, prompts, reranker=None):
+    p95 = sorted(latencies)[int(len(latencies) * 0.95) - 1]
+    line = (
+        f"   {label:<28} ≈{statistics.mean(prompts) / 4:6,.0f} prompt tokens, "
+        f"{statistics.mean(latencies) * 1000:6.0f} ms mean, {p95 * 1000:6.0f} ms p95"
+    )
+    if reranker is not None:
+        line += f", {reranker.fallbacks} fallbacks"
+    print(line)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=30)
+    parser.add_argument("--llm-ms", type=float, default=250)
+    parser.add_argument("--prefill-ms", type=float, default=60)
+    parser.add_argument("--pair-ms", type=float, default=4)
+    parser.add_argument("--tight-budget-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    from core import rag_pipeline as rag_module
+    rag_module.HuggingFaceEmbeddings = FakeEmbeddings
+    os.chdir(tempfile.mkdtemp(prefix="rerank-bench-"))
+
+    pipeline = rag_module.RAGPipeline()
+    pipeline.answer_cache.max_entries = 0
+    passages = [make_passage(i) for i in range(args.chunks)]
+    for start in range(0, len(passages), 500):
+        batch = passages[start:start + 500]
+        pipeline.collection.add(
+            ids=[f"chunk{start + i}" for i in range(len(batch))],
+            documents=batch,
+            embeddings=pipeline.embeddings.embed_documents(batch),
+            metadatas=[{"filename": f"doc{start + i}.txt", "chunk_index": 0} for i in range(len(batch))]
+        )
+
+    prompt_chars = []
+
+    async def simulated_llm(question, context):
+        prompt = pipeline._build_messages(question, context)[1]["content"]
+        prompt_chars.append(len(prompt))
+        await asyncio.sleep((args.llm_ms + args.prefill_ms * len(prompt) / 4 / 1000) / 1000)
+        return "answer"
+
+    pipeline._generate_answer = simulated_llm
+    rng = np.random.default_rng(0)
+    questions = [f"What about the {' '.join(rng.choice(WORDS, size=3))}?" for _ in range(args.queries)]
+
+    print("📊 Rerank Benchmark")
+    print("=" * 50)
+    print(f"   📄 {args.chunks:,} chunks, {args.queries} queries, simulated LLM {args.llm_ms:.0f} ms "
+          f"+ {args.prefill_ms:.0f} ms/1k prompt tokens")
+
+    report("Vector order, top_k=5", *await run(pipeline, questions, 5, prompt_chars))
+    report("Vector order, top_k=10", *await run(pipeline, questions, 10, prompt_chars))
+
+    reranker, description = load_reranker(args.pair_ms / 1000)
+    print(f"   🔁 Reranker: {description}")
+    pipeline.reranker = reranker
+    report(f"Rerank {pipeline.rerank_candidates}→{pipeline.rerank_top_n}, {reranker.budget_ms:.0f} ms",
+           *await run(pipeline, questions, 5, prompt_chars), reranker)
+
+    reranker.fallbacks = 0
+    reranker.budget_ms = args.tight_budget_ms
+    report(f"Rerank, {args.tight_budget_ms:.0f} ms budget", *await run(pipeline, questions, 5, prompt_chars), reranker)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+"""
+Benchmark the serving footprint: installed size, import time and RSS.
+
+1. Installed size of each requirements profile (requirements-serving.txt vs
+   requirements.txt), summed over every installed distribution the profile
+   pulls in. Distributions that are not installed here are listed as missing.
+2. Import time, RSS and loaded module count, each measured in a fresh process:
+   - the server import as it is now (heavy modules deferred to warm-up)
+   - the server import with the previous eager imports
+   - each embedding runtime: torch via sentence-transformers, or
+     onnxruntime + tokenizers
+
+Model memory once loaded is measured by benchmark_embedding_backends.py.
+
+Usage:
+    python benchmarks/benchmark_serving_footprint.py
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+from importlib import metadata
+
+from packaging.requirements import Requirement
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(REPO, 'src')
+
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+{code}
+seconds = time.perf_counter() - start
+rss = 0
+with open("/proc/self/status") as status:
+    for line in status:
+        if line.startswith("VmRSS:"):
+            rss = int(line.split()[1]) / 1024
+print(json.dumps({{"seconds": seconds, "rss_mb": rss, "modules": len(sys.modules)}}))
+"""
+
+SCENARIOS = [
+    ("Server import (deferred)", "import main"),
+    ("Server import (eager)", (
+        "import main, chromadb, chromadb.config, langchain.text_splitter, langchain.schema\n"
+        "from langchain_community.embeddings import HuggingFaceEmbeddings"
+    )),
+    ("Embedding runtime: torch", "import sentence_transformers"),
+    ("Embedding runtime: onnx", "import onnxruntime, tokenizers\nfrom core.embeddings import OnnxEmbeddings"),
+]
+
+
+def read_requirements(path: str):
+    requirements = []
+    with open(path) as file:
+        for line in file:
+            line = line.split("#")[0].strip()
+            if not line:
+                continue
+            if line.startswith("-r "):
+                requirements += read_requirements(os.path.join(os.path.dirname(path), line[3:].strip()))
+            else:
+                requirements.append(Requirement(line))
+    return requirements
+
+
+def normalize(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def installed_size(requirements):
+    """Return (bytes, distribution count, missing names) over the dependency closure."""
+    seen, missing, total = set(), set(), 0
+    pending = list(requirements)
+    while pending:
+        requirement = pending.pop()
+        name = normalize(requirement.name)
+        if name in seen or name in missing:
+            continue
+        try:
+            distribution = metadata.distribution(requirement.name)
+        except metadata.PackageNotFoundError:
+            missing.add(name)
+            continue
+        seen.add(name)
+        total += sum(file.size or 0 for file in distribution.files or [])
+        for dependency in distribution.requires or []:
+            dependency = Requirement(dependency)
+            if dependency.marker is None or dependency.marker.evaluate({"extra": ""}):
+                pending.append(dependency)
+    return total, len(seen), sorted(missing)
+
+
+def probe(code: str):
+    env = dict(os.environ, PYTHONPATH=SRC)
+    env.setdefault("GROQ_API_KEY", "benchmark")
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(src=SRC, code=code)],
+        cwd=REPO, env=env, capture_output=True, text=True
+    )
+    if result.returncode:
+        return None, result.stderr.strip().splitlines()[-1]
+    return json.loads(result.stdout.strip().splitlines()[-1]), None
+
+
+def main():
+    print("📊 Serving Footprint Benchmark")
+    print("=" * 50)
+
+    for profile in ("requirements-serving.txt", "requirements.txt"):
+        size, count, missing = installed_size(read_requirements(os.path.join(REPO, profile)))
+        print(f"   📦 {profile}: {size / 1024 ** 2:,.0f} MB installed across {count} distributions")
+        if missing:
+            print(f"      ⚠️  Not installed here (not counted): {', '.join(missing)}")
+
+    for label, code in SCENARIOS:
+        result, error = probe(code)
+        if error:
+            print(f"   ❌ {label}: {error}")
+            continue
+        print(f"   ⏱️  {label}: {result['seconds']:.2f}s, {result['rss_mb']:.0f} MB RSS, {result['modules']} modules")
+
+
+if __name__ == "__main__":
+    main()
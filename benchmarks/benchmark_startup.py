@@ -0,0 +1,130 @@
+"""
+Benchmark cold start: import time, time to liveness and time to warm.
+
+1. Runs ``python -X importtime -c "import main"`` and reports the total
+   import time and the slowest top-level packages.
+2. Starts the server in a subprocess and polls it, reporting how long after
+   launch ``/health`` first answers, how long until ``/ready`` returns 200
+   (the background warm-up has loaded the model and run a dummy embed), and
+   the latency of the first ``GET /documents`` after that.
+
+``--fake-model`` swaps in a stand-in embedder so the run measures everything
+except loading sentence-transformers weights.
+
+Usage:
+    python benchmarks/benchmark_startup.py [--fake-model] [--timeout 300]
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(REPO, 'src')
+
+SERVER = """
+import sys, hashlib
+sys.path.insert(0, {src!r})
+if {fake!r}:
+    from core import rag_pipeline
+
+    class FakeEmbeddings:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def embed_documents(self, texts):
+            return [self.embed_query(text) for text in texts]
+
+        def embed_query(self, text):
+            return [byte / 255.0 for byte in hashlib.md5(text.encode()).digest()[:8]]
+
+    rag_pipeline.HuggingFaceEmbeddings = FakeEmbeddings
+import uvicorn
+import main
+uvicorn.run(main.app, host="127.0.0.1", port={port}, log_level="warning")
+"""
+
+
+def import_times(env, top: int = 10):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=REPO, env=env, capture_output=True, text=True
+    )
+    total = 0
+    packages = {}
+    for line in result.stderr.splitlines():
+        fields = line[len("import time:"):].split("|")
+        if not line.startswith("import time:") or len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name, cumulative = fields[2].strip(), int(fields[1])
+        if name == "main":
+            total = cumulative
+            continue
+        # Charge each top-level package with its most expensive import
+        package = name.split(".")[0]
+        packages[package] = max(packages.get(package, 0), cumulative)
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return total / 1e6, slowest
+
+
+def wait_for(url: str, deadline: float, status: int = 200) -> float:
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == status:
+                    return time.perf_counter()
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(url)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fake-model", action="store_true")
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=SRC)
+    env.setdefault("GROQ_API_KEY", "benchmark")
+
+    print("📊 Startup Benchmark")
+    print("=" * 50)
+    total, slowest = import_times(env)
+    print(f"   📦 import main: {total:.2f}s")
+    for name, microseconds in slowest:
+        print(f"      {microseconds / 1e6:6.2f}s  {name}")
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    workdir = tempfile.mkdtemp(prefix="startup-bench-")
+    os.symlink(os.path.join(REPO, "static"), os.path.join(workdir, "static"))
+    code = SERVER.format(src=SRC, fake=args.fake_model, port=port)
+
+    base = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "-c", code], cwd=workdir, env=env)
+    try:
+        deadline = started + args.timeout
+        live = wait_for(f"{base}/health", deadline)
+        print(f"   💓 /health answering after {live - started:.2f}s")
+        ready = wait_for(f"{base}/ready", deadline)
+        print(f"   🔥 /ready 200 (warm) after {ready - started:.2f}s")
+        start = time.perf_counter()
+        urllib.request.urlopen(f"{base}/documents", timeout=args.timeout).read()
+        print(f"   🚀 First GET /documents after warm-up: {(time.perf_counter() - start) * 1000:.1f} ms")
+    except TimeoutError as e:
+        print(f"   ❌ Timed out waiting for {e}")
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Compare fixed-size chunking with VAD-gated segmentation on recorded audio.
+
+Pass 16-bit mono WAV recordings (e.g. meeting captures) as arguments. With no
+arguments a synthetic mostly-silent "meeting" fixture is generated: short
+voiced turns separated by long pauses.
+
+For each mode the script counts Whisper calls, the seconds of audio uploaded
+and the modelled transcription time (fixed request overhead plus a per-second
+cost), using a stub client so no API key is needed.
+
+Usage:
+    python benchmarks/benchmark_vad_segmentation.py [recording.wav ...] [--overhead 0.25] [--per-second 0.02]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import wave
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.audio_processor import AudioProcessor
+from core.transcription import GroqClientPool, TranscriptionService
+
+FRAME_BYTES = 8192  # 4096-sample WebSocket frames
+
+
+class RecordingTranscriptions:
+    """Records uploaded audio length and simulates Whisper latency."""
+
+    def __init__(self, overhead: float, per_second: float):
+        self.overhead = overhead
+        self.per_second = per_second
+        self.calls = []
+
+    def create(self, file, **kwargs):
+        _, audio_file, _ = file
+        with wave.open(audio_file, "rb") as wav_file:
+            seconds = wav_file.getnframes() / wav_file.getframerate()
+        self.calls.append(seconds)
+        return "transcribed speech"
+
+
+class StubGroqClient:
+    def __init__(self, overhead: float, per_second: float):
+        self.audio = type("Audio", (), {"transcriptions": RecordingTranscriptions(overhead, per_second)})()
+
+
+def synthetic_meeting(minutes: float = 10, sample_rate: int = 16000) -> bytes:
+    """Build a mostly-silent meeting: 2-6 s voiced turns every 15-40 s."""
+    rng = np.random.default_rng(42)
+    total = int(minutes * 60 * sample_rate)
+    audio = rng.normal(0, 30, total)
+    position = int(rng.uniform(5, 15) * sample_rate)
+    while position < total:
+        length = int(rng.uniform(2, 6) * sample_rate)
+        t = np.arange(min(length, total - position)) / sample_rate
+        f0 = rng.uniform(100, 220) + 20 * np.sin(2 * np.pi * 3 * t)
+        voiced = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 15))
+        envelope = (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)) ** 2
+        audio[position:position + len(t)] += voiced * envelope * 3000
+        position += len(t) + int(rng.uniform(15, 40) * sample_rate)
+    return np.clip(audio, -32768, 32767).astype(np.int16).tobytes()
+
+
+def load_recording(path: str):
+    with wave.open(path, "rb") as wav_file:
+        if wav_file.getsampwidth() != 2 or wav_file.getnchannels() != 1:
+            raise ValueError(f"{path}: expected 16-bit mono WAV")
+        return wav_file.readframes(wav_file.getnframes()), wav_file.getframerate()
+
+
+async def run_mode(pcm: bytes, sample_rate: int, use_vad: bool, overhead: float, per_second: float):
+    pool = GroqClientPool(size=1, client_factory=lambda: StubGroqClient(overhead, per_second))
+    service = TranscriptionService(client_pool=pool, max_concurrency=1)
+    processor = AudioProcessor(transcriber=service, use_vad=use_vad)
+    format_info = {"sample_rate": sample_rate, "channels": 1}
+
+    cpu_start = time.process_time()
+    for offset in range(0, len(pcm), FRAME_BYTES):
+        await processor.process_audio_chunk(pcm[offset:offset + FRAME_BYTES], format_info)
+    cpu_seconds = time.process_time() - cpu_start
+    service.shutdown()
+
+    calls = pool.clients[0].audio.transcriptions.calls
+    modelled = sum(overhead + per_second * seconds for seconds in calls)
+    return len(calls), sum(calls), modelled, cpu_seconds
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("recordings", nargs="*")
+    parser.add_argument("--overhead", type=float, default=0.25, help="Whisper request overhead (s)")
+    parser.add_argument("--per-second", type=float, default=0.02, help="Whisper time per audio second (s)")
+    args = parser.parse_args()
+
+    fixtures = [(path, *load_recording(path)) for path in args.recordings]
+    if not fixtures:
+        fixtures = [("synthetic meeting (10 min)", synthetic_meeting(), 16000)]
+
+    print("📊 VAD Segmentation Benchmark")
+    print("=" * 50)
+    for name, pcm, sample_rate in fixtures:
+        duration = len(pcm) / 2 / sample_rate
+        print(f"   🎵 {name}: {duration:,.0f}s of audio")
+        for label, use_vad in (("Fixed chunks", False), ("VAD segments", True)):
+            calls, uploaded, modelled, cpu = await run_mode(
+                pcm, sample_rate, use_vad, args.overhead, args.per_second
+            )
+            print(
+                f"      {label:>12}: {calls:4d} Whisper calls, {uploaded:7,.1f}s uploaded, "
+                f"~{modelled:6.1f}s transcription time, {cpu * 1000:7.1f} ms CPU"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""
+Microbenchmark of per-chunk WAV preparation overhead before upload.
+
+Compares the old path (wave module into BytesIO, .read() copy, write to a
+NamedTemporaryFile, reopen and read for upload, unlink) with the in-memory
+WavPayload path (cached format header + PCM memoryview read in upload-sized
+pieces, as the HTTP client does).
+
+Usage:
+    python benchmarks/benchmark_wav_upload.py [--seconds 10] [--iterations 500]
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import wave
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.wav import WavPayload
+
+SAMPLE_RATE = 16000
+UPLOAD_READ_SIZE = 64 * 1024
+
+
+def drain(file_obj):
+    """Read a file object the way the multipart encoder does."""
+    while file_obj.read(UPLOAD_READ_SIZE):
+        pass
+
+
+def tempfile_path(pcm: bytes):
+    wav_buffer = io.BytesIO()
+    with wave.open(wav_buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(SAMPLE_RATE)
+        wav_file.writeframes(pcm)
+    wav_buffer.seek(0)
+    wav_data = wav_buffer.read()
+
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+        temp_file.write(wav_data)
+        temp_file_path = temp_file.name
+    try:
+        with open(temp_file_path, "rb") as audio_file:
+            drain(audio_file)
+    finally:
+        os.unlink(temp_file_path)
+
+
+def in_memory_path(pcm: bytes):
+    drain(WavPayload(pcm, SAMPLE_RATE, 1))
+
+
+def measure(fn, pcm: bytes, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(pcm)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=10.0, help="Audio per chunk")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    pcm = os.urandom(int(args.seconds * SAMPLE_RATE) * 2)
+
+    print("📊 WAV Upload Preparation Benchmark")
+    print("=" * 50)
+    print(f"   🎵 Chunk: {args.seconds:.1f}s ({len(pcm):,} bytes PCM)")
+
+    old = measure(tempfile_path, pcm, args.iterations)
+    new = measure(in_memory_path, pcm, args.iterations)
+
+    print(f"   🐢 Tempfile round-trip: {old * 1e6:,.1f} µs/chunk")
+    print(f"   🚀 In-memory payload:   {new * 1e6:,.1f} µs/chunk")
+    print(f"   📈 Speedup: {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Compare CPU cost per second of audio for the /audio WebSocket protocols.
+
+Streams the same PCM through the real endpoint (in-process, via the FastAPI
+test client) once as base64-in-JSON text frames and once as raw binary
+frames, with a stub transcription client so only protocol and buffering
+work is measured.
+
+Usage:
+    python benchmarks/benchmark_ws_protocol.py [--seconds 600]
+"""
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import routes
+from core.audio_sessions import AudioSessionManager
+from core.transcription import GroqClientPool
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 4096
+
+
+class SilentTranscriptions:
+    def create(self, file, **kwargs):
+        return ""
+
+
+class StubGroqClient:
+    def __init__(self):
+        self.audio = type("Audio", (), {"transcriptions": SilentTranscriptions()})()
+
+
+def stream_json(websocket, frame: bytes, frames: int):
+    for _ in range(frames):
+        websocket.send_text(json.dumps({
+            "type": "audio_data",
+            "data": base64.b64encode(frame).decode(),
+            "format": "pcm_s16le",
+            "channels": 1,
+            "sample_rate": SAMPLE_RATE,
+            "samples": FRAME_SAMPLES
+        }))
+
+
+def stream_binary(websocket, frame: bytes, frames: int):
+    websocket.send_text(json.dumps({"type": "start", "format": "pcm_s16le", "sample_rate": SAMPLE_RATE, "channels": 1}))
+    websocket.receive_json()
+    for _ in range(frames):
+        websocket.send_bytes(frame)
+
+
+def measure(client: TestClient, sender, frame: bytes, frames: int):
+    with client.websocket_connect("/audio") as websocket:
+        cpu_start = time.process_time()
+        sender(websocket, frame, frames)
+        # A ping round-trip guarantees every audio frame has been handled
+        websocket.send_text(json.dumps({"type": "ping"}))
+        websocket.receive_json()
+        return time.process_time() - cpu_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=600, help="Seconds of audio per mode")
+    args = parser.parse_args()
+
+    routes._audio_sessions = AudioSessionManager(
+        client_pool=GroqClientPool(size=1, client_factory=StubGroqClient),
+        use_vad=False
+    )
+    app = FastAPI()
+    app.include_router(routes.router)
+
+    frame = os.urandom(FRAME_SAMPLES * 2)
+    frames = int(args.seconds * SAMPLE_RATE / FRAME_SAMPLES)
+    audio_seconds = frames * FRAME_SAMPLES / SAMPLE_RATE
+    json_frame_size = len(base64.b64encode(frame)) + 120
+
+    print("📊 WebSocket Audio Protocol Benchmark")
+    print("=" * 50)
+    print(f"   🎵 Audio per mode: {audio_seconds:,.0f}s in {frames:,} frames")
+    print(f"   📦 Bytes per frame: JSON ~{json_frame_size:,}, binary {len(frame):,}")
+
+    with TestClient(app) as client:
+        json_cpu = measure(client, stream_json, frame, frames)
+        binary_cpu = measure(client, stream_binary, frame, frames)
+
+    print(f"   🐢 JSON/base64: {json_cpu / audio_seconds * 1000:.3f} ms CPU per second of audio")
+    print(f"   🚀 Binary:      {binary_cpu / audio_seconds * 1000:.3f} ms CPU per second of audio")
+    print(f"   📈 CPU reduction: {json_cpu / binary_cpu:.2f}x")
+
+    routes._audio_sessions.transcriber.shutdown()
+
+
+if __name__ == "__main__":
+    main()
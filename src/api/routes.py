@@ -1,11 +1,15 @@
 """
 API routes for the Real-Time Audio RAG Agent.
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import os
+import time
+import shutil
+import hashlib
+import zipfile
 import tempfile
-from fastapi import APIRouter, File, UploadFile, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, File, Form, UploadFile, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 import json
 import base64
@@ -13,30 +17,133 @@ import asyncio
 import logging
 from datetime import datetime
 
-from core.audio_processor import AudioProcessor
+from core.audio_sessions import AudioSessionManager
+from core.config import config
+from core.executors import executor_stats, run_cpu, run_io
+from core.extraction import SUPPORTED_EXTENSIONS
+from core.ingest_jobs import IngestJobQueue
+from core.stream_pipeline import AudioStreamPipeline
 from core.rag_pipeline import RAGPipeline
+from core.transcription_indexer import TranscriptionIndexer
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Initialize components lazily
-_audio_processor = None
+_audio_sessions = None
 _rag_pipeline = None
+_rag_warmup: Optional[asyncio.Task] = None
+_rag_warmup_seconds: Optional[float] = None
+_transcription_indexer = None
+_ingest_jobs = None
 
-def get_audio_processor():
-    """Get or create audio processor instance."""
-    global _audio_processor
-    if _audio_processor is None:
-        _audio_processor = AudioProcessor()
-    return _audio_processor
+WARMUP_RETRY_AFTER_SECONDS = 5
+
+def get_audio_sessions():
+    """Get or create the audio session manager."""
+    global _audio_sessions
+    if _audio_sessions is None:
+        _audio_sessions = AudioSessionManager()
+    return _audio_sessions
+
+async def shutdown_audio_sessions():
+    """Close open audio sessions and stop the shared transcription threads."""
+    global _audio_sessions
+    if _audio_sessions is not None:
+        await _audio_sessions.shutdown()
+        _audio_sessions = None
 
 def get_rag_pipeline():
-    """Get or create RAG pipeline instance."""
+    """
+    Get the RAG pipeline for a request.
+    
+    While the startup warm-up is still loading it, raises a 503 with
+    Retry-After instead of blocking; without a warm-up (scripts, tests) the
+    pipeline is created on first use.
+    """
     global _rag_pipeline
     if _rag_pipeline is None:
+        if _rag_warmup is not None and not _rag_warmup.done():
+            raise HTTPException(
+                status_code=503,
+                detail="RAG pipeline is warming up",
+                headers={"Retry-After": str(WARMUP_RETRY_AFTER_SECONDS)}
+            )
         _rag_pipeline = RAGPipeline()
     return _rag_pipeline
 
+async def wait_for_rag_pipeline():
+    """Get the RAG pipeline for background work, waiting for warm-up if needed."""
+    if _rag_pipeline is None and _rag_warmup is not None and not _rag_warmup.done():
+        await asyncio.wait([_rag_warmup])
+    return get_rag_pipeline()
+
+async def _warm_up_rag_pipeline():
+    global _rag_pipeline, _rag_warmup_seconds
+    started = time.perf_counter()
+    try:
+        pipeline = await run_cpu(RAGPipeline)
+        await run_cpu(pipeline.warm_up)
+    except Exception as e:
+        logger.error(f"RAG pipeline warm-up failed: {e}")
+        raise
+    _rag_pipeline = pipeline
+    _rag_warmup_seconds = time.perf_counter() - started
+    logger.info(f"RAG pipeline warmed up in {_rag_warmup_seconds:.1f}s")
+
+def start_rag_warmup():
+    """Load the RAG pipeline and embedding model in the background."""
+    global _rag_warmup
+    if _rag_pipeline is None and _rag_warmup is None:
+        _rag_warmup = asyncio.ensure_future(_warm_up_rag_pipeline())
+    return _rag_warmup
+
+def _warmup_state() -> dict:
+    if _rag_pipeline is not None:
+        state = "ready"
+    elif _rag_warmup is None:
+        state = "not_started"
+    elif not _rag_warmup.done():
+        state = "warming_up"
+    else:
+        state = "failed"
+    return {
+        "state": state,
+        "seconds": round(_rag_warmup_seconds, 2) if _rag_warmup_seconds is not None else None
+    }
+
+def get_transcription_indexer():
+    """Get or create the background transcription indexer."""
+    global _transcription_indexer
+    if _transcription_indexer is None:
+        _transcription_indexer = TranscriptionIndexer(wait_for_rag_pipeline)
+    return _transcription_indexer
+
+async def shutdown_transcription_indexer():
+    """Index queued transcriptions and stop the indexing worker."""
+    global _transcription_indexer
+    if _transcription_indexer is not None:
+        await _transcription_indexer.shutdown()
+        _transcription_indexer = None
+
+def get_ingest_jobs():
+    """Get or create the background document ingest queue."""
+    global _ingest_jobs
+    if _ingest_jobs is None:
+        _ingest_jobs = IngestJobQueue(wait_for_rag_pipeline)
+    return _ingest_jobs
+
+async def start_ingest_jobs():
+    """Start the ingest workers, resuming jobs left unfinished by a restart."""
+    await get_ingest_jobs().start()
+
+async def shutdown_ingest_jobs():
+    """Stop the ingest workers; running jobs resume on the next start."""
+    global _ingest_jobs
+    if _ingest_jobs is not None:
+        await _ingest_jobs.shutdown()
+        _ingest_jobs = None
+
 class QueryRequest(BaseModel):
     text: str
 
@@ -44,16 +151,76 @@ class QueryResponse(BaseModel):
     answer: str
     sources: List[str] = []
 
-@router.post("/documents", response_model=dict)
+async def _save_upload(file: UploadFile, path: str) -> Tuple[str, int]:
+    """
+    Stream an upload to disk, hashing it on the way.
+    
+    The upload is copied in ``UPLOAD_CHUNK_SIZE`` blocks, so it is never held
+    in memory, and rejected as soon as it exceeds ``MAX_UPLOAD_BYTES``.
+    
+    Args:
+        file: The uploaded file
+        path: Where to write it
+        
+    Returns:
+        Tuple of (md5 of the bytes, size in bytes)
+        
+    Raises:
+        HTTPException: 413 if the upload is larger than ``MAX_UPLOAD_BYTES``
+    """
+    if file.size is not None and file.size > config.MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"File exceeds maximum upload size of {config.MAX_UPLOAD_BYTES:,} bytes")
+    
+    digest = hashlib.md5()
+    size = 0
+    try:
+        with open(path, "wb") as output:
+            while True:
+                chunk = await file.read(config.UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > config.MAX_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail=f"File exceeds maximum upload size of {config.MAX_UPLOAD_BYTES:,} bytes")
+                digest.update(chunk)
+                await run_io(output.write, chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return digest.hexdigest(), size
+
+def _job_response(job: dict) -> dict:
+    return {
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "filename": job["filename"],
+        "size": job["size"],
+        "document_id": job["document_id"],
+        "progress": {
+            "pages": job["pages"],
+            "chunks": job["chunks"],
+            "embedded": job["embedded"]
+        },
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"]
+    }
+
+@router.post("/documents", response_model=dict, status_code=202)
 async def upload_document(file: UploadFile = File(...)):
     """
     Upload a document to the RAG pipeline.
     
+    The upload is streamed to disk and hashed, then ingested by a background
+    job; poll ``GET /jobs/{job_id}`` for progress. A document that is already
+    stored gets a job that is completed straight away.
+    
     Args:
         file: The document file to upload (PDF, TXT, DOCX)
         
     Returns:
-        Success message with document ID
+        The ingest job
     """
     try:
         # Validate file type
@@ -69,38 +236,206 @@ async def upload_document(file: UploadFile = File(...)):
                 detail=f"Unsupported file type. Supported types: {list(allowed_types.values())}"
             )
         
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=allowed_types[file.content_type]) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Spool the upload where its job can find it after a restart
+        rag_pipeline = get_rag_pipeline()
+        ingest_jobs = get_ingest_jobs()
+        job_id = ingest_jobs.new_job_id()
+        upload_path = ingest_jobs.upload_path(job_id, allowed_types[file.content_type])
+        content_hash, size = await _save_upload(file, upload_path)
         
-        try:
-            # Process document with RAG pipeline
-            rag_pipeline = get_rag_pipeline()
-            document_id = await rag_pipeline.add_document(temp_file_path, file.filename)
-            
-            # Print success message to terminal
-            print(f"✅ Document uploaded successfully:")
-            print(f"   📄 Filename: {file.filename}")
-            print(f"   🆔 Document ID: {document_id}")
-            print(f"   📏 Size: {len(content):,} bytes")
-            print(f"   📝 Content type: {file.content_type}")
-            print("-" * 50)
-            
-            return {
-                "message": f"Document '{file.filename}' uploaded successfully",
-                "document_id": document_id,
-                "filename": file.filename,
-                "size": len(content)
-            }
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_file_path)
+        # Skip extraction entirely for a document that is already stored
+        existing_id = await rag_pipeline.find_document(content_hash)
+        if existing_id:
+            os.unlink(upload_path)
+        job = await ingest_jobs.submit(
+            job_id, upload_path, file.filename,
+            content_hash=content_hash, size=size, document_id=existing_id
+        )
+        
+        # Print success message to terminal
+        print(f"✅ Document {'already stored' if existing_id else 'queued for ingest'}:")
+        print(f"   📄 Filename: {file.filename}")
+        print(f"   🧾 Job ID: {job_id}")
+        print(f"   📏 Size: {size:,} bytes")
+        print(f"   📝 Content type: {file.content_type}")
+        print("-" * 50)
+        
+        return {
+            "message": f"Document '{file.filename}' {'already stored' if existing_id else 'queued for ingest'}",
+            "duplicate": existing_id is not None,
+            **_job_response(job)
+        }
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing document: {str(e)}")
 
+def _unpack_archive(archive_path: str, dest_dir: str) -> Tuple[List[dict], List[dict]]:
+    """
+    Unpack the supported documents of a zip archive.
+    
+    Members are written under generated names, so archive paths cannot
+    escape ``dest_dir``; members larger than ``MAX_UPLOAD_BYTES`` are refused.
+    
+    Returns:
+        Tuple of (files to ingest, outcomes for refused members)
+    """
+    files, refused = [], []
+    with zipfile.ZipFile(archive_path) as archive:
+        for number, info in enumerate(archive.infolist()):
+            if info.is_dir() or os.path.splitext(info.filename)[1].lower() not in SUPPORTED_EXTENSIONS:
+                continue
+            path = os.path.join(dest_dir, f"member-{number}")
+            size = 0
+            with archive.open(info) as member, open(path, "wb") as output:
+                # Count real bytes: the sizes in the zip directory can lie
+                for block in iter(lambda: member.read(config.UPLOAD_CHUNK_SIZE), b""):
+                    size += len(block)
+                    if size > config.MAX_UPLOAD_BYTES:
+                        break
+                    output.write(block)
+            if size > config.MAX_UPLOAD_BYTES:
+                os.unlink(path)
+                refused.append({
+                    "filename": info.filename, "status": "failed", "document_id": None, "chunks": 0,
+                    "error": f"File exceeds maximum upload size of {config.MAX_UPLOAD_BYTES:,} bytes"
+                })
+                continue
+            files.append({"file_path": path, "filename": info.filename})
+    return files, refused
+
+def _collect_directory(directory: str) -> List[dict]:
+    """
+    List the supported documents under a directory inside ``BULK_INGEST_ROOT``.
+    
+    Raises:
+        HTTPException: 403 if bulk directory ingest is disabled or the
+            directory is outside the root, 404 if it does not exist
+    """
+    if not config.BULK_INGEST_ROOT:
+        raise HTTPException(status_code=403, detail="Directory ingest is disabled (set BULK_INGEST_ROOT)")
+    root = os.path.realpath(config.BULK_INGEST_ROOT)
+    target = os.path.realpath(os.path.join(root, directory))
+    if os.path.commonpath([root, target]) != root:
+        raise HTTPException(status_code=403, detail="Directory is outside BULK_INGEST_ROOT")
+    if not os.path.isdir(target):
+        raise HTTPException(status_code=404, detail="Directory not found")
+    
+    files = []
+    for dirpath, dirnames, filenames in os.walk(target):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                path = os.path.join(dirpath, name)
+                files.append({"file_path": path, "filename": os.path.relpath(path, target)})
+    return files
+
+@router.post("/documents/bulk", response_model=dict)
+async def upload_documents_bulk(
+    files: Optional[List[UploadFile]] = File(None),
+    archive: Optional[UploadFile] = File(None),
+    directory: Optional[str] = Form(None)
+):
+    """
+    Ingest many documents in one request.
+    
+    Send exactly one of: several ``files`` parts, a zip ``archive``, or a
+    ``directory`` relative to ``BULK_INGEST_ROOT`` on the server. Files are
+    extracted in parallel while their chunks are embedded and stored in
+    large shared batches. The request returns once every file is stored.
+    
+    Returns:
+        Totals, files per second and an outcome for every file
+    """
+    sources = [source for source in (files, archive, directory) if source]
+    if len(sources) != 1:
+        raise HTTPException(status_code=400, detail="Send exactly one of files, archive or directory")
+    
+    rag_pipeline = get_rag_pipeline()
+    started = time.perf_counter()
+    work_dir = tempfile.mkdtemp(prefix="bulk-ingest-")
+    try:
+        refused = []
+        if files:
+            batch = []
+            for number, file in enumerate(files):
+                path = os.path.join(work_dir, f"upload-{number}")
+                content_hash, _ = await _save_upload(file, path)
+                batch.append({"file_path": path, "filename": file.filename, "content_hash": content_hash})
+        elif archive:
+            archive_path = os.path.join(work_dir, "archive.zip")
+            await _save_upload(archive, archive_path)
+            try:
+                batch, refused = await run_io(_unpack_archive, archive_path, work_dir)
+            except zipfile.BadZipFile:
+                raise HTTPException(status_code=400, detail="Archive is not a valid zip file")
+        else:
+            batch = await run_io(_collect_directory, directory)
+        
+        outcomes = await rag_pipeline.add_documents(batch)
+        results = outcomes + refused
+        elapsed = time.perf_counter() - started
+        report = {
+            "files": len(results),
+            "added": sum(1 for result in results if result["status"] == "added"),
+            "duplicates": sum(1 for result in results if result["status"] == "duplicate"),
+            "failed": sum(1 for result in results if result["status"] == "failed"),
+            "chunks": sum(result["chunks"] for result in results if result["status"] == "added"),
+            "elapsed_seconds": round(elapsed, 3),
+            "files_per_second": round(len(results) / elapsed, 2) if elapsed else 0.0,
+            "results": results
+        }
+        
+        print(f"✅ Bulk ingest finished:")
+        print(f"   📚 Files: {report['files']} ({report['added']} added, {report['duplicates']} duplicates, {report['failed']} failed)")
+        print(f"   🧩 Chunks: {report['chunks']:,}")
+        print(f"   ⚡ Rate: {report['files_per_second']} files/s")
+        print("-" * 50)
+        return report
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing documents: {str(e)}")
+    finally:
+        await run_io(shutil.rmtree, work_dir, True)
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Get the status and progress of an ingest job.
+    
+    Args:
+        job_id: ID returned by ``POST /documents``
+        
+    Returns:
+        The job, with ``progress`` counting pages extracted, chunks split and
+        chunks embedded and stored
+    """
+    job = await get_ingest_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_response(job)
+
+@router.get("/jobs")
+async def list_jobs(
+    status: Optional[str] = Query(None, pattern="^(queued|running|completed|failed)$"),
+    limit: int = Query(50, ge=1, le=1000)
+):
+    """
+    List the most recent ingest jobs, newest first.
+    
+    Args:
+        status: Only jobs with this status
+        limit: Maximum jobs to return
+        
+    Returns:
+        The jobs
+    """
+    jobs = await get_ingest_jobs().recent(limit=limit, status=status)
+    return {"jobs": [_job_response(job) for job in jobs]}
+
 @router.post("/query", response_model=str)
 async def query_rag(request: QueryRequest):
     """
@@ -149,26 +484,166 @@ async def query_rag(request: QueryRequest):
         
         return response.get("answer", "No answer found")
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
 
+@router.post("/query/stream")
+async def query_rag_stream(request: QueryRequest):
+    """
+    Query the RAG pipeline and stream the answer as Server-Sent Events.
+    
+    The sources are sent first (``event: sources``), followed by the answer
+    as it is generated (``event: token``) and a final ``event: done``.
+    
+    Args:
+        request: The query request containing the question text
+        
+    Returns:
+        text/event-stream response
+    """
+    if not request.text.strip():
+        raise HTTPException(status_code=400, detail="Query text cannot be empty")
+    
+    rag_pipeline = get_rag_pipeline()
+    events = rag_pipeline.query_stream(request.text)
+    try:
+        # Retrieve before responding so retrieval errors still return a 500
+        first_event = await events.__anext__()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
+    
+    print(f"🔍 Streaming query received:")
+    print(f"   ❓ Question: {request.text}")
+    print(f"   📖 Sources found: {len(first_event.get('sources', []))}")
+    print("-" * 50)
+    
+    async def event_stream():
+        yield _sse_event(first_event)
+        async for event in events:
+            yield _sse_event(event)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _sse_event(event: dict) -> str:
+    """Format a query event as a Server-Sent Event."""
+    payload = {key: value for key, value in event.items() if key != "type"}
+    return f"event: {event['type']}\ndata: {json.dumps(payload)}\n\n"
+
+async def _deliver_transcription(websocket: WebSocket, sequence: int, transcription: str, info: dict) -> asyncio.Future:
+    """
+    Send a stream's transcription to the client and queue it for indexing
+    (called in order).
+    
+    Returns:
+        Future resolving to the transcription ID once it is queryable
+    """
+    timestamp = datetime.now().isoformat()
+    
+    # Send transcription back to client
+    response = {
+        "type": "transcription",
+        "text": transcription,
+        "sequence": sequence,
+        "lag_ms": info["lag_ms"],
+        "timestamp": timestamp
+    }
+    await websocket.send_text(json.dumps(response))
+    
+    # Print transcription to terminal
+    print(f"🎤 Audio transcription:")
+    print(f"   📝 Text: {transcription}")
+    print(f"   ⏰ Timestamp: {datetime.now().strftime('%H:%M:%S')}")
+    print(f"   🐢 Lag: {info['lag_ms']} ms")
+    print("-" * 30)
+    
+    # Save transcription to RAG pipeline as context in the background
+    return await get_transcription_indexer().submit(
+        text=transcription,
+        timestamp=timestamp,
+        source="audio_stream"
+    )
+
+async def _notify_indexed(websocket: WebSocket, sequence: int, indexed: asyncio.Future):
+    """Tell the client when a transcription has become queryable."""
+    try:
+        transcription_id = await indexed
+    except Exception as e:
+        logger.error(f"Error saving transcription to RAG: {e}")
+        await websocket.send_text(json.dumps({
+            "type": "index_error",
+            "sequence": sequence,
+            "message": str(e)
+        }))
+        return
+    await websocket.send_text(json.dumps({
+        "type": "indexed",
+        "sequence": sequence,
+        "transcription_id": transcription_id
+    }))
+
 @router.websocket("/audio")
 async def websocket_audio_endpoint(websocket: WebSocket):
     """
     WebSocket endpoint for real-time audio processing.
     
-    Accepts audio data and returns transcriptions.
+    Accepts audio data and returns transcriptions. Frames are queued into a
+    per-stream pipeline that transcribes several segments concurrently and
+    replies in sequence order. Two protocols are supported:
+    
+    - JSON mode: text frames ``{"type": "audio_data", "data": <base64 PCM>, ...}``
+    - Binary mode: one text frame ``{"type": "start", "format": "pcm_s16le",
+      "sample_rate": 16000, "channels": 1}``, answered with ``{"type": "ready"}``,
+      followed by raw PCM in binary frames
     """
     await websocket.accept()
-    print(f"🔌 WebSocket connection established for audio processing at {datetime.now().strftime('%H:%M:%S')}")
+    
+    audio_sessions = get_audio_sessions()
+    try:
+        session_id, audio_processor = audio_sessions.open_session()
+    except RuntimeError as e:
+        await websocket.send_text(json.dumps({"type": "error", "message": str(e)}))
+        await websocket.close(code=1013)
+        return
+    print(f"🔌 WebSocket connection established for audio processing at {datetime.now().strftime('%H:%M:%S')} (session {session_id})")
+    
+    # Format announced by a binary-mode "start" message
+    binary_format = None
+    
+    # Tasks that report when delivered transcriptions become queryable
+    notifications = set()
+    
+    async def deliver(sequence: int, transcription: str, info: dict):
+        indexed = await _deliver_transcription(websocket, sequence, transcription, info)
+        task = asyncio.ensure_future(_notify_indexed(websocket, sequence, indexed))
+        notifications.add(task)
+        task.add_done_callback(notifications.discard)
+    
+    pipeline = AudioStreamPipeline(audio_processor, deliver)
+    pipeline.start()
+    stopped = False
     
     try:
         while True:
             # Receive message from client
-            message = await websocket.receive_text()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
             
             try:
-                data = json.loads(message)
+                if message.get("bytes") is not None:
+                    # Binary mode: raw PCM frame
+                    if binary_format is None:
+                        raise ValueError("Send a 'start' message with the audio format before binary frames")
+                    await pipeline.submit(message["bytes"], binary_format)
+                    continue
+                
+                data = json.loads(message.get("text") or "")
                 
                 # Handle different message types
                 if data.get("type") == "audio_data":
@@ -184,45 +659,33 @@ async def websocket_audio_endpoint(websocket: WebSocket):
                     if audio_base64:
                         # Decode base64 audio data
                         audio_bytes = base64.b64decode(audio_base64)
-                        
-                        # Process audio through the audio processor
-                        audio_processor = get_audio_processor()
-                        transcription = await audio_processor.process_audio_chunk(
-                            audio_bytes, format_info
-                        )
-                        
-                        if transcription:
-                            # Save transcription to RAG pipeline as context
-                            rag_pipeline = get_rag_pipeline()
-                            try:
-                                transcription_id = await rag_pipeline.add_transcription(
-                                    text=transcription,
-                                    timestamp=datetime.now().isoformat(),
-                                    source="audio_stream"
-                                )
-                            except Exception as e:
-                                logger.error(f"Error saving transcription to RAG: {e}")
-                            
-                            # Print transcription to terminal
-                            print(f"🎤 Audio transcription:")
-                            print(f"   📝 Text: {transcription}")
-                            print(f"   ⏰ Timestamp: {datetime.now().strftime('%H:%M:%S')}")
-                            print("-" * 30)
-                            
-                            # Send transcription back to client
-                            response = {
-                                "type": "transcription",
-                                "text": transcription,
-                                "timestamp": datetime.now().isoformat()
-                            }
-                            await websocket.send_text(json.dumps(response))
+                        await pipeline.submit(audio_bytes, format_info)
+                
+                elif data.get("type") == "start":
+                    # Switch to binary mode with the announced format
+                    if data.get("format", "pcm_s16le") != "pcm_s16le":
+                        raise ValueError("Binary mode only supports pcm_s16le audio")
+                    binary_format = {
+                        "format": "pcm_s16le",
+                        "channels": data.get("channels", 1),
+                        "sample_rate": data.get("sample_rate", 16000)
+                    }
+                    await websocket.send_text(json.dumps({"type": "ready", **binary_format}))
                 
                 elif data.get("type") == "ping":
                     # Respond to ping with pong
                     await websocket.send_text(json.dumps({"type": "pong"}))
                 
+                elif data.get("type") == "stats":
+                    # Report queue depths and lag behind real time
+                    await websocket.send_text(json.dumps({"type": "stats", **pipeline.stats()}))
+                
                 elif data.get("type") == "stop":
-                    # Handle stop signal
+                    # Handle stop signal: deliver what is still in flight first
+                    await pipeline.close()
+                    stopped = True
+                    # Report readiness for the final transcriptions
+                    await asyncio.gather(*notifications, return_exceptions=True)
                     break
                     
             except json.JSONDecodeError:
@@ -246,46 +709,79 @@ async def websocket_audio_endpoint(websocket: WebSocket):
     except Exception as e:
         print(f"❌ WebSocket error: {e}")
     finally:
-        # Clean up any resources
-        audio_processor = get_audio_processor()
-        await audio_processor.cleanup()
-        print(f"🧹 Audio processor cleanup completed at {datetime.now().strftime('%H:%M:%S')}")
+        if not stopped:
+            await pipeline.abort()
+        # Indexing carries on in the background; only the notifications stop
+        for task in list(notifications):
+            task.cancel()
+        print(f"📈 Stream stats: {pipeline.stats()}")
+        # Release this connection's session
+        await audio_sessions.close_session(session_id)
+        print(f"🧹 Audio session {session_id} cleanup completed at {datetime.now().strftime('%H:%M:%S')}")
 
 @router.get("/health")
 async def health_check():
     """
-    Health check endpoint.
+    Liveness check.
+    
+    Constant-time: does not load the RAG pipeline or touch the vector store,
+    so it is safe for frequent container healthchecks.
     
     Returns:
         Service status information
     """
-    try:
-        # Check RAG pipeline and get counts
-        rag_pipeline = get_rag_pipeline()
-        documents = await rag_pipeline.list_documents()
-        transcriptions = await rag_pipeline.list_transcriptions()
-        
-        return {
-            "status": "healthy",
-            "service": "Real-Time Audio RAG Agent",
-            "timestamp": datetime.now().isoformat(),
-            "components": {
-                "audio_processor": "operational",
-                "rag_pipeline": "operational",
-                "transcription_system": "operational"
-            },
-            "data": {
-                "documents_count": len(documents),
-                "transcriptions_count": len(transcriptions)
-            }
-        }
-    except Exception as e:
-        return {
-            "status": "unhealthy",
-            "service": "Real-Time Audio RAG Agent",
-            "timestamp": datetime.now().isoformat(),
-            "error": str(e)
+    return {
+        "status": "healthy",
+        "service": "Real-Time Audio RAG Agent",
+        "timestamp": datetime.now().isoformat()
+    }
+
+@router.get("/ready")
+async def readiness_check():
+    """
+    Readiness check with component state and cached metrics.
+    
+    Reports counters the pipeline keeps up to date on add/delete, whether
+    the embedding model is loaded, executor queue depths, cache statistics
+    and last-ingest latency. Nothing is scanned and nothing is loaded, so
+    the probe costs the same on any corpus size.
+    
+    Returns:
+        200 when the RAG pipeline is loaded, otherwise 503 with Retry-After
+        (``status`` is "warming_up" while the startup warm-up runs)
+    """
+    rag_ready = _rag_pipeline is not None
+    warmup = _warmup_state()
+    body = {
+        "status": "ready" if rag_ready else ("warming_up" if warmup["state"] == "warming_up" else "not_ready"),
+        "service": "Real-Time Audio RAG Agent",
+        "timestamp": datetime.now().isoformat(),
+        "components": {
+            "rag_pipeline": "loaded" if rag_ready else "not_loaded",
+            "audio_sessions": "loaded" if _audio_sessions is not None else "not_loaded",
+            "transcription_indexer": "running" if _transcription_indexer is not None else "idle",
+            "ingest_jobs": "running" if _ingest_jobs is not None else "idle"
+        },
+        "warmup": warmup,
+        "rag": _rag_pipeline.stats() if rag_ready else None,
+        "executors": executor_stats(),
+        "audio_sessions": _audio_sessions.stats() if _audio_sessions is not None else {
+            "active_sessions": 0,
+            "buffered_bytes": 0,
+            "dropped_bytes": 0
+        },
+        "transcription_indexing": _transcription_indexer.stats() if _transcription_indexer is not None else {
+            "queue_depth": 0,
+            "indexed": 0
+        },
+        "ingest_jobs": _ingest_jobs.stats() if _ingest_jobs is not None else {
+            "queue_depth": 0,
+            "running": 0
         }
+    }
+    if rag_ready:
+        return JSONResponse(status_code=200, content=body)
+    return JSONResponse(status_code=503, content=body, headers={"Retry-After": str(WARMUP_RETRY_AFTER_SECONDS)})
 
 @router.delete("/transcriptions/{transcription_id}")
 async def delete_transcription(transcription_id: str):
@@ -308,6 +804,8 @@ async def delete_transcription(transcription_id: str):
         else:
             raise HTTPException(status_code=404, detail="Transcription not found")
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting transcription: {str(e)}")
 
@@ -332,35 +830,59 @@ async def delete_document(document_id: str):
         else:
             raise HTTPException(status_code=404, detail="Document not found")
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting document: {str(e)}")
 
 @router.get("/transcriptions")
-async def list_transcriptions():
+async def list_transcriptions(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None
+):
     """
-    List all audio transcriptions in the RAG pipeline.
+    List audio transcriptions in the RAG pipeline, oldest first.
+    
+    Args:
+        limit: Maximum transcriptions per page
+        cursor: ``next_cursor`` from the previous page
     
     Returns:
-        List of transcriptions with metadata
+        A page of transcriptions with metadata and the next page's cursor
     """
     try:
         rag_pipeline = get_rag_pipeline()
-        transcriptions = await rag_pipeline.list_transcriptions()
-        return {"transcriptions": transcriptions}
+        transcriptions, next_cursor = await rag_pipeline.page_transcriptions(limit=limit, cursor=cursor)
+        return {"transcriptions": transcriptions, "next_cursor": next_cursor}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing transcriptions: {str(e)}")
 
 @router.get("/documents")
-async def list_documents():
+async def list_documents(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None
+):
     """
-    List all uploaded documents in the RAG pipeline.
+    List uploaded documents in the RAG pipeline, oldest first.
+    
+    Args:
+        limit: Maximum documents per page
+        cursor: ``next_cursor`` from the previous page
     
     Returns:
-        List of documents with metadata
+        A page of documents with metadata and the next page's cursor
     """
     try:
         rag_pipeline = get_rag_pipeline()
-        documents = await rag_pipeline.list_documents()
-        return {"documents": documents}
+        documents, next_cursor = await rag_pipeline.page_documents(limit=limit, cursor=cursor)
+        return {"documents": documents, "next_cursor": next_cursor}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing documents: {str(e)}")
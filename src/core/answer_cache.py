@@ -0,0 +1,185 @@
+"""
+Semantic cache of generated answers, keyed on question similarity and the
+retrieved chunks.
+"""
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from core.config import config
+
+ChunkKey = Tuple[str, ...]
+
+class _Entry:
+    __slots__ = ("chunk_ids", "embedding", "answer", "created_at")
+
+    def __init__(self, chunk_ids: ChunkKey, embedding: np.ndarray, answer: Dict[str, Any], created_at: float):
+        self.chunk_ids = chunk_ids
+        self.embedding = embedding
+        self.answer = answer
+        self.created_at = created_at
+
+class SemanticAnswerCache:
+    """
+    Reuses an answer when a new question retrieves exactly the same chunks and
+    its embedding is within ``similarity_threshold`` (cosine) of a question
+    that was already answered.
+
+    Because the retrieved chunk IDs are part of the key, a changed corpus that
+    changes retrieval can never hit a stale entry. Entries are additionally
+    dropped when any of their chunks is added or deleted (``invalidate``),
+    when they are older than ``ttl_seconds``, and least recently used first
+    once ``max_entries`` is reached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = None,
+        ttl_seconds: float = None,
+        similarity_threshold: float = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Most answers kept (0 disables the cache)
+            ttl_seconds: Maximum age of a reused answer
+            similarity_threshold: Minimum cosine similarity between questions
+        """
+        self.max_entries = max(0, config.ANSWER_CACHE_SIZE if max_entries is None else max_entries)
+        self.ttl_seconds = config.ANSWER_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.similarity_threshold = (
+            config.ANSWER_CACHE_SIMILARITY if similarity_threshold is None else similarity_threshold
+        )
+
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._by_chunks: Dict[ChunkKey, Set[int]] = {}
+        self._by_chunk_id: Dict[str, Set[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _unit(embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding: Sequence[float], chunk_ids: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        Return a cached answer for this question and retrieval, if any.
+
+        Args:
+            embedding: The question's embedding
+            chunk_ids: IDs of the retrieved chunks, in retrieval order
+
+        Returns:
+            The cached answer, or None on a miss
+        """
+        if not self.max_entries:
+            return None
+        key = tuple(chunk_ids)
+        query = self._unit(embedding)
+        now = time.monotonic()
+        with self._lock:
+            best_id, best_score = None, self.similarity_threshold
+            for entry_id in list(self._by_chunks.get(key, ())):
+                entry = self._entries[entry_id]
+                if now - entry.created_at > self.ttl_seconds:
+                    self._remove(entry_id)
+                    self.expirations += 1
+                    continue
+                score = float(np.dot(query, entry.embedding))
+                if score >= best_score:
+                    best_id, best_score = entry_id, score
+            if best_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best_id)
+            self.hits += 1
+            return self._entries[best_id].answer
+
+    def store(self, embedding: Sequence[float], chunk_ids: Sequence[str], answer: Dict[str, Any]):
+        """
+        Cache an answer generated for this question and retrieval.
+
+        Args:
+            embedding: The question's embedding
+            chunk_ids: IDs of the retrieved chunks, in retrieval order
+            answer: The query result to reuse
+        """
+        if not self.max_entries:
+            return
+        key = tuple(chunk_ids)
+        entry = _Entry(key, self._unit(embedding), answer, time.monotonic())
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = entry
+            self._by_chunks.setdefault(key, set()).add(entry_id)
+            for chunk_id in set(key):
+                self._by_chunk_id.setdefault(chunk_id, set()).add(entry_id)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, chunk_ids: Iterable[str]) -> int:
+        """
+        Drop every answer that was built from any of these chunks.
+
+        Args:
+            chunk_ids: IDs of chunks that were added, changed or deleted
+
+        Returns:
+            Number of answers dropped
+        """
+        with self._lock:
+            stale: Set[int] = set()
+            for chunk_id in chunk_ids:
+                stale |= self._by_chunk_id.get(chunk_id, set())
+            for entry_id in stale:
+                self._remove(entry_id)
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self):
+        """Drop all cached answers."""
+        with self._lock:
+            self._entries.clear()
+            self._by_chunks.clear()
+            self._by_chunk_id.clear()
+
+    def _remove(self, entry_id: int):
+        entry = self._entries.pop(entry_id)
+        siblings = self._by_chunks[entry.chunk_ids]
+        siblings.discard(entry_id)
+        if not siblings:
+            del self._by_chunks[entry.chunk_ids]
+        for chunk_id in set(entry.chunk_ids):
+            owners = self._by_chunk_id[chunk_id]
+            owners.discard(entry_id)
+            if not owners:
+                del self._by_chunk_id[chunk_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size, hit/miss and eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "expirations": self.expirations,
+            "evictions": self.evictions
+        }
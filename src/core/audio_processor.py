@@ -1,14 +1,13 @@
 """
 Audio processing module for real-time transcription using Groq Whisper.
 """
-import os
-import io
-import wave
-import tempfile
-import asyncio
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 import logging
-from groq import Groq
+
+from core.config import config
+from core.transcription import TranscriptionService
+from core.vad_segmenter import SUPPORTED_SAMPLE_RATES, VADSegmenter, vad_available
+from core.wav import WavPayload
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +16,33 @@ class AudioProcessor:
     Handles real-time audio processing and transcription using Groq Whisper.
     """
     
-    def __init__(self):
-        """Initialize the audio processor with Groq client."""
-        self.groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+    def __init__(
+        self,
+        transcriber: TranscriptionService,
+        max_buffer_size: Optional[int] = None,
+        use_vad: Optional[bool] = None
+    ):
+        """
+        Initialize the audio processor with a transcription service.
+        
+        Args:
+            transcriber: Shared transcription service (owned by the caller)
+            max_buffer_size: Upper bound on buffered PCM bytes; oldest audio is
+                dropped beyond it (defaults to four max-size chunks)
+            use_vad: Cut speech segments with webrtcvad instead of fixed byte
+                counts (defaults to AUDIO_VAD_ENABLED; needs mono audio)
+        """
+        self.transcriber = transcriber
         self.buffer = bytearray()
         self.min_chunk_size = 32000  # Minimum bytes for processing (~1 second at 16kHz)
         self.max_chunk_size = 320000  # Maximum bytes (~10 seconds at 16kHz)
+        self.max_buffer_size = max_buffer_size or self.max_chunk_size * 4
+        self.dropped_bytes = 0
+        self.use_vad = config.AUDIO_VAD_ENABLED if use_vad is None else use_vad
+        if self.use_vad and not vad_available():
+            logger.warning("webrtcvad not installed, falling back to fixed-size audio chunks")
+            self.use_vad = False
+        self.segmenter: Optional[VADSegmenter] = None
         
     async def process_audio_chunk(self, audio_bytes: bytes, format_info: Dict[str, Any]) -> Optional[str]:
         """
@@ -36,39 +56,133 @@ class AudioProcessor:
             Transcribed text or None if no speech detected
         """
         try:
-            # Add new audio data to buffer
-            self.buffer.extend(audio_bytes)
+            sample_rate = format_info.get("sample_rate", 16000)
+            channels = format_info.get("channels", 1)
             
-            # Check if we have enough data to process
-            if len(self.buffer) < self.min_chunk_size:
+            segments = self.segment_audio(audio_bytes, format_info)
+            if not segments:
                 return None
             
-            # Extract chunk to process (up to max_chunk_size)
-            chunk_size = min(len(self.buffer), self.max_chunk_size)
-            audio_chunk = bytes(self.buffer[:chunk_size])
+            texts = []
+            for segment in segments:
+                text = await self.transcribe_segment(segment, sample_rate, channels)
+                if text:
+                    texts.append(text)
             
-            # Remove processed data from buffer
-            self.buffer = self.buffer[chunk_size:]
+            return " ".join(texts) or None
             
-            # Convert to WAV format for Whisper
-            wav_data = self._convert_to_wav(
-                audio_chunk, 
-                format_info.get("sample_rate", 16000),
-                format_info.get("channels", 1)
-            )
+        except Exception as e:
+            logger.error(f"Error processing audio chunk: {e}")
+            return None
+    
+    def segment_audio(self, audio_bytes: bytes, format_info: Dict[str, Any]) -> List[bytes]:
+        """
+        Buffer incoming audio and return any segments ready for transcription.
+        
+        Args:
+            audio_bytes: Raw audio data
+            format_info: Audio format information (sample_rate, channels, etc.)
             
-            # Transcribe with Groq Whisper
-            transcription = await self._transcribe_audio(wav_data)
+        Returns:
+            PCM segments to transcribe, oldest first
+        """
+        # Add new audio data to buffer
+        self.buffer.extend(audio_bytes)
+        
+        # Keep memory bounded by dropping the oldest audio (whole 16-bit samples)
+        overflow = len(self.buffer) - self.max_buffer_size
+        if overflow > 0:
+            overflow += overflow % 2
+            del self.buffer[:overflow]
+            self.dropped_bytes += overflow
+            logger.warning(f"Audio buffer full, dropped {overflow} bytes of oldest audio")
+        
+        return self._next_segments(
+            format_info.get("sample_rate", 16000),
+            format_info.get("channels", 1)
+        )
+    
+    def flush_segments(self) -> List[bytes]:
+        """Return whatever speech is still buffered, e.g. when a stream stops."""
+        if self.segmenter is not None:
+            segment = self.segmenter.flush()
+            return [segment] if segment else []
+        if len(self.buffer) < self.min_chunk_size:
+            return []
+        segment = bytes(self.buffer)
+        self.buffer.clear()
+        return [segment]
+    
+    async def transcribe_segment(self, segment: bytes, sample_rate: int, channels: int) -> Optional[str]:
+        """
+        Transcribe one PCM segment.
+        
+        Args:
+            segment: Raw 16-bit PCM
+            sample_rate: Sample rate in Hz
+            channels: Number of audio channels
             
-            return transcription
+        Returns:
+            Transcribed text or None if nothing useful was said
+        """
+        # Convert to WAV format and transcribe with Groq Whisper
+        wav_data = self._convert_to_wav(segment, sample_rate, channels)
+        return await self._transcribe_audio(wav_data)
+    
+    def _next_segments(self, sample_rate: int, channels: int) -> List[bytes]:
+        """
+        Cut buffered audio into segments ready for transcription.
+        
+        With VAD, only speech segments ending at a pause (or at the maximum
+        length) are returned; otherwise the buffer is cut at fixed sizes.
+        
+        Args:
+            sample_rate: Sample rate in Hz
+            channels: Number of audio channels
             
-        except Exception as e:
-            logger.error(f"Error processing audio chunk: {e}")
+        Returns:
+            PCM segments to transcribe, oldest first
+        """
+        segmenter = self._get_segmenter(sample_rate, channels)
+        if segmenter is not None:
+            segments = segmenter.feed(self.buffer)
+            self.buffer.clear()
+            return segments
+        
+        # Check if we have enough data to process
+        if len(self.buffer) < self.min_chunk_size:
+            return []
+        
+        # Extract chunk to process (up to max_chunk_size)
+        chunk_size = min(len(self.buffer), self.max_chunk_size)
+        with memoryview(self.buffer) as view:
+            audio_chunk = bytes(view[:chunk_size])
+        
+        # Remove processed data from buffer in place
+        del self.buffer[:chunk_size]
+        return [audio_chunk]
+    
+    def _get_segmenter(self, sample_rate: int, channels: int) -> Optional[VADSegmenter]:
+        """Return a VAD segmenter for this format, or None to use fixed cuts."""
+        if not self.use_vad or channels != 1 or sample_rate not in SUPPORTED_SAMPLE_RATES:
             return None
+        if self.segmenter is None or self.segmenter.sample_rate != sample_rate:
+            self.segmenter = VADSegmenter(
+                sample_rate=sample_rate,
+                max_segment_bytes=self.max_chunk_size
+            )
+        return self.segmenter
+    
+    def buffered_bytes(self) -> int:
+        """Return the PCM bytes currently held for this stream."""
+        held = len(self.buffer)
+        if self.segmenter is not None:
+            held += self.segmenter.buffered_bytes()
+        return held
     
-    def _convert_to_wav(self, audio_data: bytes, sample_rate: int, channels: int) -> bytes:
+    def _convert_to_wav(self, audio_data: bytes, sample_rate: int, channels: int) -> WavPayload:
         """
-        Convert PCM audio data to WAV format.
+        Wrap PCM audio data in an in-memory WAV payload.
         
         Args:
             audio_data: Raw PCM audio bytes
@@ -76,63 +190,40 @@ class AudioProcessor:
             channels: Number of audio channels
             
         Returns:
-            WAV formatted audio data
+            WAV file object streaming header plus PCM without copying
         """
         try:
-            # Create WAV file in memory
-            wav_buffer = io.BytesIO()
-            
-            with wave.open(wav_buffer, 'wb') as wav_file:
-                wav_file.setnchannels(channels)
-                wav_file.setsampwidth(2)  # 16-bit audio
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(audio_data)
-            
-            wav_buffer.seek(0)
-            return wav_buffer.read()
+            return WavPayload(audio_data, sample_rate, channels)
             
         except Exception as e:
             logger.error(f"Error converting to WAV: {e}")
             raise
     
-    async def _transcribe_audio(self, wav_data: bytes) -> Optional[str]:
+    async def _transcribe_audio(self, wav_data: WavPayload) -> Optional[str]:
         """
         Transcribe audio using Groq Whisper API.
         
         Args:
-            wav_data: WAV formatted audio data
+            wav_data: In-memory WAV payload
             
         Returns:
             Transcribed text or None
         """
         try:
-            # Create temporary file for Groq API
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_file.write(wav_data)
-                temp_file_path = temp_file.name
+            # Transcribe with Groq off the event loop
+            transcription = await self.transcriber.transcribe(
+                wav_data,
+                language="en"  # Specify language for better performance
+            )
             
-            try:
-                # Transcribe with Groq
-                with open(temp_file_path, "rb") as audio_file:
-                    transcription = self.groq_client.audio.transcriptions.create(
-                        file=audio_file,
-                        model="whisper-large-v3",
-                        language="en",  # Specify language for better performance
-                        response_format="text"
-                    )
-                
-                # Clean up transcription text
-                text = transcription.strip()
-                
-                # Filter out very short or meaningless transcriptions
-                if len(text) < 3 or text.lower() in ["thank you.", "thanks.", "you"]:
-                    return None
-                
-                return text
-                
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_file_path)
+            # Clean up transcription text
+            text = transcription.strip()
+            
+            # Filter out very short or meaningless transcriptions
+            if len(text) < 3 or text.lower() in ["thank you.", "thanks.", "you"]:
+                return None
+            
+            return text
                 
         except Exception as e:
             logger.error(f"Error transcribing audio: {e}")
@@ -143,6 +234,8 @@ class AudioProcessor:
         try:
             # Clear the buffer
             self.buffer.clear()
+            if self.segmenter is not None:
+                self.segmenter.reset()
             logger.info("Audio processor cleaned up")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
@@ -0,0 +1,103 @@
+"""
+Per-connection audio session management for real-time transcription.
+"""
+import uuid
+from typing import Dict, Optional, Tuple, Any
+import logging
+
+from core.audio_processor import AudioProcessor
+from core.config import config
+from core.transcription import GroqClientPool, TranscriptionService
+
+logger = logging.getLogger(__name__)
+
+class AudioSessionManager:
+    """
+    Gives every audio WebSocket its own AudioProcessor with a bounded buffer.
+    """
+
+    def __init__(
+        self,
+        client_pool: Optional[GroqClientPool] = None,
+        max_sessions: int = None,
+        max_buffer_size: int = None,
+        transcriber: Optional[TranscriptionService] = None,
+        use_vad: Optional[bool] = None
+    ):
+        """
+        Initialize the session manager.
+
+        Args:
+            client_pool: Pool of Groq clients shared across sessions
+            max_sessions: Maximum number of concurrent sessions
+            max_buffer_size: Maximum buffered PCM bytes per session
+            transcriber: Shared transcription service (built on client_pool if omitted)
+            use_vad: Use voice-activity segmentation (defaults to AUDIO_VAD_ENABLED)
+        """
+        self._owns_transcriber = transcriber is None
+        self.transcriber = transcriber or TranscriptionService(client_pool=client_pool)
+        self.max_sessions = max_sessions or config.AUDIO_MAX_SESSIONS
+        self.max_buffer_size = max_buffer_size or config.AUDIO_SESSION_MAX_BUFFER_BYTES
+        self.use_vad = use_vad
+        self.sessions: Dict[str, AudioProcessor] = {}
+
+    def open_session(self) -> Tuple[str, AudioProcessor]:
+        """
+        Create a new audio session.
+
+        Returns:
+            Tuple of (session ID, the session's AudioProcessor)
+
+        Raises:
+            RuntimeError: If the maximum number of sessions is already open
+        """
+        if len(self.sessions) >= self.max_sessions:
+            raise RuntimeError(f"Too many concurrent audio sessions (max {self.max_sessions})")
+
+        session_id = str(uuid.uuid4())
+        processor = AudioProcessor(
+            transcriber=self.transcriber,
+            max_buffer_size=self.max_buffer_size,
+            use_vad=self.use_vad
+        )
+        self.sessions[session_id] = processor
+        logger.info(f"Opened audio session {session_id} ({len(self.sessions)} active)")
+        return session_id, processor
+
+    def get_session(self, session_id: str) -> Optional[AudioProcessor]:
+        """Return the processor for a session, or None if it is not open."""
+        return self.sessions.get(session_id)
+
+    async def close_session(self, session_id: str) -> bool:
+        """
+        Close a session and release its buffer.
+
+        Args:
+            session_id: ID returned by open_session
+
+        Returns:
+            True if the session existed, False otherwise
+        """
+        processor = self.sessions.pop(session_id, None)
+        if processor is None:
+            return False
+        await processor.cleanup()
+        logger.info(f"Closed audio session {session_id} ({len(self.sessions)} active)")
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Return session counters for monitoring."""
+        return {
+            "active_sessions": len(self.sessions),
+            "max_sessions": self.max_sessions,
+            "buffered_bytes": sum(p.buffered_bytes() for p in self.sessions.values()),
+            "dropped_bytes": sum(p.dropped_bytes for p in self.sessions.values()),
+            "transcription": self.transcriber.stats()
+        }
+
+    async def shutdown(self):
+        """Close every open session and stop the transcription service if owned."""
+        for session_id in list(self.sessions):
+            await self.close_session(session_id)
+        if self._owns_transcriber:
+            self.transcriber.shutdown()
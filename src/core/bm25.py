@@ -0,0 +1,251 @@
+"""
+Incremental BM25 keyword index over chunk text, and reciprocal rank fusion.
+"""
+import os
+import re
+import math
+import sqlite3
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Frequent words carry no keyword signal and have the longest posting lists
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have he her his i in is it its me my no not of on or our "
+    "she so that the their them there they this to was we were what when where which who will with you your".split()
+)
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of a text, without stopwords."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = 60) -> List[str]:
+    """
+    Merge rankings by reciprocal rank fusion.
+
+    Each ID scores ``sum(1 / (k + rank))`` over the rankings it appears in
+    (rank starting at 1), so items ranked well by several retrievers rise to
+    the top without comparing their raw scores.
+
+    Args:
+        rankings: ID lists, best first
+        k: Damping constant; larger values flatten the rank differences
+
+    Returns:
+        Every ID, best fused score first (ties keep first-seen order)
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores, key=lambda item_id: -scores[item_id])
+
+class BM25Index:
+    """
+    BM25 over chunk text, updated as chunks are added and deleted.
+
+    Postings (term -> chunk -> term frequency) live in memory and are scored
+    with numpy; every chunk's term frequencies are also written to a SQLite
+    database next to the ChromaDB directory, from which the postings are
+    rebuilt on start. Chunks are numbered internally in insertion order;
+    numbers of deleted chunks are not reused until the next load.
+    """
+
+    def __init__(self, path: str, k1: float = 1.2, b: float = 0.75):
+        """
+        Open (or create) the index.
+
+        Args:
+            path: SQLite database file
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self.created = not os.path.exists(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                " chunk_id TEXT PRIMARY KEY,"
+                " length INTEGER NOT NULL,"
+                " terms TEXT NOT NULL)"
+            )
+
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._numbers: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = []
+        self._lengths = np.zeros(1024, dtype=np.float32)
+        self._total_length = 0
+        self._load()
+
+    @staticmethod
+    def _encode(frequencies: Dict[str, int]) -> str:
+        return " ".join(f"{term}:{count}" for term, count in frequencies.items())
+
+    @staticmethod
+    def _decode(terms: str) -> Dict[str, int]:
+        frequencies = {}
+        for pair in terms.split():
+            term, count = pair.rsplit(":", 1)
+            frequencies[term] = int(count)
+        return frequencies
+
+    def _load(self):
+        rows = self._conn.execute("SELECT chunk_id, length, terms FROM chunks").fetchall()
+        for chunk_id, length, terms in rows:
+            self._insert(chunk_id, length, self._decode(terms))
+        if rows:
+            logger.info(f"Loaded BM25 index with {len(rows)} chunks and {len(self._postings)} terms")
+
+    def _insert(self, chunk_id: str, length: int, frequencies: Dict[str, int]):
+        number = len(self._ids)
+        if number >= len(self._lengths):
+            self._lengths = np.concatenate([self._lengths, np.zeros(len(self._lengths), dtype=np.float32)])
+        self._ids.append(chunk_id)
+        self._numbers[chunk_id] = number
+        self._lengths[number] = length
+        self._total_length += length
+        for term, count in frequencies.items():
+            self._postings.setdefault(term, {})[number] = count
+
+    def add(self, chunk_ids: Sequence[str], texts: Sequence[str]):
+        """
+        Index chunks; a chunk ID that is already indexed is replaced.
+
+        Args:
+            chunk_ids: IDs of the chunks
+            texts: Chunk texts, in the same order
+        """
+        rows = []
+        with self._lock:
+            self._discard([chunk_id for chunk_id in chunk_ids if chunk_id in self._numbers])
+            for chunk_id, text in zip(chunk_ids, texts):
+                tokens = tokenize(text or "")
+                frequencies = dict(Counter(tokens))
+                self._insert(chunk_id, len(tokens), frequencies)
+                rows.append((chunk_id, len(tokens), self._encode(frequencies)))
+            with self._conn:
+                self._conn.executemany("INSERT OR REPLACE INTO chunks VALUES (?, ?, ?)", rows)
+
+    def remove(self, chunk_ids: Iterable[str]) -> int:
+        """
+        Drop chunks from the index; unknown IDs are ignored.
+
+        Returns:
+            Number of chunks removed
+        """
+        with self._lock:
+            known = [chunk_id for chunk_id in chunk_ids if chunk_id in self._numbers]
+            self._discard(known)
+            with self._conn:
+                self._conn.executemany("DELETE FROM chunks WHERE chunk_id = ?", [(chunk_id,) for chunk_id in known])
+        return len(known)
+
+    def _discard(self, chunk_ids: List[str]):
+        if not chunk_ids:
+            return
+        placeholders = ", ".join("?" for _ in chunk_ids)
+        stored = self._conn.execute(
+            f"SELECT chunk_id, terms FROM chunks WHERE chunk_id IN ({placeholders})", chunk_ids
+        ).fetchall()
+        for chunk_id, terms in stored:
+            number = self._numbers.pop(chunk_id)
+            for term in self._decode(terms):
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(number, None)
+                    if not postings:
+                        del self._postings[term]
+            self._total_length -= int(self._lengths[number])
+            self._lengths[number] = 0
+            self._ids[number] = None
+
+    def search(self, query: str, limit: int) -> List[Tuple[str, float]]:
+        """
+        Return the best matching chunks for a query.
+
+        Args:
+            query: Free text; every non-stopword token is a term
+            limit: Most results returned
+
+        Returns:
+            ``(chunk_id, score)`` pairs, best first; chunks sharing no term
+            with the query are never returned
+        """
+        with self._lock:
+            count = len(self._numbers)
+            if not count or limit <= 0:
+                return []
+            size = len(self._ids)
+            average_length = self._total_length / count or 1.0
+            norms = self.k1 * (1 - self.b + self.b * self._lengths[:size] / average_length)
+            scores = np.zeros(size, dtype=np.float32)
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                numbers = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+                frequencies = np.fromiter(postings.values(), dtype=np.float32, count=len(postings))
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                scores[numbers] += idf * frequencies * (self.k1 + 1) / (frequencies + norms[numbers])
+
+            matched = np.flatnonzero(scores)
+            if len(matched) > limit:
+                matched = matched[np.argpartition(-scores[matched], limit - 1)[:limit]]
+            best = matched[np.argsort(-scores[matched], kind="stable")]
+            return [(self._ids[number], float(scores[number])) for number in best]
+
+    def count(self) -> int:
+        """Return the number of indexed chunks."""
+        with self._lock:
+            return len(self._numbers)
+
+    def rebuild(self, collection: Any, page_size: int = 5000) -> int:
+        """
+        Re-index every chunk stored in a ChromaDB collection.
+
+        Args:
+            collection: The ChromaDB collection to read
+            page_size: Chunks read per request
+
+        Returns:
+            Number of indexed chunks
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM chunks")
+            self._postings, self._numbers, self._ids = {}, {}, []
+            self._lengths[:] = 0
+            self._total_length = 0
+            offset = 0
+            while True:
+                page = collection.get(include=["documents"], limit=page_size, offset=offset)
+                if not page["ids"]:
+                    break
+                self.add(page["ids"], page["documents"])
+                offset += len(page["ids"])
+        logger.info(f"Rebuilt BM25 index with {offset} chunks")
+        return offset
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index size counters."""
+        with self._lock:
+            return {"chunks": len(self._numbers), "terms": len(self._postings)}
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
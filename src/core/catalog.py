@@ -0,0 +1,206 @@
+"""
+Persistent catalog of ingested documents and transcriptions.
+"""
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Catalog:
+    """
+    One row per stored document or transcription, in a SQLite database kept
+    next to the ChromaDB directory.
+
+    The catalog answers dedupe lookups (unique ``(kind, content_hash)``),
+    listing and counting without touching ChromaDB. ``kind`` is
+    ``"document"`` or ``"transcription"``. Rows are listed in insertion order
+    and paginated with an opaque cursor, so listing uses constant memory.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the catalog.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self.created = not os.path.exists(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS items ("
+                " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " item_id TEXT NOT NULL UNIQUE,"
+                " kind TEXT NOT NULL,"
+                " content_hash TEXT NOT NULL,"
+                " name TEXT,"
+                " source TEXT,"
+                " chunk_count INTEGER NOT NULL,"
+                " created_at TEXT)"
+            )
+            self._conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS items_content ON items (kind, content_hash)"
+            )
+
+    def find_by_hash(self, kind: str, content_hash: str) -> Optional[str]:
+        """Return the ID of the item with this content, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT item_id FROM items WHERE kind = ? AND content_hash = ?",
+                (kind, content_hash)
+            ).fetchone()
+        return row["item_id"] if row else None
+
+    def find_many_by_hash(self, kind: str, content_hashes: Iterable[str]) -> Dict[str, str]:
+        """Return ``{content_hash: item_id}`` for the hashes that are stored."""
+        found = {}
+        with self._lock:
+            for content_hash in set(content_hashes):
+                row = self._conn.execute(
+                    "SELECT item_id FROM items WHERE kind = ? AND content_hash = ?",
+                    (kind, content_hash)
+                ).fetchone()
+                if row:
+                    found[content_hash] = row["item_id"]
+        return found
+
+    def add_items(self, kind: str, items: Iterable[Dict[str, Any]]):
+        """
+        Record stored items in one transaction.
+
+        Args:
+            kind: "document" or "transcription"
+            items: Dicts with item_id, content_hash, chunk_count and optional
+                name, source and created_at
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO items (item_id, kind, content_hash, name, source, chunk_count, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        item["item_id"], kind, item["content_hash"], item.get("name"),
+                        item.get("source"), item["chunk_count"], item.get("created_at")
+                    )
+                    for item in items
+                ]
+            )
+
+    def remove(self, item_id: str) -> bool:
+        """Forget a deleted item; returns True if it was catalogued."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM items WHERE item_id = ?", (item_id,))
+        return cursor.rowcount > 0
+
+    def get(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """Return the catalog row for an item, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM items WHERE item_id = ?", (item_id,)).fetchone()
+        return dict(row) if row else None
+
+    def page(self, kind: str, limit: int, cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Return one page of items of a kind, oldest first.
+
+        Args:
+            kind: "document" or "transcription"
+            limit: Maximum rows to return
+            cursor: ``next_cursor`` from the previous page, or None
+
+        Returns:
+            Tuple of (rows, cursor for the next page or None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            after = int(cursor) if cursor else 0
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM items WHERE kind = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (kind, after, limit + 1)
+            ).fetchall()
+        rows = [dict(row) for row in rows]
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, str(rows[-1]["seq"])
+        return rows, None
+
+    def count(self, kind: str = None) -> int:
+        """Return the number of catalogued items, optionally of one kind."""
+        with self._lock:
+            if kind is None:
+                return self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM items WHERE kind = ?", (kind,)).fetchone()[0]
+
+    def rebuild(self, collection: Any, page_size: int = 5000) -> int:
+        """
+        Repopulate the catalog from chunk metadata in a ChromaDB collection.
+
+        Args:
+            collection: The ChromaDB collection to read
+            page_size: Chunks read per request
+
+        Returns:
+            Number of catalogued items
+        """
+        items: Dict[str, Dict[str, Any]] = {}
+        offset = 0
+        while True:
+            page = collection.get(include=["metadatas"], limit=page_size, offset=offset)
+            if not page["ids"]:
+                break
+            for chunk_id, metadata in zip(page["ids"], page["metadatas"]):
+                if metadata.get("source_type") == "transcription":
+                    kind = "transcription"
+                    item_id = metadata.get("transcription_id", chunk_id)
+                    name = None
+                    created_at = metadata.get("timestamp")
+                else:
+                    kind = "document"
+                    item_id = metadata.get("document_id", chunk_id)
+                    name = metadata.get("filename")
+                    created_at = metadata.get("upload_time")
+                item = items.setdefault(item_id, {
+                    "item_id": item_id,
+                    "kind": kind,
+                    "content_hash": metadata.get("content_hash") or item_id,
+                    "name": name,
+                    "source": metadata.get("source"),
+                    "chunk_count": 0,
+                    "created_at": created_at
+                })
+                item["chunk_count"] += 1
+            offset += len(page["ids"])
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM items")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO items (item_id, kind, content_hash, name, source, chunk_count, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        item["item_id"], item["kind"], item["content_hash"], item["name"],
+                        item["source"], item["chunk_count"], item["created_at"]
+                    )
+                    for item in items.values()
+                ]
+            )
+        logger.info(f"Rebuilt catalog with {len(items)} items")
+        return len(items)
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -27,9 +27,35 @@ class Config:
     AUDIO_SAMPLE_RATE: int = int(os.getenv("AUDIO_SAMPLE_RATE", "16000"))
     AUDIO_CHANNELS: int = int(os.getenv("AUDIO_CHANNELS", "1"))
     AUDIO_CHUNK_SIZE: int = int(os.getenv("AUDIO_CHUNK_SIZE", "4096"))
+    AUDIO_MAX_SESSIONS: int = int(os.getenv("AUDIO_MAX_SESSIONS", "50"))
+    AUDIO_SESSION_MAX_BUFFER_BYTES: int = int(os.getenv("AUDIO_SESSION_MAX_BUFFER_BYTES", "1280000"))
+    GROQ_CLIENT_POOL_SIZE: int = int(os.getenv("GROQ_CLIENT_POOL_SIZE", "4"))
+    TRANSCRIPTION_MAX_CONCURRENCY: int = int(os.getenv("TRANSCRIPTION_MAX_CONCURRENCY", "4"))
+    AUDIO_STREAM_MAX_IN_FLIGHT: int = int(os.getenv("AUDIO_STREAM_MAX_IN_FLIGHT", "3"))
+    AUDIO_STREAM_QUEUE_SIZE: int = int(os.getenv("AUDIO_STREAM_QUEUE_SIZE", "32"))
+    AUDIO_VAD_ENABLED: bool = os.getenv("AUDIO_VAD_ENABLED", "true").lower() == "true"
+    AUDIO_VAD_AGGRESSIVENESS: int = int(os.getenv("AUDIO_VAD_AGGRESSIVENESS", "2"))
+    AUDIO_VAD_SILENCE_MS: int = int(os.getenv("AUDIO_VAD_SILENCE_MS", "500"))
+    TRANSCRIPTION_INDEX_BATCH_SIZE: int = int(os.getenv("TRANSCRIPTION_INDEX_BATCH_SIZE", "16"))
+    TRANSCRIPTION_INDEX_LINGER_MS: int = int(os.getenv("TRANSCRIPTION_INDEX_LINGER_MS", "200"))
+    TRANSCRIPTION_INDEX_QUEUE_SIZE: int = int(os.getenv("TRANSCRIPTION_INDEX_QUEUE_SIZE", "1000"))
+    
+    # Executor Configuration (0 = one worker per core, PDF_EXTRACT_WORKERS=1 extracts serially)
+    CPU_EXECUTOR_WORKERS: int = int(os.getenv("CPU_EXECUTOR_WORKERS", "0"))
+    IO_EXECUTOR_WORKERS: int = int(os.getenv("IO_EXECUTOR_WORKERS", "8"))
+    PDF_EXTRACT_WORKERS: int = int(os.getenv("PDF_EXTRACT_WORKERS", "0"))
+    PDF_PARALLEL_MIN_PAGES: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "64"))
     
     # Model Configuration
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "huggingface").lower()
+    EMBEDDING_ONNX_FILE: str = os.getenv("EMBEDDING_ONNX_FILE", "onnx/model_quint8_avx2.onnx")
+    EMBEDDING_THREADS: int = int(os.getenv("EMBEDDING_THREADS", "0"))
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+    QUERY_EMBEDDING_CACHE_SIZE: int = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+    ANSWER_CACHE_SIZE: int = int(os.getenv("ANSWER_CACHE_SIZE", "256"))
+    ANSWER_CACHE_TTL_SECONDS: float = float(os.getenv("ANSWER_CACHE_TTL_SECONDS", "600"))
+    ANSWER_CACHE_SIMILARITY: float = float(os.getenv("ANSWER_CACHE_SIMILARITY", "0.95"))
     WHISPER_MODEL: str = os.getenv("WHISPER_MODEL", "whisper-large-v3")
     LLM_MODEL: str = os.getenv("LLM_MODEL", "llama3-8b-8192")
     
@@ -37,6 +63,24 @@ class Config:
     CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "1000"))
     CHUNK_OVERLAP: int = int(os.getenv("CHUNK_OVERLAP", "200"))
     TOP_K_RESULTS: int = int(os.getenv("TOP_K_RESULTS", "5"))
+    RERANK_ENABLED: bool = os.getenv("RERANK_ENABLED", "false").lower() == "true"
+    RERANK_MODEL: str = os.getenv("RERANK_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
+    RERANK_ONNX_FILE: str = os.getenv("RERANK_ONNX_FILE", "onnx/model_quint8_avx2.onnx")
+    RERANK_CANDIDATES: int = int(os.getenv("RERANK_CANDIDATES", "20"))
+    RERANK_TOP_N: int = int(os.getenv("RERANK_TOP_N", "3"))
+    RERANK_BATCH_SIZE: int = int(os.getenv("RERANK_BATCH_SIZE", "8"))
+    RERANK_BUDGET_MS: float = float(os.getenv("RERANK_BUDGET_MS", "200"))
+    HYBRID_SEARCH_ENABLED: bool = os.getenv("HYBRID_SEARCH_ENABLED", "true").lower() == "true"
+    HYBRID_CANDIDATES: int = int(os.getenv("HYBRID_CANDIDATES", "20"))
+    RRF_K: int = int(os.getenv("RRF_K", "60"))
+    BM25_K1: float = float(os.getenv("BM25_K1", "1.2"))
+    BM25_B: float = float(os.getenv("BM25_B", "0.75"))
+    INGEST_BATCH_SIZE: int = int(os.getenv("INGEST_BATCH_SIZE", "256"))
+    MAX_UPLOAD_BYTES: int = int(os.getenv("MAX_UPLOAD_BYTES", str(100 * 1024 * 1024)))
+    UPLOAD_CHUNK_SIZE: int = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+    INGEST_JOB_WORKERS: int = int(os.getenv("INGEST_JOB_WORKERS", "2"))
+    BULK_INGEST_CONCURRENCY: int = int(os.getenv("BULK_INGEST_CONCURRENCY", "4"))
+    BULK_INGEST_ROOT: str = os.getenv("BULK_INGEST_ROOT", "")
     
     @classmethod
     def validate(cls) -> bool:
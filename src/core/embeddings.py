@@ -0,0 +1,147 @@
+"""
+Embedding backends for the RAG pipeline.
+
+``RAGPipeline`` accepts any LangChain ``Embeddings`` (``embed_documents`` and
+``embed_query``). ``EMBEDDING_BACKEND`` picks the default one:
+
+- ``huggingface``: sentence-transformers on fp32 torch
+- ``onnx``: ``OnnxEmbeddings``, an ONNX Runtime export of the same model,
+  by default the int8-quantized MiniLM published with it
+"""
+import os
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from core.config import config
+
+EMBEDDING_BACKENDS = ("huggingface", "onnx")
+
+def resolve_onnx_model(model_name: str, onnx_file: str) -> Tuple[str, str]:
+    """
+    Find the ONNX model and its ``tokenizer.json``.
+
+    Args:
+        model_name: Local model directory or Hugging Face Hub repository
+        onnx_file: ONNX file inside it (e.g. ``onnx/model_quint8_avx2.onnx``)
+
+    Returns:
+        (model path, tokenizer path); Hub files are downloaded to the local
+        cache on first use
+    """
+    if os.path.isdir(model_name):
+        return os.path.join(model_name, onnx_file), os.path.join(model_name, "tokenizer.json")
+    from huggingface_hub import hf_hub_download
+    return hf_hub_download(model_name, onnx_file), hf_hub_download(model_name, "tokenizer.json")
+
+def create_onnx_session(model_path: str, threads: int = None) -> Any:
+    """
+    Open an ONNX Runtime CPU session with full graph optimizations.
+
+    Args:
+        model_path: ONNX model file
+        threads: Intra-op threads (default: EMBEDDING_THREADS, 0 lets ONNX
+            Runtime use every core)
+    """
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = config.EMBEDDING_THREADS if threads is None else threads
+    return onnxruntime.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+
+class OnnxEmbeddings(Embeddings):
+    """
+    Sentence embeddings from a transformer encoder exported to ONNX.
+
+    Reproduces the sentence-transformers pipeline of MiniLM-style models:
+    tokenize, run the encoder, mean-pool token states over the attention mask
+    and L2-normalize. Texts are sorted by length before batching so each
+    batch pads to a similar length, and results are returned in input order.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        tokenizer: Any,
+        batch_size: int = None,
+        max_length: int = 256,
+        normalize: bool = True
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            session: ``onnxruntime.InferenceSession`` of the encoder
+            tokenizer: ``tokenizers.Tokenizer`` of the model
+            batch_size: Texts per encoder call
+            max_length: Tokens kept per text (MiniLM was trained on 256)
+            normalize: L2-normalize the pooled embeddings
+        """
+        self.session = session
+        self.tokenizer = tokenizer
+        self.batch_size = max(1, batch_size or config.EMBEDDING_BATCH_SIZE)
+        self.max_length = max_length
+        self.normalize = normalize
+        self.input_names = {model_input.name for model_input in session.get_inputs()}
+
+        pad_id = tokenizer.token_to_id("[PAD]")
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding(pad_id=pad_id if pad_id is not None else 0, pad_token="[PAD]")
+
+    @classmethod
+    def load(
+        cls,
+        model_name: str = None,
+        onnx_file: str = None,
+        batch_size: int = None,
+        threads: int = None
+    ) -> "OnnxEmbeddings":
+        """
+        Load a model from a local directory or the Hugging Face Hub.
+
+        Args:
+            model_name: Model directory or Hub repository (default: EMBEDDING_MODEL)
+            onnx_file: ONNX file in it (default: EMBEDDING_ONNX_FILE)
+            batch_size: Texts per encoder call (default: EMBEDDING_BATCH_SIZE)
+            threads: ONNX Runtime intra-op threads (default: EMBEDDING_THREADS,
+                0 lets ONNX Runtime use every core)
+        """
+        from tokenizers import Tokenizer
+
+        model_path, tokenizer_path = resolve_onnx_model(
+            model_name or config.EMBEDDING_MODEL, onnx_file or config.EMBEDDING_ONNX_FILE
+        )
+        session = create_onnx_session(model_path, threads)
+        return cls(session, Tokenizer.from_file(tokenizer_path), batch_size=batch_size)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        inputs = {
+            "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64),
+            "token_type_ids": np.array([encoding.type_ids for encoding in encodings], dtype=np.int64)
+        }
+        token_states = self.session.run(None, {name: inputs[name] for name in self.input_names})[0]
+
+        # Mean over real tokens only; padding must not pull the average
+        mask = inputs["attention_mask"][:, :, None].astype(token_states.dtype)
+        pooled = (token_states * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if self.normalize:
+            pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, ``batch_size`` at a time."""
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start:start + self.batch_size]
+            for i, vector in zip(batch, self._encode([texts[i] for i in batch])):
+                embeddings[i] = vector.tolist()
+        return embeddings
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query."""
+        return self._encode([text])[0].tolist()
@@ -0,0 +1,181 @@
+"""
+Thread pools for blocking vector-store and embedding work.
+
+Coroutines hand blocking calls to one of two shared pools so the event loop
+keeps serving WebSockets and HTTP requests:
+
+- ``cpu``: embedding, text extraction and splitting
+- ``io``: ChromaDB reads/writes and other disk or network calls
+
+Pure-Python work that holds the GIL (PDF page extraction) goes to a separate
+process pool.
+"""
+import os
+import time
+import asyncio
+import functools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import logging
+
+from core.config import config
+
+logger = logging.getLogger(__name__)
+
+class InstrumentedExecutor:
+    """
+    A named thread pool that records queue depth and latency.
+
+    ``queue_wait`` is the time a call spends waiting for a free worker and
+    ``run_time`` the time it spends executing.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        """
+        Initialize the pool.
+
+        Args:
+            name: Pool name used in metrics and thread names
+            max_workers: Number of worker threads
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"{name}-pool")
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.queued = 0
+        self.active = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_queue_wait = 0.0
+        self.total_run_time = 0.0
+        self.max_run_time = 0.0
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the pool and await its result.
+
+        Args:
+            fn: The blocking callable
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Whatever ``fn`` returns
+        """
+        submitted = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+        call = functools.partial(self._timed, fn, args, kwargs, submitted)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    def _timed(self, fn, args, kwargs, submitted: float):
+        started = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self.total_queue_wait += started - submitted
+        failed = False
+        try:
+            return fn(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            run_time = time.perf_counter() - started
+            with self._lock:
+                self.active -= 1
+                self.total_run_time += run_time
+                self.max_run_time = max(self.max_run_time, run_time)
+                if failed:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, utilisation and latency for this pool."""
+        finished = self.completed + self.failed
+        return {
+            "max_workers": self.max_workers,
+            "queued": self.queued,
+            "active": self.active,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_queue_wait_ms": round(self.total_queue_wait / finished * 1000, 2) if finished else 0.0,
+            "avg_run_ms": round(self.total_run_time / finished * 1000, 2) if finished else 0.0,
+            "max_run_ms": round(self.max_run_time * 1000, 2)
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=wait)
+
+_cpu_executor: Optional[InstrumentedExecutor] = None
+_io_executor: Optional[InstrumentedExecutor] = None
+_process_executor: Optional[ProcessPoolExecutor] = None
+_init_lock = threading.Lock()
+
+def cpu_executor() -> InstrumentedExecutor:
+    """Get or create the pool for embedding and other CPU-bound work."""
+    global _cpu_executor
+    with _init_lock:
+        if _cpu_executor is None:
+            workers = config.CPU_EXECUTOR_WORKERS or os.cpu_count() or 1
+            _cpu_executor = InstrumentedExecutor("cpu", workers)
+        return _cpu_executor
+
+def io_executor() -> InstrumentedExecutor:
+    """Get or create the pool for vector-store and other blocking I/O."""
+    global _io_executor
+    with _init_lock:
+        if _io_executor is None:
+            _io_executor = InstrumentedExecutor("io", config.IO_EXECUTOR_WORKERS)
+        return _io_executor
+
+def process_worker_count() -> int:
+    """Number of processes used for PDF extraction (1 = extract serially)."""
+    return max(1, config.PDF_EXTRACT_WORKERS or os.cpu_count() or 1)
+
+def process_executor() -> ProcessPoolExecutor:
+    """Get or create the process pool for GIL-bound extraction work."""
+    global _process_executor
+    with _init_lock:
+        if _process_executor is None:
+            # Spawn rather than fork: the server process runs many threads
+            _process_executor = ProcessPoolExecutor(
+                max_workers=process_worker_count(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_executor
+
+async def run_cpu(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a CPU-bound callable on the shared CPU pool."""
+    return await cpu_executor().run(fn, *args, **kwargs)
+
+async def run_io(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking I/O callable on the shared I/O pool."""
+    return await io_executor().run(fn, *args, **kwargs)
+
+def executor_stats() -> Dict[str, Any]:
+    """Return metrics for the pools that have been created."""
+    return {
+        name: executor.stats() if executor is not None else {"queued": 0, "active": 0}
+        for name, executor in (("cpu", _cpu_executor), ("io", _io_executor))
+    }
+
+def shutdown_executors(wait: bool = True):
+    """Stop all pools; they are recreated on next use."""
+    global _cpu_executor, _io_executor, _process_executor
+    with _init_lock:
+        for executor in (_cpu_executor, _io_executor, _process_executor):
+            if executor is not None:
+                executor.shutdown(wait=wait)
+        _cpu_executor = None
+        _io_executor = None
+        _process_executor = None
@@ -0,0 +1,156 @@
+"""
+Incremental text extraction and splitting for document ingest.
+
+Everything here is generator-based: text is produced page by page (PDF),
+paragraph by paragraph (DOCX) or block by block (TXT), and split into
+chunks as it arrives, so memory use does not grow with document size.
+"""
+import os
+import hashlib
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Iterator, List
+import logging
+
+import PyPDF2
+from docx import Document as DocxDocument
+
+from core.config import config
+from core.executors import process_executor, process_worker_count
+
+logger = logging.getLogger(__name__)
+
+TXT_BLOCK_SIZE = 64 * 1024
+HASH_BLOCK_SIZE = 1024 * 1024
+PDF_PAGES_PER_TASK = 32
+
+# (file key, open file, reader) for the PDF a worker process last read, so
+# consecutive page ranges of one document parse its xref only once
+_worker_pdf = None
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".txt")
+
+def file_md5(file_path: str) -> str:
+    """Hash a file's bytes without reading it into memory at once."""
+    digest = hashlib.md5()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def iter_document_text(file_path: str, filename: str) -> Iterator[str]:
+    """
+    Yield a document's text in pieces, in reading order.
+
+    Args:
+        file_path: Path to the file
+        filename: Original filename (its extension selects the format)
+
+    Raises:
+        ValueError: If the format is unsupported
+    """
+    file_extension = Path(filename).suffix.lower()
+    if file_extension == ".pdf":
+        return iter_pdf_text(file_path)
+    elif file_extension == ".docx":
+        return iter_docx_text(file_path)
+    elif file_extension == ".txt":
+        return iter_txt_text(file_path)
+    raise ValueError(f"Unsupported file format: {file_extension}")
+
+def iter_pdf_text(file_path: str) -> Iterator[str]:
+    """
+    Yield the text of each PDF page, in page order.
+
+    PDFs with at least ``PDF_PARALLEL_MIN_PAGES`` pages are extracted on the
+    process pool in ranges of ``PDF_PAGES_PER_TASK`` pages; smaller files, or
+    a single configured worker, are extracted serially.
+    """
+    workers = process_worker_count()
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        page_count = len(pdf_reader.pages)
+        if workers <= 1 or page_count < config.PDF_PARALLEL_MIN_PAGES:
+            for page in pdf_reader.pages:
+                yield (page.extract_text() or "") + "\n"
+            return
+
+    logger.debug(f"Extracting {page_count} PDF pages with {workers} processes")
+    executor = process_executor()
+    pending = deque()
+    try:
+        # Keep a bounded number of ranges in flight and yield them in order
+        for start in range(0, page_count, PDF_PAGES_PER_TASK):
+            pending.append(executor.submit(
+                extract_pdf_pages, file_path, start, min(start + PDF_PAGES_PER_TASK, page_count)
+            ))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+def extract_pdf_pages(file_path: str, start: int, stop: int) -> List[str]:
+    """Extract pages ``[start, stop)`` of a PDF; runs in a worker process."""
+    global _worker_pdf
+    stat = os.stat(file_path)
+    key = (file_path, stat.st_mtime_ns, stat.st_size)
+    if _worker_pdf is None or _worker_pdf[0] != key:
+        if _worker_pdf is not None:
+            _worker_pdf[1].close()
+        file = open(file_path, 'rb')
+        _worker_pdf = (key, file, PyPDF2.PdfReader(file))
+    pdf_reader = _worker_pdf[2]
+    return [(pdf_reader.pages[index].extract_text() or "") + "\n" for index in range(start, stop)]
+
+def iter_docx_text(file_path: str) -> Iterator[str]:
+    """Yield each DOCX paragraph."""
+    doc = DocxDocument(file_path)
+    for index, paragraph in enumerate(doc.paragraphs):
+        yield ("\n" if index else "") + paragraph.text
+
+def iter_txt_text(file_path: str) -> Iterator[str]:
+    """Yield a UTF-8 text file in fixed-size blocks."""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for block in iter(lambda: file.read(TXT_BLOCK_SIZE), ""):
+            yield block
+
+def iter_chunks(texts: Iterable[str], text_splitter, buffer_size: int = None) -> Iterator[str]:
+    """
+    Split streamed text into chunks without holding the whole document.
+
+    Text is buffered until it exceeds ``buffer_size`` characters, then split.
+    All chunks but the last are emitted; the text from the last chunk's start
+    onward is carried into the next round so chunk boundaries and overlap
+    behave as if the document had been split in one piece.
+
+    Args:
+        texts: Text pieces in reading order
+        text_splitter: A langchain text splitter
+        buffer_size: Characters to buffer before splitting (default: 8 chunks)
+
+    Yields:
+        Chunk texts in order
+    """
+    chunk_size = getattr(text_splitter, "_chunk_size", 1000)
+    buffer_size = buffer_size or chunk_size * 8
+    buffer = ""
+    for text in texts:
+        buffer += text
+        if len(buffer) < buffer_size:
+            continue
+        chunks = text_splitter.split_text(buffer)
+        if len(chunks) < 2:
+            continue
+        tail_start = buffer.rfind(chunks[-1])
+        if tail_start <= 0:
+            # Cannot locate the last chunk: keep buffering rather than guess
+            continue
+        for chunk in chunks[:-1]:
+            yield chunk
+        buffer = buffer[tail_start:]
+    if buffer.strip():
+        for chunk in text_splitter.split_text(buffer):
+            yield chunk
@@ -0,0 +1,326 @@
+"""
+Background document ingestion with a persistent job queue.
+"""
+import os
+import uuid
+import asyncio
+import inspect
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+from core.config import config
+from core.executors import run_io
+
+logger = logging.getLogger(__name__)
+
+class JobStore:
+    """
+    Ingest jobs in a SQLite database kept next to the ChromaDB directory.
+
+    A job is ``queued`` until a worker picks it up, ``running`` while its
+    document is ingested and then ``completed`` or ``failed``. Progress
+    counters (``pages``, ``chunks``, ``embedded``) are written after every
+    batch, so a status poll always sees recent figures.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the job store.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " job_id TEXT NOT NULL UNIQUE,"
+                " status TEXT NOT NULL,"
+                " filename TEXT NOT NULL,"
+                " file_path TEXT,"
+                " content_hash TEXT,"
+                " size INTEGER,"
+                " document_id TEXT,"
+                " pages INTEGER NOT NULL DEFAULT 0,"
+                " chunks INTEGER NOT NULL DEFAULT 0,"
+                " embedded INTEGER NOT NULL DEFAULT 0,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " error TEXT,"
+                " created_at TEXT,"
+                " started_at TEXT,"
+                " finished_at TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, seq)")
+
+    def create(self, job: Dict[str, Any]):
+        """Insert a job; ``job`` holds job_id, status, filename and optional columns."""
+        columns = list(job)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO jobs ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                [job[column] for column in columns]
+            )
+
+    def update(self, job_id: str, **fields):
+        """Set columns of a job."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE jobs SET {', '.join(f'{column} = ?' for column in fields)} WHERE job_id = ?",
+                [*fields.values(), job_id]
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a job, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def recent(self, limit: int, status: str = None) -> List[Dict[str, Any]]:
+        """Return the newest jobs, optionally only those with a status."""
+        with self._lock:
+            if status is None:
+                rows = self._conn.execute("SELECT * FROM jobs ORDER BY seq DESC LIMIT ?", (limit,)).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY seq DESC LIMIT ?", (status, limit)
+                ).fetchall()
+        return [dict(row) for row in rows]
+
+    def unfinished(self) -> List[Dict[str, Any]]:
+        """Return queued and interrupted running jobs, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE status IN ('queued', 'running') ORDER BY seq"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self, status: str) -> int:
+        """Return the number of jobs with a status."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()[0]
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+class IngestJobQueue:
+    """
+    Runs document ingests in the background with bounded concurrency.
+
+    Uploads are spooled to ``data/uploads`` and recorded in the ``JobStore``
+    before ``submit`` returns, so queued and interrupted jobs are picked up
+    again by ``start`` after a restart. ``max_workers`` jobs run at a time;
+    the rest wait in order. A job's ID is also used as its document ID,
+    which lets a retried job remove the chunks of an interrupted attempt.
+    """
+
+    def __init__(
+        self,
+        pipeline_factory: Callable[[], Any],
+        store: JobStore = None,
+        max_workers: int = None,
+        upload_dir: str = None
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            pipeline_factory: Returns the RAG pipeline, or an awaitable of it
+                (called per job)
+            store: Job store (default: data/jobs.sqlite3)
+            max_workers: Jobs ingested concurrently
+            upload_dir: Where uploads wait for their job (default: data/uploads)
+        """
+        self.pipeline_factory = pipeline_factory
+        self.store = store or JobStore(os.path.join(os.getcwd(), "data", "jobs.sqlite3"))
+        self.max_workers = max(1, max_workers or config.INGEST_JOB_WORKERS)
+        self.upload_dir = upload_dir or os.path.join(os.getcwd(), "data", "uploads")
+        os.makedirs(self.upload_dir, exist_ok=True)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued_ids: set = set()
+        self._workers: List[asyncio.Task] = []
+
+        # Metrics
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.running = 0
+
+    def upload_path(self, job_id: str, suffix: str) -> str:
+        """Return where the upload for a job is spooled."""
+        return os.path.join(self.upload_dir, f"{job_id}{suffix}")
+
+    async def start(self):
+        """Start the workers and queue every unfinished job from the store."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.ensure_future(self._run()) for _ in range(self.max_workers)]
+        unfinished = await run_io(self.store.unfinished)
+        for job in unfinished:
+            self._enqueue(job["job_id"])
+        if unfinished:
+            logger.info(f"Resuming {len(unfinished)} ingest jobs")
+
+    def _enqueue(self, job_id: str):
+        # A job submitted while start() reads the store must not run twice
+        if job_id not in self._queued_ids:
+            self._queued_ids.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def submit(
+        self,
+        job_id: str,
+        file_path: str,
+        filename: str,
+        content_hash: str = None,
+        size: int = None,
+        document_id: str = None
+    ) -> Dict[str, Any]:
+        """
+        Record a job for a spooled upload and queue it.
+
+        Args:
+            job_id: ID from ``new_job_id`` (the upload is at ``upload_path``)
+            file_path: Path of the spooled upload
+            filename: Original filename
+            content_hash: md5 of the file bytes
+            size: Upload size in bytes
+            document_id: ID of an already stored document with this content;
+                the job is recorded as completed without running
+
+        Returns:
+            The job
+        """
+        await self.start()
+        now = datetime.now().isoformat()
+        job = {
+            "job_id": job_id,
+            "status": "completed" if document_id else "queued",
+            "filename": filename,
+            "file_path": None if document_id else file_path,
+            "content_hash": content_hash,
+            "size": size,
+            "document_id": document_id,
+            "created_at": now,
+            "finished_at": now if document_id else None
+        }
+        await run_io(self.store.create, job)
+        self.submitted += 1
+        if not document_id:
+            self._enqueue(job_id)
+        return await run_io(self.store.get, job_id)
+
+    @staticmethod
+    def new_job_id() -> str:
+        """Return a fresh job ID."""
+        return str(uuid.uuid4())
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a job, or None."""
+        return await run_io(self.store.get, job_id)
+
+    async def recent(self, limit: int = 50, status: str = None) -> List[Dict[str, Any]]:
+        """Return the newest jobs, optionally only those with a status."""
+        return await run_io(self.store.recent, limit, status)
+
+    async def _run(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._process(job_id)
+            finally:
+                self._queued_ids.discard(job_id)
+                self._queue.task_done()
+
+    async def _process(self, job_id: str):
+        job = await run_io(self.store.get, job_id)
+        if job is None or job["status"] not in ("queued", "running"):
+            return
+
+        self.running += 1
+        try:
+            rag_pipeline = self.pipeline_factory()
+            if inspect.isawaitable(rag_pipeline):
+                rag_pipeline = await rag_pipeline
+            if job["attempts"]:
+                # Interrupted by a restart: drop whatever the last attempt stored
+                await rag_pipeline.delete_document(job_id)
+            await run_io(
+                self.store.update, job_id,
+                status="running", attempts=job["attempts"] + 1,
+                started_at=datetime.now().isoformat(), pages=0, chunks=0, embedded=0
+            )
+
+            async def report(progress: Dict[str, int]):
+                await run_io(self.store.update, job_id, **progress)
+
+            document_id = await rag_pipeline.add_document(
+                job["file_path"], job["filename"],
+                content_hash=job["content_hash"], document_id=job_id, progress=report
+            )
+        except Exception as e:
+            logger.error(f"Ingest job {job_id} failed: {e}")
+            self.failed += 1
+            await run_io(
+                self.store.update, job_id,
+                status="failed", error=str(e), finished_at=datetime.now().isoformat()
+            )
+            await self._remove_upload(job["file_path"])
+            return
+        finally:
+            self.running -= 1
+
+        self.completed += 1
+        await run_io(
+            self.store.update, job_id,
+            status="completed", document_id=document_id, finished_at=datetime.now().isoformat()
+        )
+        await self._remove_upload(job["file_path"])
+
+    @staticmethod
+    async def _remove_upload(file_path: Optional[str]):
+        if file_path and os.path.exists(file_path):
+            await run_io(os.unlink, file_path)
+
+    async def drain(self):
+        """Wait until every queued job has finished."""
+        if self._queue is not None and self._workers:
+            await self._queue.join()
+
+    async def shutdown(self):
+        """
+        Stop the workers.
+
+        Running jobs are left marked ``running`` and are retried on the next
+        ``start``.
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._queued_ids.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth and job counters."""
+        return {
+            "workers": self.max_workers,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "running": self.running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed
+        }
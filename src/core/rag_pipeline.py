@@ -3,37 +3,60 @@ RAG (Retrieval-Augmented Generation) pipeline using ChromaDB and Groq.
 """
 import os
 import uuid
-from typing import List, Dict, Any, Optional
+import asyncio
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Iterator, List, Dict, Any, Optional, Tuple
 import logging
-from pathlib import Path
+import time
 import hashlib
+import threading
+from collections import OrderedDict
+from itertools import islice
 from datetime import datetime
 
-# Document processing
-import PyPDF2
-from docx import Document as DocxDocument
-import chromadb
-from chromadb.config import Settings
+# Groq for LLM
+from groq import AsyncGroq, Groq
 
-# LangChain components
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.schema import Document
-from langchain_community.embeddings import HuggingFaceEmbeddings
+from core.answer_cache import SemanticAnswerCache
+from core.bm25 import BM25Index, reciprocal_rank_fusion
+from core.catalog import Catalog
+from core.config import config
+from core.extraction import file_md5, iter_chunks, iter_document_text
+from core.executors import run_cpu, run_io
 
-# Groq for LLM
-from groq import Groq
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+    from core.reranker import CrossEncoderReranker
 
 logger = logging.getLogger(__name__)
 
+# Resolved on first use. ChromaDB, the text splitter and the embedding
+# backends are imported when the first pipeline is built (the startup
+# warm-up), not when the server imports this module; langchain-community and
+# the torch stack behind it only come with the full requirements.txt.
+HuggingFaceEmbeddings = None
+
 class RAGPipeline:
     """
     RAG pipeline for document processing and question answering.
     """
     
-    def __init__(self):
-        """Initialize the RAG pipeline with ChromaDB and Groq."""
+    def __init__(self, embeddings: "Embeddings" = None, reranker: "CrossEncoderReranker" = None):
+        """
+        Initialize the RAG pipeline with ChromaDB and Groq.
+        
+        Args:
+            embeddings: Embedding backend (default: the one selected by
+                EMBEDDING_BACKEND)
+            reranker: Cross-encoder applied to retrieved chunks (default: the
+                RERANK_MODEL if RERANK_ENABLED, otherwise none)
+        """
+        import chromadb
+        from chromadb.config import Settings
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+        
         # Initialize Groq client
         self.groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+        self.async_groq_client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
         
         # Initialize ChromaDB
         self.chroma_persist_directory = os.path.join(os.getcwd(), "data", "chromadb")
@@ -55,11 +78,40 @@ class RAGPipeline:
                 metadata={"description": "Document collection for RAG pipeline"}
             )
         
+        # Persistent catalog of documents and transcriptions (dedupe and
+        # listing), rebuilt from the collection if missing
+        self.catalog = Catalog(os.path.join(os.getcwd(), "data", "catalog.sqlite3"))
+        if self.catalog.created and self.collection.count():
+            self.catalog.rebuild(self.collection)
+        
+        # Counters kept up to date on add/delete so readiness checks never scan
+        self.documents_count = self.catalog.count("document")
+        self.transcriptions_count = self.catalog.count("transcription")
+        self.last_ingest: Optional[Dict[str, Any]] = None
+        
         # Initialize embeddings model
-        self.embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/all-MiniLM-L6-v2",
-            model_kwargs={'device': 'cpu'}
-        )
+        self.embedding_batch_size = max(1, config.EMBEDDING_BATCH_SIZE)
+        self.embedding_backend = config.EMBEDDING_BACKEND if embeddings is None else type(embeddings).__name__
+        self.embeddings = embeddings if embeddings is not None else self._create_embeddings()
+        self.ingest_batch_size = max(1, config.INGEST_BATCH_SIZE)
+        
+        # Optional cross-encoder that picks the best chunks of a wider candidate set
+        if reranker is None and config.RERANK_ENABLED:
+            from core.reranker import CrossEncoderReranker
+            reranker = CrossEncoderReranker.load()
+        self.reranker = reranker
+        self.rerank_candidates = max(1, config.RERANK_CANDIDATES)
+        self.rerank_top_n = max(1, config.RERANK_TOP_N)
+        
+        # BM25 keyword index fused with vector search, rebuilt from the
+        # collection if missing
+        self.bm25: Optional[BM25Index] = None
+        if config.HYBRID_SEARCH_ENABLED:
+            self.bm25 = BM25Index(os.path.join(os.getcwd(), "data", "bm25.sqlite3"), config.BM25_K1, config.BM25_B)
+            if self.bm25.created and self.collection.count():
+                self.bm25.rebuild(self.collection)
+        self.hybrid_candidates = max(1, config.HYBRID_CANDIDATES)
+        self.rrf_k = max(1, config.RRF_K)
         
         # Initialize text splitter
         self.text_splitter = RecursiveCharacterTextSplitter(
@@ -68,151 +120,426 @@ class RAGPipeline:
             separators=["\n\n", "\n", " ", ""]
         )
         
-        # Document metadata storage
-        self.documents_metadata = {}
+        # LRU cache of normalized question -> query embedding
+        self.query_cache_size = max(0, config.QUERY_EMBEDDING_CACHE_SIZE)
+        self._query_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self.query_cache_hits = 0
+        self.query_cache_misses = 0
+        
+        # Generated answers, reused for similar questions over the same chunks
+        self.answer_cache = SemanticAnswerCache()
+        
+    def _create_embeddings(self) -> "Embeddings":
+        """Create the embedding backend named by EMBEDDING_BACKEND."""
+        global HuggingFaceEmbeddings
+        from core.embeddings import EMBEDDING_BACKENDS, OnnxEmbeddings
         
-    async def add_document(self, file_path: str, filename: str) -> str:
+        if config.EMBEDDING_BACKEND == "onnx":
+            return OnnxEmbeddings.load(batch_size=self.embedding_batch_size)
+        if config.EMBEDDING_BACKEND == "huggingface":
+            if HuggingFaceEmbeddings is None:
+                try:
+                    from langchain_community.embeddings import HuggingFaceEmbeddings
+                except ImportError as e:
+                    raise ImportError(
+                        "EMBEDDING_BACKEND=huggingface needs langchain-community and sentence-transformers "
+                        "from requirements.txt; the serving requirements support EMBEDDING_BACKEND=onnx"
+                    ) from e
+            return HuggingFaceEmbeddings(
+                model_name=config.EMBEDDING_MODEL,
+                model_kwargs={'device': 'cpu'},
+                encode_kwargs={'batch_size': self.embedding_batch_size}
+            )
+        raise ValueError(
+            f"Unknown EMBEDDING_BACKEND {config.EMBEDDING_BACKEND!r} (expected one of {', '.join(EMBEDDING_BACKENDS)})"
+        )
+    
+    async def find_document(self, content_hash: str) -> Optional[str]:
+        """Return the ID of the stored document whose file bytes have this md5, or None."""
+        return await run_io(self.catalog.find_by_hash, "document", content_hash)
+    
+    async def add_document(
+        self,
+        file_path: str,
+        filename: str,
+        content_hash: str = None,
+        document_id: str = None,
+        progress: Callable[[Dict[str, int]], Awaitable[None]] = None
+    ) -> str:
         """
         Add a document to the RAG pipeline.
         
+        Text is extracted page by page, split incrementally and embedded and
+        inserted in batches of ``ingest_batch_size`` chunks, so peak memory
+        does not grow with document size.
+        
         Args:
             file_path: Path to the document file
             filename: Original filename
+            content_hash: md5 of the file bytes, if already computed
+            document_id: ID to store the document under (default: a new UUID)
+            progress: Awaited after each batch with ``pages`` (text pieces
+                extracted: PDF pages, DOCX paragraphs or TXT blocks),
+                ``chunks`` (split) and ``embedded`` (embedded and stored)
             
         Returns:
             Document ID
         """
+        started = time.perf_counter()
+        doc_id = document_id or str(uuid.uuid4())
+        chunk_count = 0
+        pages = 0
+        
+        def count_pages(texts: Iterator[str]) -> Iterator[str]:
+            nonlocal pages
+            for text in texts:
+                pages += 1
+                yield text
+        
         try:
-            # Extract text from document
-            text_content = self._extract_text_from_file(file_path, filename)
-            
-            if not text_content.strip():
-                raise ValueError("No text content extracted from document")
-            
-            # Generate document ID
-            doc_id = str(uuid.uuid4())
-            
-            # Create document hash for deduplication
-            content_hash = hashlib.md5(text_content.encode()).hexdigest()
+            # Create document hash for deduplication from the file bytes
+            if content_hash is None:
+                content_hash = await run_io(file_md5, file_path)
             
             # Check if document already exists
-            existing_docs = self.collection.get(
-                where={"content_hash": content_hash}
-            )
-            
-            if existing_docs['ids']:
-                logger.info(f"Document with same content already exists: {existing_docs['ids'][0]}")
-                return existing_docs['ids'][0]
-            
-            # Split text into chunks
-            documents = self.text_splitter.create_documents([text_content])
+            existing_id = await self.find_document(content_hash)
             
-            # Process each chunk
-            chunk_ids = []
-            chunk_texts = []
-            chunk_embeddings = []
-            chunk_metadatas = []
+            if existing_id:
+                logger.info(f"Document with same content already exists: {existing_id}")
+                return existing_id
             
-            for i, doc in enumerate(documents):
-                chunk_id = f"{doc_id}_chunk_{i}"
-                chunk_ids.append(chunk_id)
-                chunk_texts.append(doc.page_content)
+            chunks = iter_chunks(count_pages(iter_document_text(file_path, filename)), self.text_splitter)
+            while True:
+                # Pull the next batch of chunks off the extraction generator
+                chunk_texts = await run_cpu(self._next_chunk_batch, chunks)
+                if not chunk_texts:
+                    break
+                if progress:
+                    await progress({"pages": pages, "chunks": chunk_count + len(chunk_texts), "embedded": chunk_count})
                 
-                # Generate embedding
-                embedding = self.embeddings.embed_query(doc.page_content)
-                chunk_embeddings.append(embedding)
+                chunk_embeddings = await run_cpu(self._embed_texts, chunk_texts)
+                chunk_ids = [f"{doc_id}_chunk_{chunk_count + i}" for i in range(len(chunk_texts))]
+                chunk_metadatas = [
+                    {
+                        "document_id": doc_id,
+                        "filename": filename,
+                        "chunk_index": chunk_count + i,
+                        "content_hash": content_hash,
+                        "source": file_path
+                    }
+                    for i in range(len(chunk_texts))
+                ]
                 
-                # Create metadata
-                metadata = {
-                    "document_id": doc_id,
-                    "filename": filename,
-                    "chunk_index": i,
-                    "content_hash": content_hash,
-                    "source": file_path
-                }
-                chunk_metadatas.append(metadata)
-            
-            # Add to ChromaDB
-            self.collection.add(
-                ids=chunk_ids,
-                documents=chunk_texts,
-                embeddings=chunk_embeddings,
-                metadatas=chunk_metadatas
-            )
+                # Add to ChromaDB
+                self.answer_cache.invalidate(chunk_ids)
+                await run_io(
+                    self.collection.add,
+                    ids=chunk_ids,
+                    documents=chunk_texts,
+                    embeddings=chunk_embeddings,
+                    metadatas=chunk_metadatas
+                )
+                await self._index_chunks(chunk_ids, chunk_texts)
+                chunk_count += len(chunk_texts)
+                if progress:
+                    await progress({"pages": pages, "chunks": chunk_count, "embedded": chunk_count})
+            
+            if not chunk_count:
+                raise ValueError("No text content extracted from document")
             
             # Store document metadata
-            self.documents_metadata[doc_id] = {
-                "filename": filename,
+            await run_io(self.catalog.add_items, "document", [{
+                "item_id": doc_id,
                 "content_hash": content_hash,
-                "chunk_count": len(documents),
-                "source": file_path
-            }
+                "name": filename,
+                "source": file_path,
+                "chunk_count": chunk_count,
+                "created_at": datetime.now().isoformat()
+            }])
             
-            logger.info(f"Added document '{filename}' with {len(documents)} chunks")
+            self.documents_count += 1
+            self._record_ingest("document", chunk_count, started)
+            logger.info(f"Added document '{filename}' with {chunk_count} chunks")
             return doc_id
             
         except Exception as e:
             logger.error(f"Error adding document: {e}")
+            if chunk_count:
+                # Drop the batches already inserted for the failed document
+                await run_io(self.collection.delete, where={"document_id": doc_id})
+                await self._unindex_chunks([f"{doc_id}_chunk_{i}" for i in range(chunk_count)])
             raise
     
-    def _extract_text_from_file(self, file_path: str, filename: str) -> str:
+    async def add_documents(self, files: List[Dict[str, Any]], concurrency: int = None) -> List[Dict[str, Any]]:
         """
-        Extract text content from various file formats.
+        Add many documents, overlapping extraction with embedding.
+        
+        Up to ``concurrency`` files are hashed, deduplicated and extracted at
+        once while a single writer embeds and stores their chunks. Chunks are
+        pooled into batches of ``ingest_batch_size`` regardless of which file
+        they came from, so one embedding pass and one ChromaDB insert cover
+        many small files, and the catalog rows of finished files are written
+        together after each batch.
         
         Args:
-            file_path: Path to the file
-            filename: Original filename
+            files: Dicts with file_path, filename and optional content_hash
+            concurrency: Files extracted at once (default: BULK_INGEST_CONCURRENCY)
             
         Returns:
-            Extracted text content
+            One outcome per file, in input order, with filename, status
+            ("added", "duplicate" or "failed"), document_id, chunks and error
         """
-        try:
-            file_extension = Path(filename).suffix.lower()
-            
-            if file_extension == ".pdf":
-                return self._extract_pdf_text(file_path)
-            elif file_extension == ".docx":
-                return self._extract_docx_text(file_path)
-            elif file_extension == ".txt":
-                return self._extract_txt_text(file_path)
-            else:
-                raise ValueError(f"Unsupported file format: {file_extension}")
+        started = time.perf_counter()
+        concurrency = max(1, concurrency or config.BULK_INGEST_CONCURRENCY)
+        outcomes = [
+            {"filename": file["filename"], "status": None, "document_id": None, "chunks": 0, "error": None}
+            for file in files
+        ]
+        content_hashes: Dict[int, str] = {}
+        first_with_hash: Dict[str, int] = {}
+        duplicates_in_batch: List[Tuple[int, int]] = []
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.ingest_batch_size * 2)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def extract(index: int, file: Dict[str, Any]):
+            outcome = outcomes[index]
+            async with semaphore:
+                try:
+                    content_hash = file.get("content_hash") or await run_io(file_md5, file["file_path"])
+                    if content_hash in first_with_hash:
+                        outcome["status"] = "duplicate"
+                        duplicates_in_batch.append((index, first_with_hash[content_hash]))
+                        return
+                    first_with_hash[content_hash] = index
+                    existing_id = await self.find_document(content_hash)
+                    if existing_id:
+                        outcome.update(status="duplicate", document_id=existing_id)
+                        return
+                    
+                    content_hashes[index] = content_hash
+                    outcome["document_id"] = str(uuid.uuid4())
+                    chunks = iter_chunks(iter_document_text(file["file_path"], file["filename"]), self.text_splitter)
+                    while outcome["status"] is None:
+                        chunk_texts = await run_cpu(self._next_chunk_batch, chunks)
+                        if not chunk_texts:
+                            break
+                        for text in chunk_texts:
+                            await queue.put((index, outcome["chunks"], text))
+                            outcome["chunks"] += 1
+                    if not outcome["chunks"] and outcome["status"] is None:
+                        raise ValueError("No text content extracted from document")
+                except Exception as e:
+                    logger.error(f"Error extracting {file['filename']}: {e}")
+                    outcome.update(status="failed", error=str(e))
+                await queue.put((index, None, None))
+        
+        async def write():
+            pending: List[Tuple[int, int, str]] = []
+            finished: List[int] = []
+            
+            async def flush():
+                if pending:
+                    indexes = {index for index, _, _ in pending}
+                    chunk_ids = [f"{outcomes[index]['document_id']}_chunk_{i}" for index, i, _ in pending]
+                    chunk_texts = [text for _, _, text in pending]
+                    try:
+                        chunk_embeddings = await run_cpu(self._embed_texts, chunk_texts)
+                        self.answer_cache.invalidate(chunk_ids)
+                        await run_io(
+                            self.collection.add,
+                            ids=chunk_ids,
+                            documents=chunk_texts,
+                            embeddings=chunk_embeddings,
+                            metadatas=[
+                                {
+                                    "document_id": outcomes[index]["document_id"],
+                                    "filename": files[index]["filename"],
+                                    "chunk_index": i,
+                                    "content_hash": content_hashes[index],
+                                    "source": files[index]["file_path"]
+                                }
+                                for index, i, _ in pending
+                            ]
+                        )
+                        await self._index_chunks(chunk_ids, chunk_texts)
+                    except Exception as e:
+                        logger.error(f"Error storing a batch of {len(pending)} chunks: {e}")
+                        for index in indexes:
+                            outcomes[index].update(status="failed", error=str(e))
+                    pending.clear()
                 
-        except Exception as e:
-            logger.error(f"Error extracting text from {filename}: {e}")
-            raise
-    
-    def _extract_pdf_text(self, file_path: str) -> str:
-        """Extract text from PDF file."""
-        text = ""
+                added = []
+                for index in finished:
+                    outcome = outcomes[index]
+                    if outcome["status"] == "failed":
+                        if outcome["document_id"] and outcome["chunks"]:
+                            # Drop the batches already stored for the failed file
+                            await run_io(self.collection.delete, where={"document_id": outcome["document_id"]})
+                            await self._unindex_chunks(
+                                [f"{outcome['document_id']}_chunk_{i}" for i in range(outcome["chunks"])]
+                            )
+                        continue
+                    if outcome["status"] is None:
+                        outcome["status"] = "added"
+                        added.append({
+                            "item_id": outcome["document_id"],
+                            "content_hash": content_hashes[index],
+                            "name": files[index]["filename"],
+                            "source": files[index]["file_path"],
+                            "chunk_count": outcome["chunks"],
+                            "created_at": datetime.now().isoformat()
+                        })
+                finished.clear()
+                if added:
+                    await run_io(self.catalog.add_items, "document", added)
+                    self.documents_count += len(added)
+            
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                index, chunk_index, text = item
+                if chunk_index is None:
+                    finished.append(index)
+                elif outcomes[index]["status"] is None:
+                    pending.append(item)
+                    if len(pending) >= self.ingest_batch_size:
+                        await flush()
+            await flush()
+        
+        async def produce():
+            await asyncio.gather(*(extract(index, file) for index, file in enumerate(files)))
+            await queue.put(None)
+        
+        producer = asyncio.ensure_future(produce())
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-        except Exception as e:
-            logger.error(f"Error extracting PDF text: {e}")
-            raise
-        return text
+            await write()
+        finally:
+            # Only still running if the writer failed
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+        
+        for index, first in duplicates_in_batch:
+            source = outcomes[first]
+            outcomes[index]["document_id"] = source["document_id"]
+            if source["status"] == "failed":
+                outcomes[index].update(status="failed", error=source["error"])
+        
+        total_chunks = sum(outcome["chunks"] for outcome in outcomes if outcome["status"] == "added")
+        self._record_ingest("document", total_chunks, started)
+        logger.info(
+            f"Bulk ingested {len(files)} files ({total_chunks} chunks) in {time.perf_counter() - started:.2f}s"
+        )
+        return outcomes
     
-    def _extract_docx_text(self, file_path: str) -> str:
-        """Extract text from DOCX file."""
-        try:
-            doc = DocxDocument(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            return text
-        except Exception as e:
-            logger.error(f"Error extracting DOCX text: {e}")
-            raise
+    def _next_chunk_batch(self, chunks: Iterator[str]) -> List[str]:
+        """Take up to ``ingest_batch_size`` chunks from a chunk generator."""
+        return list(islice(chunks, self.ingest_batch_size))
     
-    def _extract_txt_text(self, file_path: str) -> str:
-        """Extract text from TXT file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except Exception as e:
-            logger.error(f"Error extracting TXT text: {e}")
-            raise
+    def warm_up(self):
+        """Run a dummy embedding and touch the collection so the first request pays no loading cost."""
+        self.embeddings.embed_query("warm-up")
+        if self.reranker is not None:
+            self.reranker.warm_up()
+        self.collection.count()
+    
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a list of texts in batches of ``embedding_batch_size``.
+        
+        Args:
+            texts: Chunk texts to embed
+            
+        Returns:
+            One embedding per input text, in input order
+        """
+        embeddings = []
+        for start in range(0, len(texts), self.embedding_batch_size):
+            batch = texts[start:start + self.embedding_batch_size]
+            embeddings.extend(self.embeddings.embed_documents(batch))
+        return embeddings
+    
+    async def _index_chunks(self, chunk_ids: List[str], chunk_texts: List[str]):
+        """Add stored chunks to the BM25 index, if hybrid search is enabled."""
+        if self.bm25 is not None:
+            await run_io(self.bm25.add, chunk_ids, chunk_texts)
+    
+    async def _unindex_chunks(self, chunk_ids: List[str]):
+        """Remove deleted chunks from the BM25 index, if hybrid search is enabled."""
+        if self.bm25 is not None:
+            await run_io(self.bm25.remove, chunk_ids)
+    
+    def _record_ingest(self, kind: str, chunks: int, started: float):
+        self.last_ingest = {
+            "kind": kind,
+            "chunks": chunks,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            "completed_at": datetime.now().isoformat()
+        }
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cached counters and state for readiness checks.
+        
+        Never touches ChromaDB or the catalog, so it is constant-time.
+        """
+        return {
+            "documents_count": self.documents_count,
+            "transcriptions_count": self.transcriptions_count,
+            "embedding_model_loaded": self.embeddings is not None,
+            "embedding_backend": self.embedding_backend,
+            "last_ingest": self.last_ingest,
+            "query_embedding_cache": self.query_cache_stats(),
+            "answer_cache": self.answer_cache.stats(),
+            "reranker": self.reranker.stats() if self.reranker is not None else None,
+            "keyword_index": self.bm25.stats() if self.bm25 is not None else None
+        }
+    
+    @staticmethod
+    def _normalize_question(question: str) -> str:
+        """Collapse whitespace and case so trivially different questions share a cache entry."""
+        return " ".join(question.split()).casefold()
+    
+    def _embed_query(self, question: str) -> List[float]:
+        """
+        Embed a question, reusing the embedding of a previously seen question.
+        
+        Args:
+            question: The question to embed
+            
+        Returns:
+            Embedding of the normalized question
+        """
+        key = self._normalize_question(question)
+        with self._query_cache_lock:
+            embedding = self._query_embedding_cache.get(key)
+            if embedding is not None:
+                self._query_embedding_cache.move_to_end(key)
+                self.query_cache_hits += 1
+                return embedding
+            self.query_cache_misses += 1
+        
+        embedding = self.embeddings.embed_query(key)
+        
+        if self.query_cache_size:
+            with self._query_cache_lock:
+                self._query_embedding_cache[key] = embedding
+                self._query_embedding_cache.move_to_end(key)
+                while len(self._query_embedding_cache) > self.query_cache_size:
+                    self._query_embedding_cache.popitem(last=False)
+        return embedding
+    
+    def query_cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for the query embedding cache."""
+        lookups = self.query_cache_hits + self.query_cache_misses
+        return {
+            "size": len(self._query_embedding_cache),
+            "max_size": self.query_cache_size,
+            "hits": self.query_cache_hits,
+            "misses": self.query_cache_misses,
+            "hit_rate": round(self.query_cache_hits / lookups, 3) if lookups else 0.0
+        }
     
     async def query(self, question: str, top_k: int = 5) -> Dict[str, Any]:
         """
@@ -226,14 +553,7 @@ class RAGPipeline:
             Dictionary containing answer and sources
         """
         try:
-            # Generate query embedding
-            query_embedding = self.embeddings.embed_query(question)
-            
-            # Search for relevant chunks
-            results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=top_k
-            )
+            query_embedding, results = await self._retrieve(question, top_k)
             
             if not results['documents'][0]:
                 return {
@@ -241,6 +561,12 @@ class RAGPipeline:
                     "sources": []
                 }
             
+            # Reuse the answer to a similar question over the same chunks
+            chunk_ids = results['ids'][0]
+            cached = self.answer_cache.lookup(query_embedding, chunk_ids)
+            if cached is not None:
+                return dict(cached)
+            
             # Prepare context from retrieved chunks
             context_chunks = results['documents'][0]
             # Filter out None values and ensure all chunks are strings
@@ -258,36 +584,191 @@ class RAGPipeline:
             answer = await self._generate_answer(question, context)
             
             # Extract source information
-            sources = []
-            for metadata in results['metadatas'][0]:
-                if metadata.get('source_type') == 'transcription':
-                    # Transcription source
-                    source_info = {
-                        "transcription_id": metadata.get("transcription_id", "Unknown"),
-                        "source": metadata.get("source", "audio"),
-                        "timestamp": metadata.get("timestamp", "Unknown"),
-                        "chunk_index": metadata.get("chunk_index", 0)
-                    }
-                else:
-                    # Document source
-                    source_info = {
-                        "filename": metadata.get("filename", "Unknown"),
-                        "chunk_index": metadata.get("chunk_index", 0)
-                    }
-                
-                if source_info not in sources:
-                    sources.append(source_info)
+            sources = self._extract_sources(results['metadatas'][0])
             
-            return {
+            result = {
                 "answer": answer,
                 "sources": sources,
                 "context_chunks": len(context_chunks)
             }
+            self.answer_cache.store(query_embedding, chunk_ids, result)
+            return dict(result)
             
         except Exception as e:
             logger.error(f"Error querying RAG pipeline: {e}")
             raise
     
+    async def query_stream(self, question: str, top_k: int = 5) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Query the RAG pipeline, streaming the answer as it is generated.
+        
+        Args:
+            question: The question to ask
+            top_k: Number of top chunks to retrieve
+            
+        Yields:
+            A ``{"type": "sources", ...}`` event as soon as retrieval is done,
+            then ``{"type": "token", "text": ...}`` events, then
+            ``{"type": "done", "cached": bool}`` (or ``{"type": "error"}`` if
+            generation fails part-way)
+        """
+        query_embedding, results = await self._retrieve(question, top_k)
+        context_chunks = [
+            str(chunk) for chunk in (results['documents'][0] or [])
+            if chunk is not None and str(chunk).strip()
+        ]
+        
+        if not context_chunks:
+            yield {"type": "sources", "sources": [], "context_chunks": 0}
+            yield {"type": "token", "text": "I couldn't find any relevant information to answer your question."}
+            yield {"type": "done", "cached": False}
+            return
+        
+        sources = self._extract_sources(results['metadatas'][0])
+        yield {"type": "sources", "sources": sources, "context_chunks": len(context_chunks)}
+        
+        # Reuse the answer to a similar question over the same chunks
+        chunk_ids = results['ids'][0]
+        cached = self.answer_cache.lookup(query_embedding, chunk_ids)
+        if cached is not None:
+            yield {"type": "token", "text": cached["answer"]}
+            yield {"type": "done", "cached": True}
+            return
+        
+        parts = []
+        try:
+            async for token in self._generate_answer_stream(question, "\n\n".join(context_chunks)):
+                parts.append(token)
+                yield {"type": "token", "text": token}
+        except Exception as e:
+            logger.error(f"Error streaming answer: {e}")
+            yield {"type": "error", "message": "I encountered an error while generating the answer. Please try again."}
+            return
+        
+        answer = "".join(parts).strip()
+        if answer:
+            self.answer_cache.store(query_embedding, chunk_ids, {
+                "answer": answer,
+                "sources": sources,
+                "context_chunks": len(context_chunks)
+            })
+        yield {"type": "done", "cached": False}
+    
+    @staticmethod
+    def _extract_sources(metadatas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Describe the documents and transcriptions behind retrieved chunks.
+        
+        Args:
+            metadatas: ChromaDB metadata of the retrieved chunks
+            
+        Returns:
+            Unique source descriptions in retrieval order
+        """
+        sources = []
+        for metadata in metadatas:
+            if metadata.get('source_type') == 'transcription':
+                # Transcription source
+                source_info = {
+                    "transcription_id": metadata.get("transcription_id", "Unknown"),
+                    "source": metadata.get("source", "audio"),
+                    "timestamp": metadata.get("timestamp", "Unknown"),
+                    "chunk_index": metadata.get("chunk_index", 0)
+                }
+            else:
+                # Document source
+                source_info = {
+                    "filename": metadata.get("filename", "Unknown"),
+                    "chunk_index": metadata.get("chunk_index", 0)
+                }
+            
+            if source_info not in sources:
+                sources.append(source_info)
+        return sources
+    
+    async def _retrieve(self, question: str, top_k: int):
+        """
+        Embed a question and search for the most relevant chunks.
+        
+        Args:
+            question: The question to ask
+            top_k: Number of top chunks to retrieve
+            
+        With hybrid search, ``hybrid_candidates`` chunks from the vector
+        index and from the BM25 keyword index are merged by reciprocal rank
+        fusion, so exact names, acronyms and numbers the embedding misses
+        still reach the context.
+        
+        With a reranker, ``rerank_candidates`` chunks are retrieved and the
+        ``rerank_top_n`` most relevant are kept; if reranking runs out of
+        budget, the first ``top_k`` in retrieval order are kept instead.
+        
+        Returns:
+            Tuple of (query embedding, ChromaDB query results)
+        """
+        # Generate query embedding (cached per normalized question)
+        query_embedding = await run_cpu(self._embed_query, question)
+        
+        # Search for relevant chunks
+        n_results = max(top_k, self.rerank_candidates) if self.reranker is not None else top_k
+        candidates = max(n_results, self.hybrid_candidates) if self.bm25 is not None else n_results
+        results = await run_io(
+            self.collection.query,
+            query_embeddings=[query_embedding],
+            n_results=candidates
+        )
+        if self.bm25 is not None:
+            results = await self._fuse(question, results, candidates, n_results)
+        if self.reranker is not None:
+            results = await self._rerank(question, results, top_k)
+        return query_embedding, results
+    
+    async def _fuse(self, question: str, results: Dict[str, Any], candidates: int, n_results: int) -> Dict[str, Any]:
+        """Merge BM25 hits into a ChromaDB query result by reciprocal rank fusion."""
+        keyword_hits = await run_cpu(self.bm25.search, question, candidates)
+        vector_ids = results['ids'][0]
+        fused_ids = reciprocal_rank_fusion([vector_ids, [chunk_id for chunk_id, _ in keyword_hits]], self.rrf_k)
+        fused_ids = fused_ids[:n_results]
+        
+        # Keyword-only hits were not part of the vector result
+        rows = {
+            chunk_id: (document, metadata, distance)
+            for chunk_id, document, metadata, distance in zip(
+                vector_ids, results['documents'][0], results['metadatas'][0], results['distances'][0]
+            )
+        }
+        missing = [chunk_id for chunk_id in fused_ids if chunk_id not in rows]
+        if missing:
+            fetched = await run_io(self.collection.get, ids=missing, include=["documents", "metadatas"])
+            for chunk_id, document, metadata in zip(fetched['ids'], fetched['documents'], fetched['metadatas']):
+                rows[chunk_id] = (document, metadata, None)
+        
+        # IDs the collection no longer has are dropped
+        fused_ids = [chunk_id for chunk_id in fused_ids if chunk_id in rows]
+        fused = dict(results)
+        fused['ids'] = [fused_ids]
+        for position, key in enumerate(('documents', 'metadatas', 'distances')):
+            fused[key] = [[rows[chunk_id][position] for chunk_id in fused_ids]]
+        return fused
+    
+    async def _rerank(self, question: str, results: Dict[str, Any], top_k: int) -> Dict[str, Any]:
+        """Keep the best reranked chunks of a ChromaDB query result."""
+        documents = results['documents'][0]
+        if not documents:
+            return results
+        try:
+            order = await run_cpu(self.reranker.rerank, question, [str(document or "") for document in documents])
+        except Exception as e:
+            logger.warning(f"Reranking failed, keeping vector order: {e}")
+            order = None
+        keep = order[:self.rerank_top_n] if order is not None else range(min(top_k, len(documents)))
+        
+        reranked = dict(results)
+        for key in ('ids', 'documents', 'metadatas', 'distances'):
+            if results.get(key) is not None:
+                reranked[key] = [[results[key][0][i] for i in keep]]
+        return reranked
+    
     async def _generate_answer(self, question: str, context: str) -> str:
         """
         Generate an answer using Groq LLM.
@@ -300,33 +781,11 @@ class RAGPipeline:
             Generated answer
         """
         try:
-            # Ensure context is a valid string
-            if not context or not isinstance(context, str):
-                context = "No specific context available."
-            
-            # Create prompt
-            prompt = f"""Based on the following context, please answer the question. If the context doesn't contain enough information to answer the question, please say so.
-
-Context:
-{context}
-
-Question: {question}
-
-Answer:"""
-            
             # Generate response with Groq
-            response = self.groq_client.chat.completions.create(
+            response = await run_io(
+                self.groq_client.chat.completions.create,
                 model="llama3-8b-8192",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are a helpful assistant that answers questions based on provided context. Be concise and accurate."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
+                messages=self._build_messages(question, context),
                 temperature=0.1,
                 max_tokens=1000
             )
@@ -341,6 +800,59 @@ Answer:"""
             logger.error(f"Error generating answer: {e}")
             return "I encountered an error while generating the answer. Please try again."
     
+    async def _generate_answer_stream(self, question: str, context: str) -> AsyncIterator[str]:
+        """
+        Generate an answer using Groq LLM, yielding tokens as they arrive.
+        
+        Args:
+            question: The user's question
+            context: Retrieved context from documents
+            
+        Yields:
+            Answer text fragments in order
+            
+        Raises:
+            groq.APIError: If the completion request or stream fails
+        """
+        stream = await self.async_groq_client.chat.completions.create(
+            model="llama3-8b-8192",
+            messages=self._build_messages(question, context),
+            temperature=0.1,
+            max_tokens=1000,
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    @staticmethod
+    def _build_messages(question: str, context: str) -> List[Dict[str, str]]:
+        """Build the chat messages asking the LLM to answer from context."""
+        # Ensure context is a valid string
+        if not context or not isinstance(context, str):
+            context = "No specific context available."
+        
+        # Create prompt
+        prompt = f"""Based on the following context, please answer the question. If the context doesn't contain enough information to answer the question, please say so.
+
+Context:
+{context}
+
+Question: {question}
+
+Answer:"""
+        
+        return [
+            {
+                "role": "system", 
+                "content": "You are a helpful assistant that answers questions based on provided context. Be concise and accurate."
+            },
+            {
+                "role": "user", 
+                "content": prompt
+            }
+        ]
+    
     async def list_documents(self) -> List[Dict[str, Any]]:
         """
         List all documents in the pipeline.
@@ -348,31 +860,35 @@ Answer:"""
         Returns:
             List of document metadata
         """
-        try:
-            # Get all items from collection
-            all_items = self.collection.get()
-            
-            unique_docs = {}
-            for metadata in all_items['metadatas']:
-                # Only include actual documents (not transcriptions)
-                if metadata.get('source_type') == 'transcription':
-                    continue
-                    
-                doc_id = metadata.get('document_id')
-                if doc_id and doc_id not in unique_docs:
-                    unique_docs[doc_id] = {
-                        "document_id": doc_id,
-                        "filename": metadata.get('filename', 'Unknown'),
-                        "chunk_count": 0
-                    }
-                if doc_id:
-                    unique_docs[doc_id]["chunk_count"] += 1
-            
-            return list(unique_docs.values())
+        documents = []
+        cursor = None
+        while True:
+            page, cursor = await self.page_documents(limit=500, cursor=cursor)
+            documents.extend(page)
+            if cursor is None:
+                return documents
+    
+    async def page_documents(self, limit: int = 100, cursor: str = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List documents one page at a time from the catalog.
+        
+        Args:
+            limit: Maximum documents to return
+            cursor: Cursor returned with the previous page
             
-        except Exception as e:
-            logger.error(f"Error listing documents: {e}")
-            return []
+        Returns:
+            Tuple of (document metadata, cursor for the next page or None)
+        """
+        rows, next_cursor = await run_io(self.catalog.page, "document", limit, cursor)
+        return [
+            {
+                "document_id": row["item_id"],
+                "filename": row["name"] or "Unknown",
+                "chunk_count": row["chunk_count"],
+                "upload_time": row["created_at"]
+            }
+            for row in rows
+        ], next_cursor
     
     async def add_transcription(self, text: str, timestamp: str = None, source: str = "audio") -> str:
         """
@@ -386,81 +902,109 @@ Answer:"""
         Returns:
             Transcription ID
         """
+        if not text.strip():
+            raise ValueError("Transcription text cannot be empty")
+        transcription_ids = await self.add_transcriptions([
+            {"text": text, "timestamp": timestamp, "source": source}
+        ])
+        return transcription_ids[0]
+
+    async def add_transcriptions(self, items: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add a batch of transcriptions with one dedupe lookup, one embedding
+        pass and one ChromaDB insert.
+        
+        Args:
+            items: Dicts with "text" and optional "timestamp" and "source"
+            
+        Returns:
+            Transcription IDs in the same order as ``items``; duplicates map to
+            the ID of the already stored transcription
+        """
         try:
-            if not text.strip():
-                raise ValueError("Transcription text cannot be empty")
-            
-            # Generate transcription ID
-            transcription_id = str(uuid.uuid4())
-            
-            # Create document hash for deduplication
-            content_hash = hashlib.md5(text.encode()).hexdigest()
-            
-            # Check if transcription already exists
-            existing_transcriptions = self.collection.get(
-                where={
-                    "$and": [
-                        {"content_hash": content_hash},
-                        {"source_type": "transcription"}
-                    ]
-                }
-            )
+            for item in items:
+                if not item["text"].strip():
+                    raise ValueError("Transcription text cannot be empty")
+            if not items:
+                return []
             
-            if existing_transcriptions['ids']:
-                logger.info(f"Transcription with same content already exists: {existing_transcriptions['ids'][0]}")
-                return existing_transcriptions['ids'][0]
+            started = time.perf_counter()
             
-            # Split text into chunks if it's long
-            documents = self.text_splitter.create_documents([text])
+            # Create document hashes for deduplication
+            content_hashes = [hashlib.md5(item["text"].encode()).hexdigest() for item in items]
             
-            # Process each chunk
+            # Check which transcriptions already exist
+            known_ids = await run_io(self.catalog.find_many_by_hash, "transcription", content_hashes)
+            
+            transcription_ids = []
             chunk_ids = []
             chunk_texts = []
-            chunk_embeddings = []
             chunk_metadatas = []
+            new_transcriptions = {}
             
-            for i, doc in enumerate(documents):
-                chunk_id = f"{transcription_id}_chunk_{i}"
-                chunk_ids.append(chunk_id)
-                chunk_texts.append(doc.page_content)
+            for item, content_hash in zip(items, content_hashes):
+                if content_hash in known_ids:
+                    logger.info(f"Transcription with same content already exists: {known_ids[content_hash]}")
+                    transcription_ids.append(known_ids[content_hash])
+                    continue
                 
-                # Generate embedding
-                embedding = self.embeddings.embed_query(doc.page_content)
-                chunk_embeddings.append(embedding)
+                # Generate transcription ID
+                transcription_id = str(uuid.uuid4())
+                known_ids[content_hash] = transcription_id
+                transcription_ids.append(transcription_id)
+                source = item.get("source", "audio")
+                timestamp = item.get("timestamp") or datetime.now().isoformat()
                 
-                # Create metadata for transcription
-                metadata = {
-                    "transcription_id": transcription_id,
-                    "source_type": "transcription",
-                    "source": source,
-                    "chunk_index": i,
+                # Split text into chunks if it's long
+                documents = self.text_splitter.create_documents([item["text"]])
+                for i, doc in enumerate(documents):
+                    chunk_ids.append(f"{transcription_id}_chunk_{i}")
+                    chunk_texts.append(doc.page_content)
+                    
+                    # Create metadata for transcription
+                    chunk_metadatas.append({
+                        "transcription_id": transcription_id,
+                        "source_type": "transcription",
+                        "source": source,
+                        "chunk_index": i,
+                        "content_hash": content_hash,
+                        "timestamp": timestamp
+                    })
+                
+                new_transcriptions[transcription_id] = {
+                    "item_id": transcription_id,
                     "content_hash": content_hash,
-                    "timestamp": timestamp or datetime.now().isoformat()
+                    "source": source,
+                    "chunk_count": len(documents),
+                    "created_at": timestamp
                 }
-                chunk_metadatas.append(metadata)
-            
-            # Add to ChromaDB
-            self.collection.add(
-                ids=chunk_ids,
-                documents=chunk_texts,
-                embeddings=chunk_embeddings,
-                metadatas=chunk_metadatas
-            )
             
-            # Store transcription metadata
-            self.documents_metadata[transcription_id] = {
-                "source_type": "transcription",
-                "source": source,
-                "content_hash": content_hash,
-                "chunk_count": len(documents),
-                "timestamp": timestamp or datetime.now().isoformat()
-            }
+            if chunk_ids:
+                # Generate embeddings for every chunk in the batch at once
+                chunk_embeddings = await run_cpu(self._embed_texts, chunk_texts)
+                
+                # Add to ChromaDB
+                self.answer_cache.invalidate(chunk_ids)
+                await run_io(
+                    self.collection.add,
+                    ids=chunk_ids,
+                    documents=chunk_texts,
+                    embeddings=chunk_embeddings,
+                    metadatas=chunk_metadatas
+                )
+                await self._index_chunks(chunk_ids, chunk_texts)
+                
+                # Store transcription metadata
+                await run_io(self.catalog.add_items, "transcription", list(new_transcriptions.values()))
             
-            logger.info(f"Added transcription with {len(documents)} chunks from {source}")
-            return transcription_id
+            if new_transcriptions:
+                self.transcriptions_count += len(new_transcriptions)
+                self._record_ingest("transcription", len(chunk_ids), started)
+            logger.info(f"Added {len(new_transcriptions)} transcriptions with {len(chunk_ids)} chunks")
+            return transcription_ids
             
         except Exception as e:
-            logger.error(f"Error adding transcription: {e}")
+            logger.error(f"Error adding transcriptions: {e}")
             raise
 
     async def delete_transcription(self, transcription_id: str) -> bool:
@@ -475,7 +1019,8 @@ Answer:"""
         """
         try:
             # Get all chunks for this transcription
-            transcription_chunks = self.collection.get(
+            transcription_chunks = await run_io(
+                self.collection.get,
                 where={"transcription_id": {"$eq": transcription_id}}
             )
             
@@ -484,11 +1029,13 @@ Answer:"""
                 return False
             
             # Delete chunks from collection
-            self.collection.delete(ids=transcription_chunks['ids'])
+            await run_io(self.collection.delete, ids=transcription_chunks['ids'])
+            self.answer_cache.invalidate(transcription_chunks['ids'])
+            await self._unindex_chunks(transcription_chunks['ids'])
             
             # Remove from metadata storage
-            if transcription_id in self.documents_metadata:
-                del self.documents_metadata[transcription_id]
+            if await run_io(self.catalog.remove, transcription_id):
+                self.transcriptions_count -= 1
             
             logger.info(f"Deleted transcription {transcription_id} with {len(transcription_chunks['ids'])} chunks")
             return True
@@ -509,7 +1056,8 @@ Answer:"""
         """
         try:
             # Get all chunks for this document
-            document_chunks = self.collection.get(
+            document_chunks = await run_io(
+                self.collection.get,
                 where={"document_id": {"$eq": document_id}}
             )
             
@@ -518,11 +1066,13 @@ Answer:"""
                 return False
             
             # Delete chunks from collection
-            self.collection.delete(ids=document_chunks['ids'])
+            await run_io(self.collection.delete, ids=document_chunks['ids'])
+            self.answer_cache.invalidate(document_chunks['ids'])
+            await self._unindex_chunks(document_chunks['ids'])
             
             # Remove from metadata storage
-            if document_id in self.documents_metadata:
-                del self.documents_metadata[document_id]
+            if await run_io(self.catalog.remove, document_id):
+                self.documents_count -= 1
             
             logger.info(f"Deleted document {document_id} with {len(document_chunks['ids'])} chunks")
             return True
@@ -538,26 +1088,32 @@ Answer:"""
         Returns:
             List of transcription metadata
         """
-        try:
-            # Get transcriptions from collection
-            transcriptions = self.collection.get(
-                where={"source_type": {"$eq": "transcription"}}
-            )
-            
-            unique_transcriptions = {}
-            for metadata in transcriptions['metadatas']:
-                transcription_id = metadata['transcription_id']
-                if transcription_id not in unique_transcriptions:
-                    unique_transcriptions[transcription_id] = {
-                        "transcription_id": transcription_id,
-                        "source": metadata['source'],
-                        "timestamp": metadata['timestamp'],
-                        "chunk_count": 0
-                    }
-                unique_transcriptions[transcription_id]["chunk_count"] += 1
-            
-            return list(unique_transcriptions.values())
+        transcriptions = []
+        cursor = None
+        while True:
+            page, cursor = await self.page_transcriptions(limit=500, cursor=cursor)
+            transcriptions.extend(page)
+            if cursor is None:
+                return transcriptions
+    
+    async def page_transcriptions(self, limit: int = 100, cursor: str = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List transcriptions one page at a time from the catalog.
+        
+        Args:
+            limit: Maximum transcriptions to return
+            cursor: Cursor returned with the previous page
             
-        except Exception as e:
-            logger.error(f"Error listing transcriptions: {e}")
-            return []
+        Returns:
+            Tuple of (transcription metadata, cursor for the next page or None)
+        """
+        rows, next_cursor = await run_io(self.catalog.page, "transcription", limit, cursor)
+        return [
+            {
+                "transcription_id": row["item_id"],
+                "source": row["source"],
+                "timestamp": row["created_at"],
+                "chunk_count": row["chunk_count"]
+            }
+            for row in rows
+        ], next_cursor
@@ -0,0 +1,136 @@
+"""
+Cross-encoder reranking of retrieved chunks under a latency budget.
+"""
+import time
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from core.config import config
+from core.embeddings import create_onnx_session, resolve_onnx_model
+
+class CrossEncoderReranker:
+    """
+    Reorders vector-search candidates by cross-encoder relevance.
+
+    A cross-encoder reads the question and a chunk together, which ranks far
+    better than embedding distance, but costs a model call per pair. Pairs
+    are scored ``batch_size`` at a time on an ONNX Runtime session; before
+    each batch the reranker checks whether it can still finish within
+    ``budget_ms`` (judging by the slowest batch so far) and otherwise gives
+    up, so the caller keeps the vector order instead of waiting.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        tokenizer: Any,
+        batch_size: int = None,
+        budget_ms: float = None,
+        max_length: int = 512
+    ):
+        """
+        Initialize the reranker.
+
+        Args:
+            session: ``onnxruntime.InferenceSession`` of the cross-encoder
+            tokenizer: ``tokenizers.Tokenizer`` of the model
+            batch_size: Pairs scored per model call
+            budget_ms: Time allowed for one rerank before falling back
+            max_length: Tokens kept per (question, chunk) pair
+        """
+        self.session = session
+        self.tokenizer = tokenizer
+        self.batch_size = max(1, batch_size or config.RERANK_BATCH_SIZE)
+        self.budget_ms = config.RERANK_BUDGET_MS if budget_ms is None else budget_ms
+        self.input_names = {model_input.name for model_input in session.get_inputs()}
+
+        pad_id = tokenizer.token_to_id("[PAD]")
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding(pad_id=pad_id if pad_id is not None else 0, pad_token="[PAD]")
+
+        # Metrics
+        self._lock = threading.Lock()
+        self.reranked = 0
+        self.fallbacks = 0
+        self.last_ms: Optional[float] = None
+
+    @classmethod
+    def load(cls, model_name: str = None, onnx_file: str = None, threads: int = None) -> "CrossEncoderReranker":
+        """
+        Load a cross-encoder from a local directory or the Hugging Face Hub.
+
+        Args:
+            model_name: Model directory or Hub repository (default: RERANK_MODEL)
+            onnx_file: ONNX file in it (default: RERANK_ONNX_FILE)
+            threads: ONNX Runtime intra-op threads (default: EMBEDDING_THREADS)
+        """
+        from tokenizers import Tokenizer
+
+        model_path, tokenizer_path = resolve_onnx_model(
+            model_name or config.RERANK_MODEL, onnx_file or config.RERANK_ONNX_FILE
+        )
+        return cls(create_onnx_session(model_path, threads), Tokenizer.from_file(tokenizer_path))
+
+    def warm_up(self):
+        """Score one pair so the first real rerank pays no initialization cost."""
+        self._score_batch("warm-up", ["warm-up"])
+
+    def _score_batch(self, question: str, passages: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch([(question, passage) for passage in passages])
+        inputs = {
+            "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64),
+            "token_type_ids": np.array([encoding.type_ids for encoding in encodings], dtype=np.int64)
+        }
+        logits = self.session.run(None, {name: inputs[name] for name in self.input_names})[0]
+        # One relevance logit per pair (the last one for multi-label heads)
+        return logits.reshape(len(passages), -1)[:, -1]
+
+    def rerank(self, question: str, passages: List[str], budget_ms: float = None) -> Optional[List[int]]:
+        """
+        Rank passages by relevance to a question.
+
+        Args:
+            question: The user's question
+            passages: Candidate chunk texts in vector-search order
+            budget_ms: Override of the reranker's budget (0 or less: unlimited)
+
+        Returns:
+            Indices into ``passages``, most relevant first, or None if the
+            budget ran out before every passage was scored
+        """
+        budget = (self.budget_ms if budget_ms is None else budget_ms) / 1000
+        started = time.perf_counter()
+        scores = []
+        slowest = 0.0
+        for start in range(0, len(passages), self.batch_size):
+            elapsed = time.perf_counter() - started
+            if budget > 0 and start and elapsed + slowest > budget:
+                self._record(started, fell_back=True)
+                return None
+            batch_started = time.perf_counter()
+            scores.extend(self._score_batch(question, passages[start:start + self.batch_size]))
+            slowest = max(slowest, time.perf_counter() - batch_started)
+        self._record(started, fell_back=False)
+        # Stable sort keeps vector order between equally scored chunks
+        return sorted(range(len(passages)), key=lambda i: -scores[i])
+
+    def _record(self, started: float, fell_back: bool):
+        with self._lock:
+            self.last_ms = round((time.perf_counter() - started) * 1000, 1)
+            if fell_back:
+                self.fallbacks += 1
+            else:
+                self.reranked += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return rerank counters and the latency of the last rerank."""
+        with self._lock:
+            return {
+                "budget_ms": self.budget_ms,
+                "reranked": self.reranked,
+                "fallbacks": self.fallbacks,
+                "last_ms": self.last_ms
+            }
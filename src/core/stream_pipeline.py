@@ -0,0 +1,204 @@
+"""
+Per-stream staged transcription pipeline with ordered delivery.
+"""
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+import logging
+
+from core.audio_processor import AudioProcessor
+from core.config import config
+
+logger = logging.getLogger(__name__)
+
+# Signature of the delivery callback: (sequence number, text, segment info)
+DeliverCallback = Callable[[int, str, Dict[str, Any]], Awaitable[None]]
+
+_STOP = object()
+
+class AudioStreamPipeline:
+    """
+    Runs one audio stream through receive -> segment -> transcribe -> deliver.
+
+    - receive: ``submit()`` puts frames on a bounded queue; when it is full
+      the caller waits, which stops it reading the socket (backpressure)
+    - segment: cuts frames into speech segments and numbers them
+    - transcribe: up to ``max_in_flight`` Whisper calls run concurrently
+    - deliver: results are reordered and handed to ``on_result`` strictly in
+      sequence order, so captions never arrive out of order
+
+    Lag is measured per segment as the time from receiving the segment's last
+    audio frame to delivering its transcription.
+    """
+
+    def __init__(
+        self,
+        audio_processor: AudioProcessor,
+        on_result: DeliverCallback,
+        max_in_flight: int = None,
+        queue_size: int = None
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            audio_processor: The stream's processor (buffering, VAD, Whisper)
+            on_result: Coroutine called with each transcription, in order
+            max_in_flight: Concurrent transcriptions for this stream
+            queue_size: Capacity of the frame and segment queues
+        """
+        self.audio_processor = audio_processor
+        self.on_result = on_result
+        self.max_in_flight = max(1, max_in_flight or config.AUDIO_STREAM_MAX_IN_FLIGHT)
+        queue_size = max(1, queue_size or config.AUDIO_STREAM_QUEUE_SIZE)
+
+        self._frames: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._segments: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._results: Dict[int, Any] = {}
+        self._result_ready = asyncio.Event()
+        self._next_sequence = 0
+        self._next_delivery = 0
+        self._tasks = []
+        self._running = set()
+
+        # Metrics
+        self.frames_received = 0
+        self.segments_created = 0
+        self.in_flight = 0
+        self.delivered = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+
+    def start(self):
+        """Start the segment, transcribe and deliver stages."""
+        self._tasks = [
+            asyncio.ensure_future(self._segment_stage()),
+            asyncio.ensure_future(self._transcribe_stage()),
+            asyncio.ensure_future(self._deliver_stage())
+        ]
+
+    async def submit(self, audio_bytes: bytes, format_info: Dict[str, Any]):
+        """Queue a received frame; waits while the pipeline is saturated."""
+        self.frames_received += 1
+        await self._frames.put((audio_bytes, format_info, time.perf_counter()))
+
+    async def close(self, flush: bool = True):
+        """
+        Stop accepting audio and wait for queued work to be delivered.
+
+        Args:
+            flush: Transcribe speech still buffered in the processor
+        """
+        if not self._tasks:
+            return
+        await self._frames.put((_STOP, flush, time.perf_counter()))
+        try:
+            await asyncio.gather(*self._tasks)
+        finally:
+            self._tasks = []
+
+    async def abort(self):
+        """Cancel all stages without delivering pending results."""
+        tasks = self._tasks + list(self._running)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _segment_stage(self):
+        format_info: Dict[str, Any] = {}
+        while True:
+            audio_bytes, info, received_at = await self._frames.get()
+            if audio_bytes is _STOP:
+                if info and format_info:
+                    for segment in self.audio_processor.flush_segments():
+                        await self._queue_segment(segment, format_info, received_at)
+                await self._segments.put(_STOP)
+                return
+            format_info = info
+            try:
+                segments = self.audio_processor.segment_audio(audio_bytes, info)
+            except Exception as e:
+                logger.error(f"Error segmenting audio: {e}")
+                continue
+            for segment in segments:
+                await self._queue_segment(segment, info, received_at)
+
+    async def _queue_segment(self, segment: bytes, format_info: Dict[str, Any], received_at: float):
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        self.segments_created += 1
+        await self._segments.put((sequence, segment, format_info, received_at))
+
+    async def _transcribe_stage(self):
+        running = self._running
+        while True:
+            item = await self._segments.get()
+            if item is _STOP:
+                if running:
+                    await asyncio.gather(*running)
+                self._results[self._next_sequence] = _STOP
+                self._result_ready.set()
+                return
+            await self._slots.acquire()
+            task = asyncio.ensure_future(self._transcribe(*item))
+            running.add(task)
+            task.add_done_callback(running.discard)
+
+    async def _transcribe(self, sequence: int, segment: bytes, format_info: Dict[str, Any], received_at: float):
+        self.in_flight += 1
+        text = None
+        try:
+            text = await self.audio_processor.transcribe_segment(
+                segment,
+                format_info.get("sample_rate", 16000),
+                format_info.get("channels", 1)
+            )
+        except Exception as e:
+            logger.error(f"Error transcribing segment {sequence}: {e}")
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+            self._results[sequence] = (text, received_at, len(segment))
+            self._result_ready.set()
+
+    async def _deliver_stage(self):
+        while True:
+            await self._result_ready.wait()
+            self._result_ready.clear()
+            while self._next_delivery in self._results:
+                result = self._results.pop(self._next_delivery)
+                if result is _STOP:
+                    return
+                sequence = self._next_delivery
+                self._next_delivery += 1
+                text, received_at, size = result
+                if not text:
+                    continue
+                lag = time.perf_counter() - received_at
+                self.last_lag = lag
+                self.max_lag = max(self.max_lag, lag)
+                self.total_lag += lag
+                self.delivered += 1
+                try:
+                    await self.on_result(sequence, text, {"lag_ms": round(lag * 1000, 1), "bytes": size})
+                except Exception as e:
+                    logger.error(f"Error delivering transcription {sequence}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depths and end-to-end lag for this stream."""
+        return {
+            "frames_received": self.frames_received,
+            "frame_queue_depth": self._frames.qsize(),
+            "segment_queue_depth": self._segments.qsize(),
+            "segments_created": self.segments_created,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "delivered": self.delivered,
+            "awaiting_order": len(self._results),
+            "last_lag_ms": round(self.last_lag * 1000, 1),
+            "avg_lag_ms": round(self.total_lag / self.delivered * 1000, 1) if self.delivered else 0.0,
+            "max_lag_ms": round(self.max_lag * 1000, 1)
+        }
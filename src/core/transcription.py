@@ -0,0 +1,154 @@
+"""
+Non-blocking Groq Whisper transcription with bounded concurrency.
+"""
+import io
+import os
+import time
+import asyncio
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Union, Any
+import logging
+from groq import Groq
+
+from core.config import config
+from core.wav import WavPayload
+
+logger = logging.getLogger(__name__)
+
+class GroqClientPool:
+    """
+    Small round-robin pool of Groq clients shared by all audio sessions.
+
+    Each client keeps its own HTTP connection pool, so a handful of clients
+    is enough to serve many concurrent streams without one client per socket.
+    """
+
+    def __init__(self, size: int = None, client_factory: Optional[Callable[[], Any]] = None):
+        """
+        Initialize the client pool.
+
+        Args:
+            size: Number of clients to create
+            client_factory: Callable returning a new client (defaults to Groq)
+        """
+        size = max(1, size or config.GROQ_CLIENT_POOL_SIZE)
+        factory = client_factory or (lambda: Groq(api_key=os.getenv("GROQ_API_KEY")))
+        self.clients = [factory() for _ in range(size)]
+        self._cycle = itertools.cycle(self.clients)
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Any:
+        """Return the next client in round-robin order."""
+        with self._lock:
+            return next(self._cycle)
+
+class TranscriptionService:
+    """
+    Runs blocking Whisper uploads on a bounded thread pool.
+
+    The event loop only awaits the result, so WebSockets and HTTP requests
+    keep being served while transcriptions are in flight. At most
+    ``max_concurrency`` uploads run at once; further requests wait in a queue
+    whose depth is reported by ``stats()``.
+    """
+
+    def __init__(self, client_pool: Optional[GroqClientPool] = None, max_concurrency: int = None):
+        """
+        Initialize the transcription service.
+
+        Args:
+            client_pool: Pool of Groq clients to upload with
+            max_concurrency: Maximum number of transcriptions in flight
+        """
+        self.client_pool = client_pool or GroqClientPool()
+        self.max_concurrency = max(1, max_concurrency or config.TRANSCRIPTION_MAX_CONCURRENCY)
+        self.model = config.WHISPER_MODEL
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="transcription"
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # Metrics
+        self.queued = 0
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_latency = 0.0
+
+    async def transcribe(self, wav_data: Union[WavPayload, bytes], language: str = "en") -> str:
+        """
+        Transcribe WAV audio without blocking the event loop.
+
+        Args:
+            wav_data: In-memory WAV payload (or complete WAV bytes)
+            language: Spoken language hint for Whisper
+
+        Returns:
+            Raw transcription text
+        """
+        if self._semaphore.locked():
+            # All slots are busy, so this call has to wait its turn
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.queued -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.in_flight += 1
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(
+                self._executor,
+                self._transcribe_sync,
+                self.client_pool.acquire(),
+                wav_data,
+                language
+            )
+            self.completed += 1
+            return text
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.total_latency += time.perf_counter() - start
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def _transcribe_sync(self, client: Any, wav_data: Union[WavPayload, bytes], language: str) -> str:
+        """Upload audio to Groq Whisper from memory; runs on an executor thread."""
+        audio_file = wav_data if isinstance(wav_data, WavPayload) else io.BytesIO(wav_data)
+        audio_file.seek(0)
+        transcription = client.audio.transcriptions.create(
+            file=("audio.wav", audio_file, "audio/wav"),
+            model=self.model,
+            language=language,
+            response_format="text"
+        )
+        if isinstance(transcription, str):
+            return transcription
+        return getattr(transcription, "text", "") or ""
+
+    def stats(self) -> Dict[str, Any]:
+        """Return concurrency and latency counters for monitoring."""
+        finished = self.completed + self.failed
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queued,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_latency_ms": round(self.total_latency / finished * 1000, 1) if finished else 0.0
+        }
+
+    def shutdown(self):
+        """Stop the executor threads."""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,157 @@
+"""
+Background indexing of audio transcriptions into the RAG pipeline.
+"""
+import time
+import asyncio
+import inspect
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+from core.config import config
+
+logger = logging.getLogger(__name__)
+
+class TranscriptionIndexer:
+    """
+    Queues transcriptions and indexes them off the caption path.
+
+    A single background worker drains the queue in micro-batches: it waits for
+    the first item, then collects more for up to ``linger_ms`` or until
+    ``max_batch_size`` items are pending, and indexes the whole batch with one
+    ``add_transcriptions`` call (one embedding pass and one ChromaDB insert).
+
+    ``submit()`` returns a future that resolves to the transcription ID once
+    the segment is queryable, so callers can signal readiness.
+    """
+
+    def __init__(
+        self,
+        pipeline_factory: Callable[[], Any],
+        max_batch_size: int = None,
+        linger_ms: int = None,
+        max_queue_size: int = None
+    ):
+        """
+        Initialize the indexer.
+
+        Args:
+            pipeline_factory: Returns the RAG pipeline, or an awaitable of it
+                (called per batch)
+            max_batch_size: Most transcriptions indexed per batch
+            linger_ms: How long to wait for a batch to fill up
+            max_queue_size: Capacity of the pending queue; ``submit`` waits
+                when it is full
+        """
+        self.pipeline_factory = pipeline_factory
+        self.max_batch_size = max(1, max_batch_size or config.TRANSCRIPTION_INDEX_BATCH_SIZE)
+        linger_ms = config.TRANSCRIPTION_INDEX_LINGER_MS if linger_ms is None else linger_ms
+        self.linger = max(0, linger_ms) / 1000
+        self.max_queue_size = max(1, max_queue_size or config.TRANSCRIPTION_INDEX_QUEUE_SIZE)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.submitted = 0
+        self.indexed = 0
+        self.failed = 0
+        self.batches = 0
+        self.last_batch_size = 0
+        self.last_index_latency = 0.0
+        self.total_index_latency = 0.0
+
+    def _ensure_worker(self):
+        if self._worker is None or self._worker.done():
+            if self._queue is None:
+                self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._worker = asyncio.ensure_future(self._run())
+
+    async def submit(self, text: str, timestamp: str = None, source: str = "audio") -> asyncio.Future:
+        """
+        Queue a transcription for indexing.
+
+        Args:
+            text: The transcribed text
+            timestamp: When the transcription was created
+            source: Source of the transcription
+
+        Returns:
+            Future resolving to the transcription ID once it is indexed
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        item = {"text": text, "timestamp": timestamp, "source": source}
+        self.submitted += 1
+        await self._queue.put((item, future, time.perf_counter()))
+        return future
+
+    async def _next_batch(self) -> List:
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.linger
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                rag_pipeline = self.pipeline_factory()
+                if inspect.isawaitable(rag_pipeline):
+                    rag_pipeline = await rag_pipeline
+                transcription_ids = await rag_pipeline.add_transcriptions([item for item, _, _ in batch])
+            except Exception as e:
+                logger.error(f"Error indexing {len(batch)} transcriptions: {e}")
+                self.failed += len(batch)
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            now = time.perf_counter()
+            self.batches += 1
+            self.indexed += len(batch)
+            self.last_batch_size = len(batch)
+            for (_, future, queued_at), transcription_id in zip(batch, transcription_ids):
+                latency = now - queued_at
+                self.last_index_latency = latency
+                self.total_index_latency += latency
+                if not future.done():
+                    future.set_result(transcription_id)
+
+    async def drain(self):
+        """Wait until every queued transcription has been indexed."""
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
+
+    async def shutdown(self):
+        """Index what is still queued, then stop the worker."""
+        await self.drain()
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        self._queue = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, batching and time-to-queryable figures."""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "submitted": self.submitted,
+            "indexed": self.indexed,
+            "failed": self.failed,
+            "batches": self.batches,
+            "last_batch_size": self.last_batch_size,
+            "avg_batch_size": round(self.indexed / self.batches, 2) if self.batches else 0.0,
+            "last_index_latency_ms": round(self.last_index_latency * 1000, 1),
+            "avg_index_latency_ms": round(self.total_index_latency / self.indexed * 1000, 1) if self.indexed else 0.0
+        }
@@ -0,0 +1,169 @@
+"""
+Voice-activity-gated segmentation of streaming PCM audio using webrtcvad.
+"""
+from collections import deque
+from typing import Deque, List, Optional
+import logging
+
+try:
+    import webrtcvad
+except ImportError:  # pragma: no cover - optional dependency
+    webrtcvad = None
+
+from core.config import config
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_SAMPLE_RATES = (8000, 16000, 32000, 48000)
+
+def vad_available() -> bool:
+    """Return True if webrtcvad can be imported."""
+    return webrtcvad is not None
+
+class VADSegmenter:
+    """
+    Turns a stream of 16-bit mono PCM into speech segments.
+
+    Audio is classified in fixed 10/20/30 ms frames. A segment opens on the
+    first voiced frame (with a short pre-roll so word onsets are kept) and is
+    emitted once ``silence_ms`` of trailing silence is seen, or when it reaches
+    ``max_segment_bytes``. Silence between segments is never emitted, and
+    segments with less than ``min_speech_ms`` of voiced audio are dropped.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        aggressiveness: int = None,
+        frame_ms: int = 30,
+        silence_ms: int = None,
+        pre_roll_ms: int = 300,
+        min_speech_ms: int = 250,
+        max_segment_bytes: int = 320000
+    ):
+        """
+        Initialize the segmenter.
+
+        Args:
+            sample_rate: Sample rate in Hz (8000, 16000, 32000 or 48000)
+            aggressiveness: webrtcvad mode, 0 (least) to 3 (most aggressive)
+            frame_ms: VAD frame length (10, 20 or 30 ms)
+            silence_ms: Trailing silence that ends a segment
+            pre_roll_ms: Audio kept before the first voiced frame
+            min_speech_ms: Minimum voiced audio for a segment to be emitted
+            max_segment_bytes: Hard cap on segment length
+
+        Raises:
+            RuntimeError: If webrtcvad is not installed
+            ValueError: If the sample rate or frame length is unsupported
+        """
+        if webrtcvad is None:
+            raise RuntimeError("webrtcvad is not installed")
+        if sample_rate not in SUPPORTED_SAMPLE_RATES:
+            raise ValueError(f"Unsupported VAD sample rate: {sample_rate}")
+        if frame_ms not in (10, 20, 30):
+            raise ValueError(f"Unsupported VAD frame length: {frame_ms} ms")
+
+        aggressiveness = config.AUDIO_VAD_AGGRESSIVENESS if aggressiveness is None else aggressiveness
+        silence_ms = config.AUDIO_VAD_SILENCE_MS if silence_ms is None else silence_ms
+
+        self.sample_rate = sample_rate
+        self.vad = webrtcvad.Vad(aggressiveness)
+        self.frame_bytes = sample_rate * frame_ms // 1000 * 2
+        self.silence_frames = max(1, silence_ms // frame_ms)
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.max_segment_bytes = max(max_segment_bytes, self.frame_bytes)
+
+        self._pending = bytearray()
+        self._pre_roll: Deque[bytes] = deque(maxlen=max(0, pre_roll_ms // frame_ms))
+        self._segment = bytearray()
+        self._in_speech = False
+        self._voiced_frames = 0
+        self._trailing_silence = 0
+
+    def feed(self, pcm: bytes) -> List[bytes]:
+        """
+        Add PCM audio and return any speech segments that completed.
+
+        Args:
+            pcm: Raw 16-bit mono PCM
+
+        Returns:
+            Completed speech segments, oldest first
+        """
+        self._pending.extend(pcm)
+        segments = []
+        frame_bytes = self.frame_bytes
+        usable = len(self._pending) - len(self._pending) % frame_bytes
+
+        with memoryview(self._pending) as view:
+            for offset in range(0, usable, frame_bytes):
+                frame = bytes(view[offset:offset + frame_bytes])
+                segment = self._process_frame(frame)
+                if segment is not None:
+                    segments.append(segment)
+        del self._pending[:usable]
+        return segments
+
+    def _process_frame(self, frame: bytes) -> Optional[bytes]:
+        is_speech = self.vad.is_speech(frame, self.sample_rate)
+
+        if not self._in_speech:
+            if not is_speech:
+                self._pre_roll.append(frame)
+                return None
+            # Speech starts: open a segment with the pre-roll audio
+            self._in_speech = True
+            for buffered in self._pre_roll:
+                if len(self._segment) + len(buffered) + len(frame) <= self.max_segment_bytes:
+                    self._segment.extend(buffered)
+            self._pre_roll.clear()
+
+        completed = None
+        if len(self._segment) + len(frame) > self.max_segment_bytes:
+            # Segment is full: emit it and carry on speaking into a new one
+            completed = self._close_segment()
+            self._in_speech = True
+
+        self._segment.extend(frame)
+        if is_speech:
+            self._voiced_frames += 1
+            self._trailing_silence = 0
+        else:
+            self._trailing_silence += 1
+
+        if completed is None and self._trailing_silence >= self.silence_frames:
+            return self._close_segment()
+        return completed
+
+    def _close_segment(self) -> Optional[bytes]:
+        segment = bytes(self._segment)
+        voiced = self._voiced_frames
+        self._segment.clear()
+        self._in_speech = False
+        self._voiced_frames = 0
+        self._trailing_silence = 0
+        if voiced < self.min_speech_frames:
+            return None
+        return segment
+
+    def flush(self) -> Optional[bytes]:
+        """Emit the open segment, if any (e.g. when the stream ends)."""
+        self._pending.clear()
+        self._pre_roll.clear()
+        if not self._in_speech:
+            return None
+        return self._close_segment()
+
+    def buffered_bytes(self) -> int:
+        """Return the number of bytes currently held by the segmenter."""
+        return len(self._pending) + len(self._segment) + self.frame_bytes * len(self._pre_roll)
+
+    def reset(self):
+        """Drop all buffered audio."""
+        self._pending.clear()
+        self._pre_roll.clear()
+        self._segment.clear()
+        self._in_speech = False
+        self._voiced_frames = 0
+        self._trailing_silence = 0
@@ -0,0 +1,107 @@
+"""
+In-memory WAV payloads for uploading PCM audio without temp files.
+"""
+import io
+import struct
+from functools import lru_cache
+
+SAMPLE_WIDTH = 2  # 16-bit PCM
+
+@lru_cache(maxsize=32)
+def _fmt_chunk(sample_rate: int, channels: int) -> bytes:
+    """Build the format-dependent part of the RIFF header once per format."""
+    block_align = channels * SAMPLE_WIDTH
+    return b"WAVEfmt " + struct.pack(
+        "<IHHIIHH",
+        16,                         # fmt chunk size
+        1,                          # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,  # byte rate
+        block_align,
+        SAMPLE_WIDTH * 8
+    )
+
+def wav_header(data_size: int, sample_rate: int, channels: int) -> bytes:
+    """
+    Build a 44-byte WAV header for ``data_size`` bytes of 16-bit PCM.
+
+    Args:
+        data_size: Size of the PCM payload in bytes
+        sample_rate: Sample rate in Hz
+        channels: Number of audio channels
+
+    Returns:
+        RIFF/WAVE header bytes
+    """
+    fmt = _fmt_chunk(sample_rate, channels)
+    return (
+        b"RIFF" + struct.pack("<I", len(fmt) + 8 + data_size)
+        + fmt
+        + b"data" + struct.pack("<I", data_size)
+    )
+
+class WavPayload(io.RawIOBase):
+    """
+    Read-only, seekable file object over a WAV header plus a PCM memoryview.
+
+    The PCM is never copied into a combined buffer; readers (the HTTP client
+    building the multipart upload, or ``wave.open``) pull bytes straight
+    from the header and the caller's buffer.
+    """
+
+    def __init__(self, pcm: bytes, sample_rate: int, channels: int):
+        """
+        Initialize the payload.
+
+        Args:
+            pcm: Raw 16-bit PCM audio
+            sample_rate: Sample rate in Hz
+            channels: Number of audio channels
+        """
+        super().__init__()
+        self.pcm = memoryview(pcm)
+        self.header = wav_header(len(self.pcm), sample_rate, channels)
+        self.size = len(self.header) + len(self.pcm)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        target = memoryview(buffer).cast("B")
+        written = 0
+        header_size = len(self.header)
+        while written < len(target) and self._position < self.size:
+            if self._position < header_size:
+                source = memoryview(self.header)[self._position:]
+            else:
+                source = self.pcm[self._position - header_size:]
+            count = min(len(source), len(target) - written)
+            target[written:written + count] = source[:count]
+            written += count
+            self._position += count
+        return written
+
+    def __len__(self) -> int:
+        return self.size
@@ -4,11 +4,20 @@ Main application entry point for the Real-Time Audio RAG Agent.
 import os
 from dotenv import load_dotenv
 import uvicorn
-from fastapi import FastAPI
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from api.routes import router as api_router
+from api.routes import (
+    router as api_router,
+    shutdown_audio_sessions,
+    shutdown_ingest_jobs,
+    shutdown_transcription_indexer,
+    start_ingest_jobs,
+    start_rag_warmup
+)
+from core.config import config
+from core.executors import shutdown_executors
 
 # Load environment variables
 load_dotenv()
@@ -30,12 +39,44 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def reject_oversized_uploads(request: Request, call_next):
+    """Refuse uploads whose declared size is too large before reading the body."""
+    if request.method == "POST" and request.url.path == "/documents":
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > config.MAX_UPLOAD_BYTES:
+            return JSONResponse(
+                status_code=413,
+                content={"detail": f"File exceeds maximum upload size of {config.MAX_UPLOAD_BYTES:,} bytes"}
+            )
+    return await call_next(request)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Include API routes
 app.include_router(api_router)
 
+@app.on_event("startup")
+async def start_background_services():
+    """
+    Warm up the RAG pipeline in the background and resume ingest jobs left
+    queued or running by the previous process.
+    
+    The server starts accepting requests immediately; until the warm-up is
+    done, /ready and RAG endpoints answer 503 with Retry-After.
+    """
+    start_rag_warmup()
+    await start_ingest_jobs()
+
+@app.on_event("shutdown")
+async def shutdown_background_services():
+    """Release shared audio resources when the server stops."""
+    await shutdown_audio_sessions()
+    await shutdown_transcription_indexer()
+    await shutdown_ingest_jobs()
+    shutdown_executors()
+
 # Redirect root to the test app
 @app.get("/")
 async def redirect_to_test_app():
@@ -0,0 +1,54 @@
+"""
+Tests for the semantic answer cache.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core import answer_cache as answer_cache_module
+from core.answer_cache import SemanticAnswerCache
+
+
+def test_similar_question_over_same_chunks_hits():
+    cache = SemanticAnswerCache(max_entries=8, ttl_seconds=60, similarity_threshold=0.95)
+    cache.store([1.0, 0.0, 0.0], ["a", "b"], {"answer": "yes"})
+
+    assert cache.lookup([0.99, 0.05, 0.0], ["a", "b"]) == {"answer": "yes"}
+    assert cache.lookup([0.0, 1.0, 0.0], ["a", "b"]) is None
+    assert cache.lookup([1.0, 0.0, 0.0], ["a", "c"]) is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_invalidate_drops_answers_using_touched_chunks():
+    cache = SemanticAnswerCache(max_entries=8, ttl_seconds=60, similarity_threshold=0.9)
+    cache.store([1.0, 0.0], ["a", "b"], {"answer": "ab"})
+    cache.store([0.0, 1.0], ["c"], {"answer": "c"})
+
+    assert cache.invalidate(["b"]) == 1
+
+    assert cache.lookup([1.0, 0.0], ["a", "b"]) is None
+    assert cache.lookup([0.0, 1.0], ["c"]) == {"answer": "c"}
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(answer_cache_module.time, "monotonic", lambda: now[0])
+    cache = SemanticAnswerCache(max_entries=8, ttl_seconds=10, similarity_threshold=0.9)
+    cache.store([1.0], ["a"], {"answer": "a"})
+
+    now[0] += 11
+    assert cache.lookup([1.0], ["a"]) is None
+    assert cache.stats()["expirations"] == 1 and cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SemanticAnswerCache(max_entries=2, ttl_seconds=60, similarity_threshold=0.9)
+    cache.store([1.0], ["a"], {"answer": "a"})
+    cache.store([1.0], ["b"], {"answer": "b"})
+    cache.lookup([1.0], ["a"])
+    cache.store([1.0], ["c"], {"answer": "c"})
+
+    assert cache.lookup([1.0], ["b"]) is None
+    assert cache.lookup([1.0], ["a"]) == {"answer": "a"}
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,144 @@
+"""
+Tests for per-connection audio sessions.
+"""
+import sys
+import wave
+import asyncio
+from array import array
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.audio_sessions import AudioSessionManager
+from core.transcription import GroqClientPool
+
+FORMAT_INFO = {"format": "pcm_s16le", "channels": 1, "sample_rate": 16000}
+
+
+class StubTranscriptions:
+    """Reports which speaker produced the audio, or MIXED if streams interleaved."""
+
+    def create(self, file, **kwargs):
+        _, audio_file, _ = file
+        with wave.open(audio_file, "rb") as wav_file:
+            samples = array("h", wav_file.readframes(wav_file.getnframes()))
+        speakers = set(samples)
+        if len(speakers) != 1:
+            return "MIXED"
+        return f"speaker {speakers.pop()}"
+
+
+class StubGroqClient:
+    def __init__(self):
+        self.audio = type("Audio", (), {"transcriptions": StubTranscriptions()})()
+
+
+def speaker_frame(speaker, samples=4096):
+    """One WebSocket-sized PCM frame where every sample identifies the speaker."""
+    return array("h", [speaker] * samples).tobytes()
+
+
+@pytest.fixture
+def manager():
+    pool = GroqClientPool(size=2, client_factory=StubGroqClient)
+    return AudioSessionManager(client_pool=pool, max_sessions=64, max_buffer_size=128000, use_vad=False)
+
+
+def test_client_pool_round_robin():
+    """Sessions share a fixed set of clients."""
+    pool = GroqClientPool(size=3, client_factory=StubGroqClient)
+    acquired = [pool.acquire() for _ in range(6)]
+    assert acquired[:3] == pool.clients
+    assert acquired[3:] == pool.clients
+
+
+@pytest.mark.asyncio
+async def test_sessions_have_isolated_buffers(manager):
+    """Interleaved frames from two sockets never mix."""
+    first_id, first = manager.open_session()
+    second_id, second = manager.open_session()
+
+    results = {first_id: [], second_id: []}
+    for _ in range(8):
+        for session_id, processor, speaker in ((first_id, first, 101), (second_id, second, 202)):
+            text = await processor.process_audio_chunk(speaker_frame(speaker), FORMAT_INFO)
+            if text:
+                results[session_id].append(text)
+
+    assert results[first_id] and set(results[first_id]) == {"speaker 101"}
+    assert results[second_id] and set(results[second_id]) == {"speaker 202"}
+
+
+@pytest.mark.asyncio
+async def test_closing_one_session_keeps_other_buffer(manager):
+    """A disconnect only clears that connection's audio."""
+    first_id, first = manager.open_session()
+    second_id, second = manager.open_session()
+    await first.process_audio_chunk(speaker_frame(1, 1000), FORMAT_INFO)
+    await second.process_audio_chunk(speaker_frame(2, 1000), FORMAT_INFO)
+
+    assert await manager.close_session(first_id)
+
+    assert manager.get_session(first_id) is None
+    assert len(second.buffer) == 2000
+    assert manager.stats()["active_sessions"] == 1
+    assert not await manager.close_session(first_id)
+
+
+@pytest.mark.asyncio
+async def test_session_buffer_is_bounded(manager):
+    """Buffered audio never exceeds the per-session limit."""
+    _, processor = manager.open_session()
+    processor.min_chunk_size = 10 ** 9  # never transcribe, just buffer
+
+    for _ in range(40):
+        await processor.process_audio_chunk(speaker_frame(7), FORMAT_INFO)
+
+    assert len(processor.buffer) <= manager.max_buffer_size
+    assert processor.dropped_bytes == 40 * 8192 - manager.max_buffer_size
+
+
+def test_max_sessions_enforced():
+    pool = GroqClientPool(size=1, client_factory=StubGroqClient)
+    manager = AudioSessionManager(client_pool=pool, max_sessions=2, use_vad=False)
+    manager.open_session()
+    manager.open_session()
+    with pytest.raises(RuntimeError):
+        manager.open_session()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_streams_load(manager):
+    """N simulated streams running concurrently each get only their own audio."""
+
+    async def stream(speaker):
+        session_id, processor = manager.open_session()
+        texts = []
+        try:
+            for _ in range(12):
+                text = await processor.process_audio_chunk(speaker_frame(speaker), FORMAT_INFO)
+                if text:
+                    texts.append(text)
+                await asyncio.sleep(0)
+        finally:
+            await manager.close_session(session_id)
+        return speaker, texts
+
+    results = await asyncio.gather(*(stream(1000 + i) for i in range(16)))
+
+    for speaker, texts in results:
+        assert texts and set(texts) == {f"speaker {speaker}"}
+    assert manager.stats()["active_sessions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_sessions_and_owned_transcriber(manager):
+    manager.open_session()
+    manager.open_session()
+
+    await manager.shutdown()
+
+    assert manager.stats()["active_sessions"] == 0
+    assert manager.transcriber._executor._shutdown
@@ -0,0 +1,110 @@
+"""
+Tests for the /audio WebSocket protocols.
+"""
+import sys
+import json
+import wave
+import base64
+from array import array
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api import routes
+from core.audio_sessions import AudioSessionManager
+from core.transcription import GroqClientPool
+from core.transcription_indexer import TranscriptionIndexer
+
+
+class StubTranscriptions:
+    def create(self, file, **kwargs):
+        _, audio_file, _ = file
+        with wave.open(audio_file, "rb") as wav_file:
+            rate = wav_file.getframerate()
+            samples = array("h", wav_file.readframes(wav_file.getnframes()))
+        return f"speaker {samples[0]} at {rate}"
+
+
+class StubGroqClient:
+    def __init__(self):
+        self.audio = type("Audio", (), {"transcriptions": StubTranscriptions()})()
+
+
+class FakeRAGPipeline:
+    def __init__(self):
+        self.transcriptions = []
+
+    async def add_transcriptions(self, items):
+        ids = []
+        for item in items:
+            self.transcriptions.append(item["text"])
+            ids.append(f"transcription-{len(self.transcriptions)}")
+        return ids
+
+
+@pytest.fixture
+def client(monkeypatch):
+    manager = AudioSessionManager(
+        client_pool=GroqClientPool(size=1, client_factory=StubGroqClient),
+        use_vad=False
+    )
+    rag = FakeRAGPipeline()
+    monkeypatch.setattr(routes, "_audio_sessions", manager)
+    monkeypatch.setattr(routes, "_rag_pipeline", rag)
+    monkeypatch.setattr(routes, "_transcription_indexer", TranscriptionIndexer(lambda: rag, linger_ms=0))
+    app = FastAPI()
+    app.include_router(routes.router)
+    with TestClient(app) as test_client:
+        test_client.rag = rag
+        yield test_client
+    manager.transcriber.shutdown()
+
+
+def pcm_frame(value, samples=4096):
+    return array("h", [value] * samples).tobytes()
+
+
+def test_binary_mode_transcribes_raw_pcm(client):
+    with client.websocket_connect("/audio") as websocket:
+        websocket.send_text(json.dumps({"type": "start", "format": "pcm_s16le", "sample_rate": 8000, "channels": 1}))
+        ready = websocket.receive_json()
+        assert ready["type"] == "ready" and ready["sample_rate"] == 8000
+
+        for _ in range(4):
+            websocket.send_bytes(pcm_frame(42))
+        response = websocket.receive_json()
+        indexed = websocket.receive_json()
+
+    assert response["type"] == "transcription"
+    assert response["text"] == "speaker 42 at 8000"
+    assert indexed == {"type": "indexed", "sequence": response["sequence"], "transcription_id": "transcription-1"}
+    assert client.rag.transcriptions == ["speaker 42 at 8000"]
+
+
+def test_binary_frame_without_start_is_rejected(client):
+    with client.websocket_connect("/audio") as websocket:
+        websocket.send_bytes(pcm_frame(1))
+        response = websocket.receive_json()
+    assert response["type"] == "error"
+    assert "start" in response["message"]
+
+
+def test_json_mode_still_supported(client):
+    with client.websocket_connect("/audio") as websocket:
+        for _ in range(4):
+            websocket.send_text(json.dumps({
+                "type": "audio_data",
+                "data": base64.b64encode(pcm_frame(7)).decode(),
+                "sample_rate": 16000
+            }))
+        response = websocket.receive_json()
+        assert websocket.receive_json()["type"] == "indexed"
+        websocket.send_text(json.dumps({"type": "ping"}))
+        assert websocket.receive_json() == {"type": "pong"}
+
+    assert response["type"] == "transcription"
+    assert response["text"] == "speaker 7 at 16000"
@@ -0,0 +1,195 @@
+"""
+Tests for bulk document ingestion.
+"""
+import io
+import sys
+import hashlib
+import zipfile
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api import routes
+from core import rag_pipeline as rag_module
+from core.config import config
+from core.rag_pipeline import RAGPipeline
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        self.document_calls = []
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        self.document_calls.append(len(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", FakeEmbeddings)
+    pipeline = RAGPipeline()
+    monkeypatch.setattr(routes, "_rag_pipeline", pipeline)
+    return pipeline
+
+
+def document_text(i):
+    return f"Document {i}. " + f"Sentence about topic {i}. " * 60
+
+
+def write_documents(directory, count):
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = directory / f"doc{i}.txt"
+        path.write_text(document_text(i))
+        paths.append(path)
+    return paths
+
+
+def make_client():
+    app = FastAPI()
+    app.include_router(routes.router)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_chunks_from_many_files_share_batches(pipeline, tmp_path, monkeypatch):
+    pipeline.ingest_batch_size = 16
+    paths = write_documents(tmp_path / "docs", 12)
+    inserts = []
+    original_add = pipeline.collection.add
+
+    def recording_add(**kwargs):
+        inserts.append(len(kwargs["ids"]))
+        return original_add(**kwargs)
+
+    monkeypatch.setattr(pipeline.collection, "add", recording_add)
+
+    outcomes = await pipeline.add_documents([{"file_path": str(p), "filename": p.name} for p in paths])
+
+    assert [outcome["status"] for outcome in outcomes] == ["added"] * 12
+    assert [outcome["filename"] for outcome in outcomes] == [p.name for p in paths]
+    total_chunks = sum(outcome["chunks"] for outcome in outcomes)
+    assert sum(inserts) == total_chunks == pipeline.collection.count()
+    assert len(inserts) < 12 and max(inserts) <= 16
+    assert pipeline.catalog.count("document") == pipeline.documents_count == 12
+    stored = pipeline.collection.get(where={"document_id": outcomes[3]["document_id"]}, include=["metadatas"])
+    assert sorted(m["chunk_index"] for m in stored["metadatas"]) == list(range(outcomes[3]["chunks"]))
+
+
+@pytest.mark.asyncio
+async def test_duplicates_and_failures_are_reported_per_file(pipeline, tmp_path):
+    paths = write_documents(tmp_path / "docs", 2)
+    existing_id = await pipeline.add_document(str(paths[0]), paths[0].name)
+    copy = tmp_path / "docs" / "copy.txt"
+    copy.write_text(document_text(1))
+    empty = tmp_path / "docs" / "empty.txt"
+    empty.write_text("   ")
+    odt = tmp_path / "docs" / "notes.odt"
+    odt.write_text("not supported")
+
+    outcomes = await pipeline.add_documents([
+        {"file_path": str(path), "filename": path.name} for path in (paths[0], paths[1], copy, empty, odt)
+    ])
+
+    statuses = {outcome["filename"]: outcome for outcome in outcomes}
+    assert statuses["doc0.txt"]["status"] == "duplicate"
+    assert statuses["doc0.txt"]["document_id"] == existing_id
+    assert statuses["doc1.txt"]["status"] == "added"
+    assert statuses["copy.txt"]["status"] == "duplicate"
+    assert statuses["copy.txt"]["document_id"] == statuses["doc1.txt"]["document_id"]
+    assert statuses["empty.txt"]["status"] == "failed"
+    assert statuses["notes.odt"]["status"] == "failed"
+    assert "Unsupported" in statuses["notes.odt"]["error"]
+    assert pipeline.catalog.count("document") == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_write_removes_the_files_it_touched(pipeline, tmp_path, monkeypatch):
+    pipeline.ingest_batch_size = 4
+    paths = write_documents(tmp_path / "docs", 3)
+    calls = []
+    original_embed = pipeline._embed_texts
+
+    def failing_embed(texts):
+        calls.append(len(texts))
+        if len(calls) == 2:
+            raise RuntimeError("embedding failed")
+        return original_embed(texts)
+
+    monkeypatch.setattr(pipeline, "_embed_texts", failing_embed)
+
+    outcomes = await pipeline.add_documents(
+        [{"file_path": str(p), "filename": p.name} for p in paths], concurrency=1
+    )
+
+    failed = [outcome for outcome in outcomes if outcome["status"] == "failed"]
+    added = [outcome for outcome in outcomes if outcome["status"] == "added"]
+    assert failed and all(outcome["error"] == "embedding failed" for outcome in failed)
+    assert pipeline.collection.count() == sum(outcome["chunks"] for outcome in added)
+    assert pipeline.catalog.count("document") == len(added)
+
+
+@pytest.mark.asyncio
+async def test_bulk_endpoint_accepts_multipart_files(pipeline, tmp_path):
+    paths = write_documents(tmp_path / "docs", 5)
+    async with make_client() as client:
+        response = await client.post("/documents/bulk", files=[
+            ("files", (p.name, p.read_bytes(), "text/plain")) for p in paths
+        ])
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["files"] == report["added"] == 5
+    assert report["files_per_second"] > 0
+    assert [result["filename"] for result in report["results"]] == [p.name for p in paths]
+
+
+@pytest.mark.asyncio
+async def test_bulk_endpoint_unpacks_zip_archives(pipeline, tmp_path, monkeypatch):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("nested/a.txt", document_text(1))
+        archive.writestr("../escape.txt", document_text(2))
+        archive.writestr("big.txt", "x" * 5000)
+        archive.writestr("image.png", b"\x89PNG")
+    monkeypatch.setattr(config, "MAX_UPLOAD_BYTES", 4096)
+
+    async with make_client() as client:
+        response = await client.post("/documents/bulk", files={
+            "archive": ("docs.zip", buffer.getvalue(), "application/zip")
+        })
+
+    report = response.json()
+    outcomes = {result["filename"]: result["status"] for result in report["results"]}
+    assert outcomes == {"nested/a.txt": "added", "../escape.txt": "added", "big.txt": "failed"}
+    assert not (tmp_path / "escape.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_bulk_endpoint_reads_directories_inside_the_root(pipeline, tmp_path, monkeypatch):
+    write_documents(tmp_path / "seed" / "batch", 3)
+    write_documents(tmp_path / "private", 1)
+    monkeypatch.setattr(config, "BULK_INGEST_ROOT", str(tmp_path / "seed"))
+
+    async with make_client() as client:
+        response = await client.post("/documents/bulk", data={"directory": "batch"})
+        escape = await client.post("/documents/bulk", data={"directory": "../private"})
+        neither = await client.post("/documents/bulk", data={})
+
+    assert response.status_code == 200 and response.json()["added"] == 3
+    assert escape.status_code == 403
+    assert neither.status_code == 400
@@ -0,0 +1,145 @@
+"""
+Tests for the persistent document/transcription catalog.
+"""
+import os
+import sys
+import hashlib
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api import routes
+from core import rag_pipeline as rag_module
+from core.catalog import Catalog
+from core.rag_pipeline import RAGPipeline
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+@pytest.fixture
+def make_pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", FakeEmbeddings)
+    return RAGPipeline
+
+
+def test_catalog_lookup_add_remove(tmp_path):
+    catalog = Catalog(str(tmp_path / "catalog.sqlite3"))
+    catalog.add_items("transcription", [
+        {"item_id": "t1", "content_hash": "h1", "chunk_count": 1},
+        {"item_id": "t2", "content_hash": "h2", "chunk_count": 2},
+    ])
+    catalog.add_items("document", [{"item_id": "d1", "content_hash": "h1", "name": "a.txt", "chunk_count": 3}])
+
+    assert catalog.find_by_hash("transcription", "h1") == "t1"
+    assert catalog.find_by_hash("document", "h1") == "d1"
+    assert catalog.find_many_by_hash("transcription", ["h1", "h2", "h3"]) == {"h1": "t1", "h2": "t2"}
+
+    assert catalog.remove("t1")
+    assert not catalog.remove("t1")
+    assert catalog.find_by_hash("transcription", "h1") is None
+    assert catalog.count() == 2 and catalog.count("document") == 1
+    catalog.close()
+
+
+def test_catalog_pages_with_cursor(tmp_path):
+    catalog = Catalog(str(tmp_path / "catalog.sqlite3"))
+    catalog.add_items("document", [
+        {"item_id": f"d{i}", "content_hash": f"h{i}", "chunk_count": 1} for i in range(5)
+    ])
+
+    seen, cursor = [], None
+    while True:
+        rows, cursor = catalog.page("document", limit=2, cursor=cursor)
+        seen.append([row["item_id"] for row in rows])
+        if cursor is None:
+            break
+
+    assert seen == [["d0", "d1"], ["d2", "d3"], ["d4"]]
+    with pytest.raises(ValueError):
+        catalog.page("document", limit=2, cursor="not-a-cursor")
+    catalog.close()
+
+
+@pytest.mark.asyncio
+async def test_duplicates_resolve_through_catalog(make_pipeline, tmp_path):
+    pipeline = make_pipeline()
+    path = tmp_path / "notes.txt"
+    path.write_text("Quarterly planning notes. " * 50)
+
+    doc_id = await pipeline.add_document(str(path), "notes.txt")
+    transcription_id = await pipeline.add_transcription("hello world", source="test")
+
+    def no_scans(*args, **kwargs):
+        raise AssertionError("dedupe should not query ChromaDB")
+
+    original_get = pipeline.collection.get
+    pipeline.collection.get = no_scans
+    assert await pipeline.add_document(str(path), "notes.txt") == doc_id
+    assert await pipeline.add_transcription("hello world", source="test") == transcription_id
+    pipeline.collection.get = original_get
+
+    await pipeline.delete_transcription(transcription_id)
+    assert pipeline.catalog.find_by_hash("transcription", hashlib.md5(b"hello world").hexdigest()) is None
+    assert await pipeline.add_transcription("hello world", source="test") != transcription_id
+
+
+@pytest.mark.asyncio
+async def test_catalog_rebuilt_from_collection_when_missing(make_pipeline, tmp_path):
+    pipeline = make_pipeline()
+    transcription_id = await pipeline.add_transcription("persisted caption", source="test")
+    pipeline.catalog.close()
+    os.remove(pipeline.catalog.path)
+
+    restarted = make_pipeline()
+
+    assert restarted.catalog.count() == 1
+    transcriptions, _ = await restarted.page_transcriptions()
+    assert transcriptions[0]["transcription_id"] == transcription_id
+    assert transcriptions[0]["source"] == "test" and transcriptions[0]["chunk_count"] == 1
+    assert await restarted.add_transcription("persisted caption", source="test") == transcription_id
+
+
+@pytest.mark.asyncio
+async def test_listing_endpoints_paginate_from_catalog(make_pipeline, monkeypatch):
+    pipeline = make_pipeline()
+    for i in range(3):
+        await pipeline.add_transcription(f"caption {i}", source="test")
+
+    def no_scans(*args, **kwargs):
+        raise AssertionError("listing should not read ChromaDB")
+
+    pipeline.collection.get = no_scans
+    monkeypatch.setattr(routes, "_rag_pipeline", pipeline)
+    app = FastAPI()
+    app.include_router(routes.router)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = (await client.get("/transcriptions", params={"limit": 2})).json()
+        second = (await client.get("/transcriptions", params={"limit": 2, "cursor": first["next_cursor"]})).json()
+        documents = (await client.get("/documents")).json()
+        bad_cursor = await client.get("/documents", params={"cursor": "bogus"})
+
+    assert len(first["transcriptions"]) == 2 and first["next_cursor"]
+    assert len(second["transcriptions"]) == 1 and second["next_cursor"] is None
+    assert documents == {"documents": [], "next_cursor": None}
+    assert bad_cursor.status_code == 400
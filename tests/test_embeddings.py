@@ -0,0 +1,147 @@
+"""
+Tests for the embedding backends.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from tokenizers import Tokenizer, models, pre_tokenizers
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.config import config
+from core.embeddings import OnnxEmbeddings
+from core.rag_pipeline import RAGPipeline
+
+VOCAB = ["[PAD]", "[UNK]", "alpha", "beta", "gamma", "delta"]
+
+
+class _Input:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeSession:
+    """Encoder whose token state is the one-hot vector of the token ID."""
+
+    def __init__(self, input_names=("input_ids", "attention_mask", "token_type_ids")):
+        self.input_names = input_names
+        self.calls = []
+
+    def get_inputs(self):
+        return [_Input(name) for name in self.input_names]
+
+    def run(self, output_names, inputs):
+        self.calls.append(inputs)
+        return [np.eye(len(VOCAB), dtype=np.float32)[inputs["input_ids"]]]
+
+
+def make_tokenizer():
+    tokenizer = Tokenizer(models.WordLevel({token: i for i, token in enumerate(VOCAB)}, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    return tokenizer
+
+
+def test_mean_pooling_ignores_padding_and_normalizes():
+    embeddings = OnnxEmbeddings(FakeSession(), make_tokenizer(), normalize=False)
+
+    short, long = embeddings.embed_documents(["alpha", "beta beta gamma delta"])
+
+    # Padding tokens of the shorter text must not enter its average
+    assert short == pytest.approx([0, 0, 1, 0, 0, 0])
+    assert long == pytest.approx([0, 0, 0, 0.5, 0.25, 0.25])
+
+    normalized = OnnxEmbeddings(FakeSession(), make_tokenizer()).embed_query("beta gamma")
+    assert np.linalg.norm(normalized) == pytest.approx(1.0)
+
+
+def test_batches_by_length_and_keeps_input_order():
+    session = FakeSession(input_names=("input_ids", "attention_mask"))
+    embeddings = OnnxEmbeddings(session, make_tokenizer(), batch_size=2, max_length=3)
+    texts = ["alpha beta gamma delta", "beta", "gamma delta", "delta"]
+
+    vectors = embeddings.embed_documents(texts)
+
+    assert vectors == [embeddings.embed_query(text) for text in texts]
+    batches = [call["input_ids"].shape for call in session.calls[:2]]
+    assert batches == [(2, 1), (2, 3)]  # the two one-word texts share a batch, truncation caps at 3
+    assert set(session.calls[0]) == {"input_ids", "attention_mask"}
+
+
+def test_pipeline_selects_backend_from_config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    loaded = OnnxEmbeddings(FakeSession(), make_tokenizer())
+    monkeypatch.setattr(OnnxEmbeddings, "load", classmethod(lambda cls, **kwargs: loaded))
+
+    monkeypatch.setattr(config, "EMBEDDING_BACKEND", "onnx")
+    pipeline = RAGPipeline()
+    assert pipeline.embeddings is loaded
+    assert pipeline.stats()["embedding_backend"] == "onnx"
+
+    monkeypatch.setattr(config, "EMBEDDING_BACKEND", "tensorflow")
+    with pytest.raises(ValueError, match="EMBEDDING_BACKEND"):
+        RAGPipeline()
+
+
+# Each query has exactly one relevant passage; a backend must retrieve it first.
+PASSAGES = [
+    "The invoice is due within thirty days of the delivery date.",
+    "Our office is closed on public holidays and weekends.",
+    "Reset your password from the account settings page.",
+    "The warehouse ships orders every weekday at 3 pm.",
+    "Refunds are issued to the original payment method within a week.",
+    "The conference room on the second floor seats twelve people.",
+    "Backups of the database run every night at midnight.",
+    "New employees receive their laptop on the first day.",
+]
+QUERIES = [
+    ("When do I have to pay the bill?", 0),
+    ("Are you open on Saturday?", 1),
+    ("I forgot my login credentials", 2),
+    ("What time do packages leave?", 3),
+    ("How do I get my money back?", 4),
+    ("Where can a team of ten meet?", 5),
+    ("How often is data backed up?", 6),
+    ("What equipment do new hires get?", 7),
+]
+
+
+def _recall_at_1(embeddings):
+    passages = np.array(embeddings.embed_documents(PASSAGES))
+    hits = 0
+    for query, relevant in QUERIES:
+        scores = passages @ np.array(embeddings.embed_query(query))
+        hits += int(np.argmax(scores) == relevant)
+    return hits / len(QUERIES)
+
+
+def _load_onnx():
+    # Only a model already in the Hub cache; tests never download
+    from huggingface_hub import try_to_load_from_cache
+    repo = "sentence-transformers/all-MiniLM-L6-v2"
+    if not isinstance(try_to_load_from_cache(repo, config.EMBEDDING_ONNX_FILE), str):
+        pytest.skip("quantized ONNX model not cached (run benchmarks/benchmark_embedding_backends.py once)")
+    return OnnxEmbeddings.load(model_name=repo)
+
+
+def test_quantized_model_retrieval_quality():
+    """Regression check: the int8 model retrieves every relevant passage first."""
+    assert _recall_at_1(_load_onnx()) == 1.0
+
+
+def test_quantized_model_matches_torch_backend():
+    pytest.importorskip("sentence_transformers")
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    onnx = _load_onnx()
+    torch = HuggingFaceEmbeddings(
+        model_name="sentence-transformers/all-MiniLM-L6-v2", model_kwargs={'device': 'cpu'}
+    )
+
+    quantized = np.array(onnx.embed_documents(PASSAGES))
+    reference = np.array(torch.embed_documents(PASSAGES))
+    reference /= np.linalg.norm(reference, axis=1, keepdims=True)
+
+    assert np.min(np.sum(quantized * reference, axis=1)) > 0.95
+    assert _recall_at_1(onnx) >= _recall_at_1(torch)
@@ -0,0 +1,110 @@
+"""
+Tests for the CPU/IO executor layer and event-loop responsiveness during ingest.
+"""
+import sys
+import time
+import asyncio
+import hashlib
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api import routes
+from core import rag_pipeline as rag_module
+from core.executors import InstrumentedExecutor, executor_stats, shutdown_executors
+from core.rag_pipeline import RAGPipeline
+
+EMBED_BATCH_DELAY = 0.1
+
+
+class SlowEmbeddings:
+    """Embeddings that hold the calling thread like a real model would."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        time.sleep(EMBED_BATCH_DELAY)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+@pytest.mark.asyncio
+async def test_executor_reports_queue_depth_and_latency():
+    executor = InstrumentedExecutor("test", max_workers=1)
+    release = threading.Event()
+
+    calls = [asyncio.ensure_future(executor.run(release.wait, 5))]
+    while executor.stats()["active"] == 0:
+        await asyncio.sleep(0.01)
+    calls += [asyncio.ensure_future(executor.run(release.wait, 5)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    stats = executor.stats()
+    assert stats["active"] == 1 and stats["queued"] == 2
+
+    release.set()
+    await asyncio.gather(*calls)
+    with pytest.raises(ZeroDivisionError):
+        await executor.run(lambda: 1 / 0)
+
+    stats = executor.stats()
+    assert stats["max_queue_depth"] == 2
+    assert stats["completed"] == 3 and stats["failed"] == 1
+    assert stats["queued"] == 0 and stats["active"] == 0
+    assert stats["avg_queue_wait_ms"] > 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_readiness_probe_stays_responsive_during_large_ingest(tmp_path, monkeypatch):
+    """Embedding and ChromaDB work run on the pools, not on the event loop."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", SlowEmbeddings)
+    pipeline = RAGPipeline()
+    pipeline.embedding_batch_size = 4
+    monkeypatch.setattr(routes, "_rag_pipeline", pipeline)
+    monkeypatch.setattr(routes, "_ingest_jobs", None)
+
+    document = "\n\n".join(f"Paragraph {i}: " + "lorem ipsum dolor sit amet " * 30 for i in range(40))
+    app = FastAPI()
+    app.include_router(routes.router)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/documents", files={"file": ("large.txt", document.encode(), "text/plain")}
+        )
+        job_id = response.json()["job_id"]
+
+        latencies = []
+        deadline = time.perf_counter() + 30
+        while True:
+            assert time.perf_counter() < deadline, "ingest never completed"
+            start = time.perf_counter()
+            ready = await client.get("/ready")
+            latencies.append(time.perf_counter() - start)
+            assert ready.json()["status"] == "ready"
+            job = (await client.get(f"/jobs/{job_id}")).json()
+            if job["status"] not in ("queued", "running"):
+                break
+            await asyncio.sleep(0.01)
+
+    await routes.shutdown_ingest_jobs()
+    assert response.status_code == 202
+    assert job["status"] == "completed"
+    assert len(latencies) > 5
+    assert max(latencies) < EMBED_BATCH_DELAY
+    assert executor_stats()["cpu"]["completed"] > 0
+    shutdown_executors()
@@ -0,0 +1,166 @@
+"""
+Tests for streaming extraction, incremental splitting and batched document ingest.
+"""
+import sys
+import hashlib
+from pathlib import Path
+
+import pytest
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core import rag_pipeline as rag_module
+from core import extraction
+from core.config import config
+from core.executors import shutdown_executors
+from core.extraction import file_md5, iter_chunks, iter_document_text
+from core.rag_pipeline import RAGPipeline
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        self.document_calls = []
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        self.document_calls.append(len(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def build_pdf(page_texts):
+    """Write a minimal PDF with one Helvetica text line per page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    ]
+    kids = []
+    for text in page_texts:
+        stream = f"BT /F1 10 Tf 50 750 Td ({text}) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", FakeEmbeddings)
+    return RAGPipeline()
+
+
+def test_incremental_split_matches_whole_document_split():
+    splitter = RecursiveCharacterTextSplitter(chunk_size=200, chunk_overlap=40, separators=["\n\n", "\n", " ", ""])
+    pages = [f"Page {i}. " + " ".join(f"word{i}-{j}" for j in range(60)) + "\n" for i in range(50)]
+
+    streamed = list(iter_chunks(iter(pages), splitter, buffer_size=600))
+
+    assert streamed == splitter.split_text("".join(pages))
+    assert all(len(chunk) <= 200 for chunk in streamed)
+
+
+def test_pdf_text_is_yielded_page_by_page(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(build_pdf([f"Page number {i}" for i in range(5)]))
+
+    pages = list(iter_document_text(str(path), "doc.pdf"))
+
+    assert [page.strip() for page in pages] == [f"Page number {i}" for i in range(5)]
+
+
+def test_parallel_pdf_extraction_preserves_page_order(tmp_path, monkeypatch):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(build_pdf([f"Page number {i}" for i in range(40)]))
+    monkeypatch.setattr(config, "PDF_PARALLEL_MIN_PAGES", 10)
+    monkeypatch.setattr(extraction, "PDF_PAGES_PER_TASK", 3)
+
+    monkeypatch.setattr(config, "PDF_EXTRACT_WORKERS", 1)
+    serial = list(iter_document_text(str(path), "doc.pdf"))
+    monkeypatch.setattr(config, "PDF_EXTRACT_WORKERS", 2)
+    try:
+        parallel = list(iter_document_text(str(path), "doc.pdf"))
+    finally:
+        shutdown_executors()
+
+    assert parallel == serial
+    assert [page.strip() for page in parallel] == [f"Page number {i}" for i in range(40)]
+
+
+def test_unsupported_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        iter_document_text(str(tmp_path / "doc.odt"), "doc.odt")
+
+
+@pytest.mark.asyncio
+async def test_add_document_inserts_in_bounded_batches(pipeline, tmp_path, monkeypatch):
+    pipeline.ingest_batch_size = 8
+    pipeline.embedding_batch_size = 4
+    path = tmp_path / "long.pdf"
+    path.write_bytes(build_pdf([f"Page {i} " + "lorem ipsum dolor sit amet " * 20 for i in range(60)]))
+
+    inserts = []
+    original_add = pipeline.collection.add
+
+    def recording_add(**kwargs):
+        inserts.append(len(kwargs["ids"]))
+        return original_add(**kwargs)
+
+    monkeypatch.setattr(pipeline.collection, "add", recording_add)
+
+    doc_id = await pipeline.add_document(str(path), "long.pdf")
+
+    stored = pipeline.collection.get(where={"document_id": doc_id}, include=["metadatas"])
+    assert len(inserts) > 1 and max(inserts) <= 8
+    assert sum(inserts) == len(stored["ids"])
+    assert sorted(m["chunk_index"] for m in stored["metadatas"]) == list(range(len(stored["ids"])))
+    assert max(pipeline.embeddings.document_calls) <= 4
+    assert pipeline.catalog.get(doc_id)["content_hash"] == file_md5(str(path))
+    assert await pipeline.add_document(str(path), "copy.pdf") == doc_id
+
+
+@pytest.mark.asyncio
+async def test_failed_ingest_removes_inserted_batches(pipeline, tmp_path, monkeypatch):
+    pipeline.ingest_batch_size = 2
+    path = tmp_path / "doc.txt"
+    path.write_text("\n\n".join("paragraph " * 150 for _ in range(10)))
+
+    calls = []
+    original_embed = pipeline._embed_texts
+
+    def failing_embed(texts):
+        calls.append(texts)
+        if len(calls) == 3:
+            raise RuntimeError("embedding failed")
+        return original_embed(texts)
+
+    monkeypatch.setattr(pipeline, "_embed_texts", failing_embed)
+
+    with pytest.raises(RuntimeError):
+        await pipeline.add_document(str(path), "doc.txt")
+
+    assert pipeline.collection.count() == 0
+    assert pipeline.catalog.count("document") == 0
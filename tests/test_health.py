@@ -0,0 +1,166 @@
+"""
+Tests for the liveness and readiness endpoints.
+"""
+import os
+import sys
+import subprocess
+import asyncio
+import hashlib
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api import routes
+from core import rag_pipeline as rag_module
+from core.rag_pipeline import RAGPipeline
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def fail(*args, **kwargs):
+    raise AssertionError("probe must not scan or load anything")
+
+
+@pytest.fixture
+def client_factory(monkeypatch):
+    monkeypatch.setattr(routes, "_rag_pipeline", None)
+    monkeypatch.setattr(routes, "_rag_warmup", None)
+    monkeypatch.setattr(routes, "_rag_warmup_seconds", None)
+    monkeypatch.setattr(routes, "_audio_sessions", None)
+    monkeypatch.setattr(routes, "_transcription_indexer", None)
+    monkeypatch.setattr(routes, "RAGPipeline", fail)
+    app = FastAPI()
+    app.include_router(routes.router)
+    return lambda: httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_health_is_constant_time_and_never_loads_pipeline(client_factory):
+    async with client_factory() as client:
+        response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+    assert routes._rag_pipeline is None
+
+
+@pytest.mark.asyncio
+async def test_ready_reports_not_ready_until_pipeline_loaded(client_factory):
+    async with client_factory() as client:
+        response = await client.get("/ready")
+
+    assert response.status_code == 503
+    body = response.json()
+    assert body["status"] == "not_ready"
+    assert body["components"]["rag_pipeline"] == "not_loaded"
+    assert routes._rag_pipeline is None
+
+
+@pytest.mark.asyncio
+async def test_ready_reports_cached_counters_without_scans(client_factory, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", FakeEmbeddings)
+    pipeline = RAGPipeline()
+    transcription_id = await pipeline.add_transcription("first caption", source="test")
+    await pipeline.add_transcription("second caption", source="test")
+    await pipeline.delete_transcription(transcription_id)
+    monkeypatch.setattr(routes, "_rag_pipeline", pipeline)
+
+    pipeline.collection.get = fail
+    pipeline.collection.count = fail
+    pipeline.catalog.count = fail
+    pipeline.catalog.page = fail
+
+    async with client_factory() as client:
+        response = await client.get("/ready")
+
+    assert response.status_code == 200
+    rag = response.json()["rag"]
+    assert rag["transcriptions_count"] == 1 and rag["documents_count"] == 0
+    assert rag["embedding_model_loaded"] is True
+    assert rag["last_ingest"]["kind"] == "transcription"
+    assert "cpu" in response.json()["executors"]
+
+
+class BlockingEmbeddings(FakeEmbeddings):
+    """Embeddings whose model 'loads' until released."""
+
+    release = threading.Event()
+    queries = []
+
+    def __init__(self, *args, **kwargs):
+        self.release.wait(10)
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return super().embed_query(text)
+
+
+@pytest.mark.asyncio
+async def test_requests_get_503_with_retry_after_during_warm_up(client_factory, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", BlockingEmbeddings)
+    monkeypatch.setattr(routes, "RAGPipeline", RAGPipeline)
+    BlockingEmbeddings.release.clear()
+    BlockingEmbeddings.queries.clear()
+
+    async with client_factory() as client:
+        warmup = routes.start_rag_warmup()
+        waiting = asyncio.ensure_future(routes.wait_for_rag_pipeline())
+
+        health = await client.get("/health")
+        ready = await client.get("/ready")
+        query = await client.post("/query", json={"text": "anything"})
+        documents = await client.get("/documents")
+
+        assert health.status_code == 200
+        assert ready.status_code == 503 and ready.json()["status"] == "warming_up"
+        assert ready.headers["Retry-After"] == str(routes.WARMUP_RETRY_AFTER_SECONDS)
+        assert query.status_code == 503 and query.headers["Retry-After"]
+        assert documents.status_code == 503
+        assert not waiting.done()
+
+        BlockingEmbeddings.release.set()
+        await asyncio.wait_for(warmup, timeout=10)
+        pipeline = await asyncio.wait_for(waiting, timeout=1)
+        ready = await client.get("/ready")
+
+    assert pipeline is routes._rag_pipeline
+    assert ready.status_code == 200
+    assert ready.json()["warmup"]["state"] == "ready"
+    assert BlockingEmbeddings.queries == ["warm-up"]
+
+
+def test_server_import_defers_heavy_modules():
+    """Importing the app loads no vector store, text splitter or model runtime."""
+    src = Path(__file__).parent.parent / "src"
+    code = (
+        f"import sys; sys.path.insert(0, {str(src)!r}); from api import routes; "
+        "print(sorted(m for m in ('chromadb', 'langchain_text_splitters', 'langchain_community', "
+        "'onnxruntime', 'torch', 'transformers') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env={**os.environ, "GROQ_API_KEY": "test_key"}
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,168 @@
+"""
+Tests for the BM25 keyword index and hybrid (vector + keyword) retrieval.
+"""
+import os
+import sys
+import hashlib
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core import rag_pipeline as rag_module
+from core.bm25 import BM25Index, reciprocal_rank_fusion, tokenize
+from core.config import config
+from core.rag_pipeline import RAGPipeline
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+# Small relevance set: each question names something (a person, an acronym,
+# a number) that only one transcription mentions. Hash embeddings know
+# nothing about meaning, so only the keyword index can find these.
+CORPUS = [
+    "Priya Raman will own the database migration next quarter.",
+    "The SLA for enterprise customers is 99.95 percent uptime.",
+    "Invoice INV-20931 was refunded after the duplicate charge.",
+    "We agreed to move the launch to Friday after the security review.",
+    "The GDPR audit found no issues with the analytics pipeline.",
+    "Hiring plan: two backend engineers and one designer in Berlin.",
+    "Laptop refresh budget is 45000 euros for the whole team.",
+    "Marcus Okafor presented the churn analysis for Q3.",
+    "The on-call rotation changes every Monday at 9am.",
+    "Kubernetes upgrade to 1.29 is blocked on the ingress controller.",
+    "Customer onboarding emails are sent by the lifecycle service.",
+    "Backups run nightly and are kept for 30 days.",
+]
+
+RELEVANCE = [
+    ("Who owns the migration, is it Priya?", 0),
+    ("What uptime does the SLA promise?", 1),
+    ("Why was INV-20931 refunded?", 2),
+    ("Did the GDPR audit find anything?", 4),
+    ("How large is the 45000 laptop budget?", 6),
+    ("What did Marcus Okafor present?", 7),
+    ("What blocks the Kubernetes 1.29 upgrade?", 9),
+    ("How many days are backups kept, 30?", 11),
+]
+
+
+def test_tokenize_keeps_names_acronyms_and_numbers():
+    assert tokenize("The SLA is 99.95% for Priya's INV-20931") == ["sla", "99", "95", "priya", "s", "inv", "20931"]
+
+
+def test_bm25_ranks_rare_terms_and_short_chunks_first(tmp_path):
+    index = BM25Index(str(tmp_path / "bm25.sqlite3"))
+    index.add(["a", "b", "c"], [
+        "launch plan launch review",
+        "launch",
+        "review of the budget and the launch plan for next quarter",
+    ])
+
+    # Term frequency saturates, so the one-word chunk beats the repeated term
+    assert [chunk_id for chunk_id, _ in index.search("launch", 3)] == ["b", "a", "c"]
+    assert [chunk_id for chunk_id, _ in index.search("budget launch", 3)][0] == "c"
+    assert [chunk_id for chunk_id, _ in index.search("launch review", 1)] == ["a"]
+    assert index.search("nothing matches", 3) == []
+    assert index.search("the of", 3) == []
+    index.close()
+
+
+def test_bm25_updates_persist_across_reopen(tmp_path):
+    path = str(tmp_path / "bm25.sqlite3")
+    index = BM25Index(path)
+    assert index.created
+    index.add(["a", "b", "c"], ["alpha beta", "beta gamma", "gamma delta"])
+    index.remove(["b", "unknown"])
+    index.add(["c"], ["epsilon"])
+    expected = {query: index.search(query, 5) for query in ("alpha", "beta", "gamma", "epsilon")}
+    index.close()
+
+    reopened = BM25Index(path)
+    assert not reopened.created
+    assert reopened.stats() == {"chunks": 2, "terms": 3}
+    assert {query: reopened.search(query, 5) for query in expected} == expected
+    assert [chunk_id for chunk_id, _ in expected["beta"]] == ["a"]
+    assert expected["gamma"] == []
+    reopened.close()
+
+
+def test_reciprocal_rank_fusion_prefers_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d", "b"]], k=60)
+
+    # b and c appear in both rankings; a, ranked first once, beats d
+    assert fused == ["c", "b", "a", "d"]
+
+
+@pytest.fixture
+def make_pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", FakeEmbeddings)
+    return RAGPipeline
+
+
+async def recall_at(pipeline, k):
+    hits = 0
+    for question, relevant in RELEVANCE:
+        _, results = await pipeline._retrieve(question, top_k=k)
+        hits += CORPUS[relevant] in results["documents"][0]
+    return hits / len(RELEVANCE)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_retrieval_finds_keyword_matches(make_pipeline, monkeypatch):
+    monkeypatch.setattr(config, "HYBRID_CANDIDATES", 5)
+    pipeline = make_pipeline()
+    await pipeline.add_transcriptions([{"text": text} for text in CORPUS])
+
+    hybrid = await recall_at(pipeline, 3)
+    _, results = await pipeline._retrieve(RELEVANCE[0][0], top_k=3)
+    keyword_index, pipeline.bm25 = pipeline.bm25, None
+    vector_only = await recall_at(pipeline, 3)
+    pipeline.bm25 = keyword_index
+
+    assert hybrid == 1.0
+    assert vector_only < hybrid
+    assert len(results["ids"][0]) == len(results["documents"][0]) == len(results["metadatas"][0]) == 3
+    assert all(metadata["transcription_id"] for metadata in results["metadatas"][0])
+    assert pipeline.stats()["keyword_index"] == pipeline.bm25.stats()
+
+
+@pytest.mark.asyncio
+async def test_keyword_index_follows_adds_deletes_and_rebuilds(make_pipeline, tmp_path):
+    pipeline = make_pipeline()
+    transcription_ids = await pipeline.add_transcriptions([{"text": text} for text in CORPUS])
+    path = tmp_path / "notes.txt"
+    path.write_text("Zanzibar offsite agenda for the platform team.")
+    doc_id = await pipeline.add_document(str(path), "notes.txt")
+
+    assert [chunk_id for chunk_id, _ in pipeline.bm25.search("zanzibar", 5)] == [f"{doc_id}_chunk_0"]
+    assert pipeline.bm25.count() == len(CORPUS) + 1
+
+    assert await pipeline.delete_document(doc_id)
+    assert await pipeline.delete_transcription(transcription_ids[7])
+    assert pipeline.bm25.search("zanzibar", 5) == []
+    assert pipeline.bm25.search("okafor", 5) == []
+    assert pipeline.bm25.count() == len(CORPUS) - 1
+
+    # A pipeline without the index file rebuilds it from the collection
+    pipeline.bm25.close()
+    os.remove(tmp_path / "data" / "bm25.sqlite3")
+    rebuilt = make_pipeline()
+    assert rebuilt.bm25.count() == len(CORPUS) - 1
+    assert [chunk_id for chunk_id, _ in rebuilt.bm25.search("INV-20931", 1)] == [f"{transcription_ids[2]}_chunk_0"]
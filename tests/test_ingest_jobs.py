@@ -0,0 +1,141 @@
+"""
+Tests for the persistent background ingest job queue.
+"""
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.ingest_jobs import IngestJobQueue, JobStore
+
+
+class FakePipeline:
+    """Ingests by reporting progress and then waiting to be released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.started = []
+        self.deleted = []
+        self.fail = False
+
+    async def add_document(self, file_path, filename, content_hash=None, document_id=None, progress=None):
+        self.started.append(document_id)
+        await progress({"pages": 3, "chunks": 7, "embedded": 4})
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("extraction failed")
+        await progress({"pages": 3, "chunks": 7, "embedded": 7})
+        return document_id
+
+    async def delete_document(self, document_id):
+        self.deleted.append(document_id)
+        return False
+
+
+def make_queue(tmp_path, pipeline, max_workers=1):
+    return IngestJobQueue(
+        lambda: pipeline,
+        store=JobStore(str(tmp_path / "jobs.sqlite3")),
+        max_workers=max_workers,
+        upload_dir=str(tmp_path / "uploads")
+    )
+
+
+async def submit(queue, name="doc.txt"):
+    job_id = queue.new_job_id()
+    path = queue.upload_path(job_id, ".txt")
+    Path(path).write_text("content")
+    return await queue.submit(job_id, path, name, content_hash=job_id, size=7)
+
+
+async def wait_for(predicate):
+    for _ in range(500):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition never met")
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_with_bounded_concurrency_and_report_progress(tmp_path):
+    pipeline = FakePipeline()
+    queue = make_queue(tmp_path, pipeline, max_workers=2)
+
+    jobs = [await submit(queue, f"doc{i}.txt") for i in range(3)]
+    assert all(job["status"] == "queued" for job in jobs)
+    await wait_for(lambda: len(pipeline.started) == 2)
+    await asyncio.sleep(0.05)
+
+    statuses = [(await queue.get(job["job_id"]))["status"] for job in jobs]
+    assert statuses == ["running", "running", "queued"]
+    running = await queue.get(jobs[0]["job_id"])
+    assert (running["pages"], running["chunks"], running["embedded"]) == (3, 7, 4)
+
+    pipeline.release.set()
+    await queue.drain()
+    for job in jobs:
+        done = await queue.get(job["job_id"])
+        assert done["status"] == "completed" and done["document_id"] == job["job_id"]
+        assert done["embedded"] == 7
+        assert not Path(done["file_path"]).exists()
+    assert queue.stats()["completed"] == 3
+    await queue.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_job_records_error(tmp_path):
+    pipeline = FakePipeline()
+    pipeline.fail = True
+    pipeline.release.set()
+    queue = make_queue(tmp_path, pipeline)
+
+    job = await submit(queue)
+    await queue.drain()
+
+    failed = await queue.get(job["job_id"])
+    assert failed["status"] == "failed" and failed["error"] == "extraction failed"
+    assert not Path(failed["file_path"]).exists()
+    await queue.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_interrupted_jobs_resume_after_restart(tmp_path):
+    pipeline = FakePipeline()
+    queue = make_queue(tmp_path, pipeline)
+    running = await submit(queue, "running.txt")
+    queued = await submit(queue, "queued.txt")
+    await wait_for(lambda: pipeline.started)
+    await queue.shutdown()
+    queue.store.close()
+
+    assert JobStore(str(tmp_path / "jobs.sqlite3")).get(running["job_id"])["status"] == "running"
+
+    restarted = FakePipeline()
+    restarted.release.set()
+    queue = make_queue(tmp_path, restarted)
+    await queue.start()
+    await queue.drain()
+
+    assert restarted.started == [running["job_id"], queued["job_id"]]
+    # Only the interrupted job can have stored partial chunks
+    assert restarted.deleted == [running["job_id"]]
+    for job in (running, queued):
+        assert (await queue.get(job["job_id"]))["status"] == "completed"
+    assert (await queue.get(running["job_id"]))["attempts"] == 2
+    await queue.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_upload_is_recorded_as_completed(tmp_path):
+    pipeline = FakePipeline()
+    queue = make_queue(tmp_path, pipeline)
+
+    job = await queue.submit(queue.new_job_id(), None, "copy.txt", content_hash="h", size=7, document_id="existing")
+    await asyncio.sleep(0.05)
+
+    assert job["status"] == "completed" and job["document_id"] == "existing"
+    assert pipeline.started == []
+    await queue.shutdown()
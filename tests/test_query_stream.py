@@ -0,0 +1,165 @@
+"""
+Tests for streamed /query answers against a local fake LLM server.
+"""
+import sys
+import json
+import asyncio
+import time
+import socket
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api import routes
+from core import rag_pipeline as rag_module
+from core.rag_pipeline import RAGPipeline
+
+TOKENS = ["The ", "launch ", "moved ", "to ", "Friday", "."]
+TOKEN_DELAY = 0.15
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+class FakeChatHandler(BaseHTTPRequestHandler):
+    """Answers /openai/v1/chat/completions one token every TOKEN_DELAY seconds."""
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if request.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for token in TOKENS:
+                time.sleep(TOKEN_DELAY)
+                chunk = {
+                    "id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": 0,
+                    "model": request["model"],
+                    "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                self.wfile.flush()
+            self.wfile.write(b"data: [DONE]\n\n")
+            return
+
+        time.sleep(TOKEN_DELAY * len(TOKENS))
+        body = json.dumps({
+            "id": "chatcmpl-fake", "object": "chat.completion", "created": 0, "model": request["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "".join(TOKENS)},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": len(TOKENS), "total_tokens": len(TOKENS) + 1}
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_llm():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeChatHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def app_url(fake_llm, tmp_path, monkeypatch):
+    """Serve the API routes over a real socket, backed by the fake LLM."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setenv("GROQ_BASE_URL", fake_llm)
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", FakeEmbeddings)
+    pipeline = RAGPipeline()
+    pipeline.answer_cache.max_entries = 0
+    monkeypatch.setattr(routes, "_rag_pipeline", pipeline)
+
+    app = FastAPI()
+    app.include_router(routes.router)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started and time.monotonic() < deadline:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}", pipeline
+    server.should_exit = True
+    thread.join(timeout=10)
+
+
+def read_events(response):
+    """Yield (event, data, arrival time) from an SSE response."""
+    event = None
+    for line in response.iter_lines():
+        if line.startswith("event: "):
+            event = line[len("event: "):]
+        elif line.startswith("data: "):
+            yield event, json.loads(line[len("data: "):]), time.perf_counter()
+
+
+def test_stream_sends_sources_first_then_tokens(app_url):
+    url, pipeline = app_url
+    asyncio.run(pipeline.add_transcription("the launch moved to friday", source="test"))
+
+    with httpx.stream("POST", f"{url}/query/stream", json={"text": "When is the launch?"}, timeout=10) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [(event, data) for event, data, _ in read_events(response)]
+
+    assert events[0][0] == "sources"
+    assert events[0][1]["sources"][0]["source"] == "test"
+    assert "".join(data["text"] for event, data in events if event == "token") == "".join(TOKENS)
+    assert events[-1] == ("done", {"cached": False})
+
+
+def test_stream_time_to_first_byte_beats_full_response(app_url):
+    url, pipeline = app_url
+    asyncio.run(pipeline.add_transcription("the launch moved to friday", source="test"))
+    question = {"text": "When is the launch?"}
+
+    start = time.perf_counter()
+    with httpx.stream("POST", f"{url}/query", json=question, timeout=10) as response:
+        chunks = response.iter_bytes()
+        body = next(chunks)
+        full_ttfb = time.perf_counter() - start
+        body += b"".join(chunks)
+    assert json.loads(body) == "".join(TOKENS)
+
+    start = time.perf_counter()
+    with httpx.stream("POST", f"{url}/query/stream", json=question, timeout=10) as response:
+        first_token = next(at for event, _, at in read_events(response) if event == "token")
+        stream_ttfb = first_token - start
+
+    total_generation = TOKEN_DELAY * len(TOKENS)
+    assert full_ttfb >= total_generation
+    assert stream_ttfb < total_generation / 2
@@ -0,0 +1,173 @@
+"""
+Tests for embedding behaviour in the RAG pipeline.
+"""
+import sys
+import hashlib
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core import rag_pipeline as rag_module
+from core.rag_pipeline import RAGPipeline
+
+
+class FakeEmbeddings:
+    """Deterministic stand-in for HuggingFaceEmbeddings that records calls."""
+
+    def __init__(self, *args, **kwargs):
+        self.document_calls = []
+        self.query_calls = 0
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        self.document_calls.append(len(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        self.query_calls += 1
+        return self._vector(text)
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """RAG pipeline backed by a temporary ChromaDB and fake embeddings."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", FakeEmbeddings)
+    return RAGPipeline()
+
+
+def _write_document(tmp_path, paragraphs=40):
+    path = tmp_path / "large.txt"
+    path.write_text("\n\n".join(
+        f"Paragraph {i}: " + "lorem ipsum dolor sit amet " * 30 for i in range(paragraphs)
+    ))
+    return path
+
+
+@pytest.mark.asyncio
+async def test_add_document_embeds_in_batches(pipeline, tmp_path):
+    """All chunks of an ingest are embedded together, batch_size at a time."""
+    pipeline.embedding_batch_size = 16
+    path = _write_document(tmp_path)
+
+    doc_id = await pipeline.add_document(str(path), "large.txt")
+
+    stored = pipeline.collection.get(where={"document_id": doc_id})
+    calls = pipeline.embeddings.document_calls
+    assert pipeline.embeddings.query_calls == 0
+    assert sum(calls) == len(stored["ids"])
+    assert max(calls) <= 16
+    assert len(calls) == -(-len(stored["ids"]) // 16)
+
+
+@pytest.mark.asyncio
+async def test_add_transcription_uses_batched_embedding(pipeline):
+    """Transcriptions go through the same batched embedding stage."""
+    transcription_id = await pipeline.add_transcription("short live caption", source="test")
+
+    stored = pipeline.collection.get(where={"transcription_id": transcription_id})
+    assert len(stored["ids"]) == 1
+    assert pipeline.embeddings.document_calls == [1]
+    assert pipeline.embeddings.query_calls == 0
+
+
+def test_embed_texts_preserves_order(pipeline):
+    """Batched embedding returns vectors in input order."""
+    pipeline.embedding_batch_size = 3
+    texts = [f"chunk {i}" for i in range(10)]
+
+    vectors = pipeline._embed_texts(texts)
+
+    assert vectors == [pipeline.embeddings._vector(text) for text in texts]
+    assert pipeline.embeddings.document_calls == [3, 3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_add_transcriptions_indexes_batch_with_one_embed(pipeline):
+    """A batch of transcriptions is deduplicated, embedded and added at once."""
+    existing_id = await pipeline.add_transcription("already indexed", source="test")
+    pipeline.embeddings.document_calls.clear()
+
+    ids = await pipeline.add_transcriptions([
+        {"text": "first segment", "source": "test"},
+        {"text": "already indexed", "source": "test"},
+        {"text": "second segment", "source": "test"},
+        {"text": "first segment", "source": "test"},
+    ])
+
+    assert ids[1] == existing_id
+    assert ids[3] == ids[0]
+    assert len(set(ids)) == 3
+    assert pipeline.embeddings.document_calls == [2]
+    stored = pipeline.collection.get(where={"source_type": "transcription"})
+    assert len(stored["ids"]) == 3
+
+
+def test_query_embeddings_are_cached_per_normalized_question(pipeline):
+    """Repeated questions reuse their embedding; whitespace and case are ignored."""
+    first = pipeline._embed_query("What was decided?")
+    second = pipeline._embed_query("  what   was DECIDED? ")
+
+    assert second == first
+    assert pipeline.embeddings.query_calls == 1
+    stats = pipeline.query_cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_query_embedding_cache_evicts_least_recently_used(pipeline):
+    pipeline.query_cache_size = 2
+    pipeline._embed_query("a")
+    pipeline._embed_query("b")
+    pipeline._embed_query("a")
+    pipeline._embed_query("c")  # evicts "b"
+
+    pipeline._embed_query("a")
+    pipeline._embed_query("b")
+
+    assert pipeline.embeddings.query_calls == 4
+    assert pipeline.query_cache_stats()["size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_query_uses_embedding_cache(pipeline):
+    async def fake_answer(question, context):
+        return "answer"
+
+    pipeline._generate_answer = fake_answer
+    await pipeline.add_transcription("the launch moved to friday", source="test")
+
+    for _ in range(3):
+        result = await pipeline.query("When is the launch?", top_k=1)
+
+    assert result["answer"] == "answer"
+    assert pipeline.embeddings.query_calls == 1
+    assert pipeline.query_cache_stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_answer_cache_is_invalidated_when_chunks_are_deleted(pipeline):
+    calls = []
+
+    async def fake_answer(question, context):
+        calls.append(question)
+        return f"answer {len(calls)}"
+
+    pipeline._generate_answer = fake_answer
+    first_id = await pipeline.add_transcription("the launch moved to friday", source="test")
+    await pipeline.add_transcription("budget review is on monday", source="test")
+
+    first = await pipeline.query("When is the launch?", top_k=2)
+    again = await pipeline.query("when is the launch?", top_k=2)
+    assert again == first and len(calls) == 1
+
+    await pipeline.delete_transcription(first_id)
+    assert pipeline.answer_cache.stats()["invalidations"] == 1
+
+    after_delete = await pipeline.query("When is the launch?", top_k=2)
+    assert after_delete["answer"] == "answer 2"
@@ -0,0 +1,145 @@
+"""
+Tests for cross-encoder reranking of retrieved chunks.
+"""
+import sys
+import time
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pytest
+from tokenizers import Tokenizer, models, pre_tokenizers
+from tokenizers.processors import TemplateProcessing
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core import rag_pipeline as rag_module
+from core.config import config
+from core.rag_pipeline import RAGPipeline
+from core.reranker import CrossEncoderReranker
+
+VOCAB = ["[PAD]", "[UNK]", "launch", "friday", "budget", "hiring", "moved", "the", "to", "when"]
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+class _Input:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeCrossEncoder:
+    """Scores a pair by how often "friday" occurs in the passage segment."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.batches = []
+
+    def get_inputs(self):
+        return [_Input("input_ids"), _Input("attention_mask"), _Input("token_type_ids")]
+
+    def run(self, output_names, inputs):
+        time.sleep(self.delay)
+        self.batches.append(len(inputs["input_ids"]))
+        friday = VOCAB.index("friday")
+        in_passage = (inputs["input_ids"] == friday) & (inputs["token_type_ids"] == 1)
+        return [in_passage.sum(axis=1, keepdims=True).astype(np.float32)]
+
+
+def make_tokenizer():
+    tokenizer = Tokenizer(models.WordLevel({token: i for i, token in enumerate(VOCAB)}, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    # Pairs need segment IDs: 0 for the question, 1 for the passage
+    tokenizer.post_processor = TemplateProcessing(single="$A:0", pair="$A:0 $B:1")
+    return tokenizer
+
+
+PASSAGES = [
+    "hiring budget",
+    "the launch moved to friday friday",
+    "launch budget",
+    "friday",
+    "hiring",
+]
+
+
+def test_orders_passages_by_cross_encoder_score():
+    session = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(session, make_tokenizer(), batch_size=2, budget_ms=0)
+
+    order = reranker.rerank("when friday", PASSAGES)
+
+    # Question tokens do not count; ties keep vector order
+    assert order == [1, 3, 0, 2, 4]
+    assert session.batches == [2, 2, 1]
+    assert reranker.stats()["reranked"] == 1
+
+
+def test_falls_back_when_the_budget_would_be_exceeded():
+    reranker = CrossEncoderReranker(FakeCrossEncoder(delay=0.05), make_tokenizer(), batch_size=1, budget_ms=120)
+
+    assert reranker.rerank("when friday", PASSAGES) is None
+    assert reranker.rerank("when friday", PASSAGES, budget_ms=0) == [1, 3, 0, 2, 4]
+    stats = reranker.stats()
+    assert stats["fallbacks"] == 1 and stats["reranked"] == 1
+    assert stats["last_ms"] >= 250
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", FakeEmbeddings)
+    monkeypatch.setattr(config, "RERANK_CANDIDATES", 5)
+    monkeypatch.setattr(config, "RERANK_TOP_N", 2)
+    reranker = CrossEncoderReranker(FakeCrossEncoder(), make_tokenizer(), budget_ms=0)
+    pipeline = RAGPipeline(reranker=reranker)
+    pipeline.collection.add(
+        ids=[f"chunk{i}" for i in range(len(PASSAGES))],
+        documents=PASSAGES,
+        embeddings=pipeline.embeddings.embed_documents(PASSAGES),
+        metadatas=[{"filename": f"doc{i}.txt", "chunk_index": 0} for i in range(len(PASSAGES))]
+    )
+    return pipeline
+
+
+@pytest.mark.asyncio
+async def test_retrieval_keeps_the_best_reranked_chunks(pipeline):
+    _, results = await pipeline._retrieve("when friday", top_k=1)
+
+    assert results["documents"][0] == [PASSAGES[1], PASSAGES[3]]
+    assert results["ids"][0] == ["chunk1", "chunk3"]
+    assert [m["filename"] for m in results["metadatas"][0]] == ["doc1.txt", "doc3.txt"]
+    assert len(results["distances"][0]) == 2
+    assert pipeline.stats()["reranker"]["reranked"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retrieval_falls_back_to_vector_order(pipeline, monkeypatch):
+    vector_order = pipeline.collection.query(
+        query_embeddings=[pipeline.embeddings.embed_query("when friday")], n_results=3
+    )["ids"][0]
+
+    monkeypatch.setattr(pipeline.reranker, "rerank", lambda question, passages: None)
+    _, out_of_budget = await pipeline._retrieve("when friday", top_k=3)
+
+    def broken(question, passages):
+        raise RuntimeError("session failed")
+
+    monkeypatch.setattr(pipeline.reranker, "rerank", broken)
+    _, failed = await pipeline._retrieve("when friday", top_k=3)
+
+    assert out_of_budget["ids"][0] == failed["ids"][0] == vector_order
@@ -0,0 +1,131 @@
+"""
+Tests for the per-stream staged transcription pipeline.
+"""
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.stream_pipeline import AudioStreamPipeline
+
+
+class FakeProcessor:
+    """Every frame is one segment; earlier segments take longer to transcribe."""
+
+    def __init__(self, delays=None, leftover=None):
+        self.delays = delays or {}
+        self.leftover = leftover
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.release = None
+
+    def segment_audio(self, audio_bytes, format_info):
+        return [audio_bytes]
+
+    def flush_segments(self):
+        return [self.leftover] if self.leftover else []
+
+    async def transcribe_segment(self, segment, sample_rate, channels):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.release is not None:
+                await self.release.wait()
+            await asyncio.sleep(self.delays.get(segment, 0.01))
+            return segment.decode()
+        finally:
+            self.in_flight -= 1
+
+
+def collector():
+    delivered = []
+
+    async def on_result(sequence, text, info):
+        delivered.append((sequence, text, info))
+
+    return delivered, on_result
+
+
+@pytest.mark.asyncio
+async def test_results_delivered_in_sequence_order():
+    frames = [f"segment {i}".encode() for i in range(6)]
+    # First segments are the slowest, so they finish last
+    processor = FakeProcessor(delays={frame: 0.3 - i * 0.05 for i, frame in enumerate(frames)})
+    delivered, on_result = collector()
+    pipeline = AudioStreamPipeline(processor, on_result, max_in_flight=3, queue_size=8)
+    pipeline.start()
+
+    for frame in frames:
+        await pipeline.submit(frame, {"sample_rate": 16000})
+    await asyncio.wait_for(pipeline.close(), timeout=5)
+
+    assert [sequence for sequence, _, _ in delivered] == list(range(6))
+    assert [text for _, text, _ in delivered] == [frame.decode() for frame in frames]
+    assert processor.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_submit_applies_backpressure():
+    processor = FakeProcessor()
+    processor.release = asyncio.Event()
+    delivered, on_result = collector()
+    pipeline = AudioStreamPipeline(processor, on_result, max_in_flight=1, queue_size=2)
+    pipeline.start()
+
+    accepted = 0
+
+    async def producer():
+        nonlocal accepted
+        for i in range(20):
+            await pipeline.submit(f"frame {i}".encode(), {})
+            accepted += 1
+
+    producing = asyncio.ensure_future(producer())
+    await asyncio.sleep(0.1)
+
+    # 1 in flight + 1 waiting for a slot + 2 queued segments + 2 queued frames (+1 held by each stage)
+    assert accepted < 10
+    assert not producing.done()
+
+    processor.release.set()
+    await asyncio.wait_for(producing, timeout=5)
+    await asyncio.wait_for(pipeline.close(), timeout=5)
+    assert len(delivered) == 20
+
+
+@pytest.mark.asyncio
+async def test_lag_metric_and_flush_on_close():
+    processor = FakeProcessor(delays={b"slow": 0.2}, leftover=b"tail")
+    delivered, on_result = collector()
+    pipeline = AudioStreamPipeline(processor, on_result, max_in_flight=2)
+    pipeline.start()
+
+    await pipeline.submit(b"slow", {"sample_rate": 16000})
+    await asyncio.wait_for(pipeline.close(), timeout=5)
+
+    assert [text for _, text, _ in delivered] == ["slow", "tail"]
+    assert delivered[0][2]["lag_ms"] >= 200
+    stats = pipeline.stats()
+    assert stats["delivered"] == 2
+    assert stats["max_lag_ms"] >= 200
+    assert stats["in_flight"] == 0 and stats["awaiting_order"] == 0
+
+
+@pytest.mark.asyncio
+async def test_abort_cancels_pending_work():
+    processor = FakeProcessor()
+    processor.release = asyncio.Event()
+    delivered, on_result = collector()
+    pipeline = AudioStreamPipeline(processor, on_result)
+    pipeline.start()
+
+    await pipeline.submit(b"never", {})
+    await asyncio.sleep(0.05)
+    assert pipeline.in_flight == 1
+    await asyncio.wait_for(pipeline.abort(), timeout=5)
+
+    assert delivered == []
+    assert processor.in_flight == 0
@@ -0,0 +1,142 @@
+"""
+Tests for non-blocking transcription against a local stub Whisper server.
+"""
+import sys
+import time
+import asyncio
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from groq import Groq
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.transcription import GroqClientPool, TranscriptionService
+from core.wav import WavPayload
+
+STUB_LATENCY = 0.4
+
+
+class StubWhisperHandler(BaseHTTPRequestHandler):
+    """Answers /openai/v1/audio/transcriptions after a fixed delay."""
+
+    last_body = b""
+
+    def do_POST(self):
+        StubWhisperHandler.last_body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(STUB_LATENCY)
+        body = b"stub transcription"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubWhisperHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def service(stub_server):
+    pool = GroqClientPool(size=2, client_factory=lambda: Groq(api_key="test_key", base_url=stub_server))
+    service = TranscriptionService(client_pool=pool, max_concurrency=2)
+    yield service
+    service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_returns_text(service):
+    text = await service.transcribe(b"RIFF-not-really-a-wav")
+    assert text == "stub transcription"
+    assert service.stats()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_wav_payload_uploaded_from_memory(service):
+    """The WAV header and PCM reach the server intact without a temp file."""
+    pcm = bytes(range(256)) * 64
+    payload = WavPayload(pcm, 16000, 1)
+
+    await service.transcribe(payload)
+
+    body = StubWhisperHandler.last_body
+    assert payload.header + pcm in body
+    assert b'filename="audio.wav"' in body
+
+
+@pytest.mark.asyncio
+async def test_requests_served_while_transcriptions_in_flight(service):
+    """HTTP requests on the same loop are answered while Whisper calls are pending."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"pong": True}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        transcriptions = asyncio.gather(*(service.transcribe(b"audio") for _ in range(4)))
+
+        # A ticker task measures the longest time the loop goes without running it
+        gaps = []
+
+        async def ticker():
+            last = time.perf_counter()
+            while not transcriptions.done():
+                await asyncio.sleep(0.01)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        ticking = asyncio.ensure_future(ticker())
+
+        latencies = []
+        deadline = time.perf_counter() + 10
+        while not transcriptions.done():
+            assert time.perf_counter() < deadline, "transcriptions never completed"
+            start = time.perf_counter()
+            response = await client.get("/ping")
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200
+            await asyncio.sleep(0.01)
+
+        results = await asyncio.wait_for(transcriptions, timeout=5)
+        await asyncio.wait_for(ticking, timeout=5)
+
+    assert results == ["stub transcription"] * 4
+    assert len(latencies) > 5
+    assert max(latencies) < STUB_LATENCY / 2
+    assert max(gaps) < STUB_LATENCY / 2
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_and_queue_depth(service):
+    """Only max_concurrency uploads run at once; the rest are queued."""
+    await service.transcribe(b"audio")
+    assert service.stats()["max_queue_depth"] == 0
+
+    tasks = [asyncio.ensure_future(service.transcribe(b"audio")) for _ in range(5)]
+    await asyncio.sleep(0.1)
+
+    stats = service.stats()
+    assert stats["in_flight"] == 2
+    assert stats["queue_depth"] == 3
+
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=10)
+    stats = service.stats()
+    assert stats["max_queue_depth"] == 3
+    assert stats["completed"] == 6
+    assert stats["queue_depth"] == 0 and stats["in_flight"] == 0
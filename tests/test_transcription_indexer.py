@@ -0,0 +1,84 @@
+"""
+Tests for background micro-batched transcription indexing.
+"""
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.transcription_indexer import TranscriptionIndexer
+
+
+class RecordingRAGPipeline:
+    """Records each add_transcriptions batch; can be held to simulate slow indexing."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.fail = fail
+
+    async def add_transcriptions(self, items):
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("chroma unavailable")
+        self.batches.append([item["text"] for item in items])
+        return [f"id-{item['text']}" for item in items]
+
+
+@pytest.mark.asyncio
+async def test_submissions_are_micro_batched():
+    rag = RecordingRAGPipeline()
+    indexer = TranscriptionIndexer(lambda: rag, max_batch_size=4, linger_ms=50)
+
+    futures = [await indexer.submit(f"segment {i}") for i in range(6)]
+    ids = await asyncio.gather(*futures)
+
+    assert ids == [f"id-segment {i}" for i in range(6)]
+    assert [len(batch) for batch in rag.batches] == [4, 2]
+    stats = indexer.stats()
+    assert stats["indexed"] == 6 and stats["batches"] == 2
+    await indexer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_before_indexing_completes():
+    rag = RecordingRAGPipeline()
+    rag.release.clear()
+    indexer = TranscriptionIndexer(lambda: rag, linger_ms=0)
+
+    future = await asyncio.wait_for(indexer.submit("caption"), timeout=1)
+    await asyncio.sleep(0.05)
+    assert not future.done()
+    assert indexer.stats()["indexed"] == 0
+
+    rag.release.set()
+    assert await asyncio.wait_for(future, timeout=1) == "id-caption"
+    await indexer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_rejects_every_future():
+    indexer = TranscriptionIndexer(lambda: RecordingRAGPipeline(fail=True), linger_ms=20)
+
+    futures = [await indexer.submit(f"segment {i}") for i in range(3)]
+    results = await asyncio.gather(*futures, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert indexer.stats()["failed"] == 3
+    await indexer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_indexes_queued_transcriptions():
+    rag = RecordingRAGPipeline()
+    indexer = TranscriptionIndexer(lambda: rag, max_batch_size=2, linger_ms=0)
+
+    for i in range(5):
+        await indexer.submit(f"segment {i}")
+    await indexer.shutdown()
+
+    assert sum(len(batch) for batch in rag.batches) == 5
@@ -0,0 +1,125 @@
+"""
+Tests for streamed document uploads.
+"""
+import sys
+import asyncio
+import hashlib
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api import routes
+from core import rag_pipeline as rag_module
+from core.config import config
+from core.rag_pipeline import RAGPipeline
+
+
+class FakeEmbeddings:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [byte / 255.0 for byte in digest[:8]]
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+@pytest_asyncio.fixture
+async def pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    monkeypatch.setattr(rag_module, "HuggingFaceEmbeddings", FakeEmbeddings)
+    pipeline = RAGPipeline()
+    monkeypatch.setattr(routes, "_rag_pipeline", pipeline)
+    monkeypatch.setattr(routes, "_ingest_jobs", None)
+    yield pipeline
+    await routes.shutdown_ingest_jobs()
+
+
+def make_client(app=None):
+    if app is None:
+        app = FastAPI()
+        app.include_router(routes.router)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def wait_for_job(client, job_id):
+    for _ in range(500):
+        job = (await client.get(f"/jobs/{job_id}")).json()
+        if job["status"] in ("completed", "failed"):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job never finished")
+
+
+@pytest.mark.asyncio
+async def test_upload_is_streamed_in_chunks_and_hashed(pipeline, monkeypatch):
+    monkeypatch.setattr(config, "UPLOAD_CHUNK_SIZE", 1024)
+    content = ("Streaming upload paragraph. " * 40 + "\n\n").encode() * 20
+
+    async with make_client() as client:
+        response = await client.post("/documents", files={"file": ("doc.txt", content, "text/plain")})
+        job = await wait_for_job(client, response.json()["job_id"])
+
+    assert response.status_code == 202
+    assert response.json()["size"] == len(content) and response.json()["duplicate"] is False
+    assert job["status"] == "completed"
+    assert pipeline.catalog.get(job["document_id"])["content_hash"] == hashlib.md5(content).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_upload_skips_extraction(pipeline, monkeypatch):
+    content = b"A document that is uploaded twice."
+    async with make_client() as client:
+        first = await client.post("/documents", files={"file": ("a.txt", content, "text/plain")})
+        first = await wait_for_job(client, first.json()["job_id"])
+
+        async def no_ingest(*args, **kwargs):
+            raise AssertionError("duplicate upload must not be extracted")
+
+        monkeypatch.setattr(pipeline, "add_document", no_ingest)
+        second = await client.post("/documents", files={"file": ("b.txt", content, "text/plain")})
+
+    assert second.status_code == 202
+    assert second.json()["duplicate"] is True and second.json()["status"] == "completed"
+    assert second.json()["document_id"] == first["document_id"]
+
+
+@pytest.mark.asyncio
+async def test_oversized_upload_is_rejected(pipeline, monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "MAX_UPLOAD_BYTES", 4096)
+    monkeypatch.setattr(config, "UPLOAD_CHUNK_SIZE", 1024)
+
+    async with make_client() as client:
+        response = await client.post("/documents", files={"file": ("big.txt", b"x" * 10_000, "text/plain")})
+
+    assert response.status_code == 413
+    assert pipeline.collection.count() == 0
+    assert list((tmp_path / "data" / "uploads").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_declared_oversized_upload_is_rejected_before_parsing(pipeline, monkeypatch, tmp_path):
+    (tmp_path / "static").mkdir()
+    from main import app
+
+    monkeypatch.setattr(config, "MAX_UPLOAD_BYTES", 4096)
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("oversized upload must not reach the route")
+
+    monkeypatch.setattr(routes, "_save_upload", fail)
+    async with make_client(app) as client:
+        response = await client.post("/documents", files={"file": ("big.txt", b"x" * 10_000, "text/plain")})
+
+    assert response.status_code == 413
@@ -0,0 +1,108 @@
+"""
+Tests for voice-activity-gated audio segmentation.
+"""
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("webrtcvad")
+
+from core.audio_processor import AudioProcessor
+from core.transcription import GroqClientPool, TranscriptionService
+from core.vad_segmenter import VADSegmenter
+
+SAMPLE_RATE = 16000
+
+
+def speech_like(seconds, seed=0):
+    """Voiced harmonic signal with a syllable-rate envelope."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    f0 = 140 + 20 * np.sin(2 * np.pi * 3 * t)
+    signal = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 15))
+    envelope = (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)) ** 2
+    noise = np.random.default_rng(seed).normal(0, 300, len(t))
+    return (signal * envelope * 3000 + noise).astype(np.int16).tobytes()
+
+
+def silence(seconds, seed=1):
+    samples = np.random.default_rng(seed).normal(0, 30, int(seconds * SAMPLE_RATE))
+    return samples.astype(np.int16).tobytes()
+
+
+def feed_in_frames(segmenter, pcm, frame_bytes=8192):
+    segments = []
+    for offset in range(0, len(pcm), frame_bytes):
+        segments.extend(segmenter.feed(pcm[offset:offset + frame_bytes]))
+    return segments
+
+
+def test_silence_produces_no_segments():
+    segmenter = VADSegmenter(sample_rate=SAMPLE_RATE)
+    assert feed_in_frames(segmenter, silence(10)) == []
+    assert segmenter.flush() is None
+
+
+def test_speech_segments_end_at_pauses():
+    segmenter = VADSegmenter(sample_rate=SAMPLE_RATE, silence_ms=300)
+    pcm = silence(2) + speech_like(1.5) + silence(1) + speech_like(2, seed=3) + silence(1)
+
+    segments = feed_in_frames(segmenter, pcm)
+
+    assert len(segments) == 2
+    for segment, speech_seconds in zip(segments, (1.5, 2)):
+        seconds = len(segment) / 2 / SAMPLE_RATE
+        assert speech_seconds <= seconds < speech_seconds + 1.0
+
+
+def test_long_speech_is_capped_at_max_length():
+    segmenter = VADSegmenter(sample_rate=SAMPLE_RATE, max_segment_bytes=64000)
+    segments = feed_in_frames(segmenter, speech_like(7))
+    assert len(segments) >= 3
+    assert all(len(segment) <= 64000 for segment in segments)
+
+
+def test_short_blips_are_dropped():
+    segmenter = VADSegmenter(sample_rate=SAMPLE_RATE, min_speech_ms=400)
+    pcm = silence(1) + speech_like(0.1) + silence(2)
+    assert feed_in_frames(segmenter, pcm) == []
+
+
+class CountingTranscriptions:
+    def __init__(self):
+        self.calls = []
+
+    def create(self, file, **kwargs):
+        _, audio_file, _ = file
+        with wave.open(audio_file, "rb") as wav_file:
+            self.calls.append(wav_file.getnframes() / wav_file.getframerate())
+        return "some words"
+
+
+class StubGroqClient:
+    def __init__(self):
+        self.audio = type("Audio", (), {"transcriptions": CountingTranscriptions()})()
+
+
+@pytest.mark.asyncio
+async def test_processor_only_transcribes_speech():
+    pool = GroqClientPool(size=1, client_factory=StubGroqClient)
+    service = TranscriptionService(client_pool=pool, max_concurrency=1)
+    processor = AudioProcessor(transcriber=service, use_vad=True)
+    format_info = {"sample_rate": SAMPLE_RATE, "channels": 1}
+
+    pcm = silence(20) + speech_like(2) + silence(20)
+    texts = []
+    for offset in range(0, len(pcm), 8192):
+        text = await processor.process_audio_chunk(pcm[offset:offset + 8192], format_info)
+        if text:
+            texts.append(text)
+    service.shutdown()
+
+    calls = pool.clients[0].audio.transcriptions.calls
+    assert texts == ["some words"]
+    assert len(calls) == 1 and calls[0] < 4
@@ -0,0 +1,62 @@
+"""
+Tests for in-memory WAV payloads.
+"""
+import io
+import sys
+import wave
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.wav import WavPayload, wav_header
+
+
+def reference_wav(pcm, sample_rate, channels):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def test_header_matches_wave_module():
+    pcm = array("h", range(-500, 500)).tobytes()
+    for sample_rate, channels in ((16000, 1), (48000, 2)):
+        expected = reference_wav(pcm, sample_rate, channels)
+        assert wav_header(len(pcm), sample_rate, channels) == expected[:44]
+
+
+def test_payload_reads_like_a_wav_file():
+    pcm = array("h", range(-2000, 2000)).tobytes()
+    payload = WavPayload(pcm, 16000, 1)
+
+    assert payload.read() == reference_wav(pcm, 16000, 1)
+    assert len(payload) == 44 + len(pcm)
+
+    payload.seek(0)
+    with wave.open(payload, "rb") as wav_file:
+        assert wav_file.getframerate() == 16000
+        assert wav_file.readframes(wav_file.getnframes()) == pcm
+
+
+def test_payload_small_reads_and_seek():
+    pcm = bytes(range(256)) * 4
+    payload = WavPayload(pcm, 8000, 1)
+    expected = reference_wav(pcm, 8000, 1)
+
+    pieces = []
+    while True:
+        piece = payload.read(7)
+        if not piece:
+            break
+        pieces.append(piece)
+    assert b"".join(pieces) == expected
+
+    payload.seek(-10, io.SEEK_END)
+    assert payload.read() == expected[-10:]
+    payload.seek(40)
+    assert payload.tell() == 40
+    assert payload.read(8) == expected[40:48]
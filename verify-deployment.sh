@@ -17,6 +17,7 @@ required_files=(
     "src/core/audio_processor.py"
     "static/index.html"
     "requirements.txt"
+    "requirements-serving.txt"
     "Dockerfile"
     "docker-compose.yml"
     ".env.production"
@@ -38,7 +39,7 @@ echo "🐳 Checking Docker configuration..."
 
 # Check if Dockerfile exists and has proper structure
 if [ -f "Dockerfile" ]; then
-    if grep -q "FROM python:" Dockerfile && grep -q "COPY requirements.txt" Dockerfile && grep -q "CMD.*python.*main.py" Dockerfile; then
+    if grep -q "FROM python:" Dockerfile && grep -q "COPY requirements-serving.txt" Dockerfile && grep -q "CMD.*python.*main.py" Dockerfile; then
         echo "✅ Dockerfile structure valid"
     else
         echo "❌ Dockerfile structure invalid"